@@ -1,90 +1,214 @@
-from flask import Flask, render_template, request, session, redirect, url_for, flash, jsonify
-from jeevika import get_jeevika_response
-from models import db, bcrypt, User, ChatSession, Message, HealthData
+from startup import STARTUP
+from flask import Blueprint, Flask, Response, current_app, make_response, render_template, request, session, redirect, url_for, flash, jsonify, stream_with_context
+from jeevika import get_rule_response, hf_reply_stream, detect_simple_emotion, emotion_emoji, hf_status, RULES
+from chat_service import (
+    run_chat_turn, save_chat_turn, save_user_message, save_bot_reply,
+    memory_from_health, queue_chat_turn, run_fallback_job, fallback_job_dead, FALLBACK_JOB
+)
+from conversation import build_context
+from job_queue import JobQueue
+from models import db, bcrypt, User, ChatSession, Message, HealthData, PaymentOrder
+from payments import create_or_reuse_order, activate_subscription, handle_webhook_event, OrderInProgress, OrderAlreadyPaid, WEBHOOK_JOB
+from db_config import engine_options, install_sqlite_pragmas, is_sqlite, describe
+from commands import register_commands, init_db
+from query_counter import install_query_counter
+from metrics import install_metrics, metrics_authorized
+from compression import install_compression
+from password_pool import HASHING_POOL, HashingBusy
+from user_context import load_user_context, ensure_user_rows
+from timeseries import daily_sentiment, daily_symptoms
+from export import EXPORT_TABLES, stream_export
+from subscriptions import ExpirySweeper
+from page_cache import StaticPages, make_etag, is_fresh, not_modified, stamp
 import os
-import razorpay
-from datetime import datetime, timedelta
+import json
+import hmac
+from datetime import datetime
 
-app = Flask(__name__)
+STARTUP.lap("imports")
+
+views = Blueprint("views", __name__)
 
 # =====================================================
 # 🔐 CONFIG
+# Read from the environment here; create_app(config) overrides any key
 # =====================================================
 
-app.secret_key = os.environ.get("FLASK_SECRET_KEY", "dev_secret_change_this")
-
-database_url = os.environ.get("DATABASE_URL")
-
-if database_url:
+def _flag(name, default=""):
+    return os.environ.get(name, default).lower() in ("1", "true", "yes", "on")
+
+def default_config():
+
+    return {
+        "SECRET_KEY": os.environ.get("FLASK_SECRET_KEY", "dev_secret_change_this"),
+        "LOG_LEVEL": os.environ.get("LOG_LEVEL", "INFO"),
+        "SQLALCHEMY_DATABASE_URI": os.environ.get("DATABASE_URL") or "sqlite:///jeevika.db",
+        "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+        # bcrypt work factor; existing hashes are upgraded on next successful login
+        "BCRYPT_LOG_ROUNDS": int(os.environ.get("BCRYPT_LOG_ROUNDS", 12)),
+        "METRICS_ENABLED": _flag("METRICS_ENABLED", "1"),
+        "RAZORPAY_KEY_ID": os.environ.get("RAZORPAY_KEY_ID"),
+        "RAZORPAY_KEY_SECRET": os.environ.get("RAZORPAY_KEY_SECRET"),
+        "RAZORPAY_WEBHOOK_SECRET": os.environ.get("RAZORPAY_WEBHOOK_SECRET"),
+        # e.g. http://127.0.0.1:9010 for benchmarks/fake_razorpay.py
+        "RAZORPAY_BASE_URL": os.environ.get("RAZORPAY_BASE_URL", "https://api.razorpay.com"),
+        "CHAT_JOB_QUEUE": _flag("CHAT_JOB_QUEUE"),
+        "JOB_QUEUE_PATH": os.environ.get("JOB_QUEUE_PATH", "jobs.db"),
+        "JOB_WORKERS": int(os.environ.get("JOB_WORKERS", 2)),
+        "JOB_MAX_ATTEMPTS": int(os.environ.get("JOB_MAX_ATTEMPTS", 3)),
+        # 0 = off, use the CLI
+        "SUBSCRIPTION_SWEEP_INTERVAL": float(os.environ.get("SUBSCRIPTION_SWEEP_INTERVAL", 3600)),
+        "SUBSCRIPTION_SWEEP_BATCH": int(os.environ.get("SUBSCRIPTION_SWEEP_BATCH", 500)),
+        "CHAT_PAGE_SIZE": int(os.environ.get("CHAT_PAGE_SIZE", 50)),
+        # Bearer token for all-users / any-user exports; unset = admin mode off
+        "EXPORT_ADMIN_TOKEN": os.environ.get("EXPORT_ADMIN_TOKEN")
+    }
+
+def configure(app, config=None):
+
+    app.config.update(default_config())
+    app.config.update(config or {})
+
+    database_url = app.config["SQLALCHEMY_DATABASE_URI"]
     if database_url.startswith("postgres://"):
         database_url = database_url.replace("postgres://", "postgresql://", 1)
-    app.config["SQLALCHEMY_DATABASE_URI"] = database_url
-else:
-    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///jeevika.db"
+        app.config["SQLALCHEMY_DATABASE_URI"] = database_url
+
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options(database_url))
+    app.logger.setLevel(app.config["LOG_LEVEL"])
+
+    db.init_app(app)
+    bcrypt.init_app(app)
+    register_commands(app)
+    install_query_counter(app)
+    install_compression(app)
 
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    if app.config["METRICS_ENABLED"]:
+        install_metrics(app)
 
-db.init_app(app)
-bcrypt.init_app(app)
+    # No schema work here: run `flask --app app init-db` on deploy
+    with app.app_context():
+        if is_sqlite(database_url):
+            install_sqlite_pragmas(db.engine)
 
-with app.app_context():
-    db.create_all()
+    app.logger.info(describe(database_url, app.config["SQLALCHEMY_ENGINE_OPTIONS"]))
 
 # =====================================================
 # 💳 RAZORPAY CONFIG
 # =====================================================
 
-RAZORPAY_KEY_ID = os.environ.get("RAZORPAY_KEY_ID")
-RAZORPAY_KEY_SECRET = os.environ.get("RAZORPAY_KEY_SECRET")
+def payment_client():
 
-# Initialize Razorpay safely
-razorpay_client = None
-if RAZORPAY_KEY_ID and RAZORPAY_KEY_SECRET:
-    razorpay_client = razorpay.Client(
-        auth=(RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET)
-    )
+    # Built on first use per app; None when the keys aren't configured
+    config = current_app.config
+    client = current_app.extensions.get("razorpay")
+
+    if client is None and config["RAZORPAY_KEY_ID"] and config["RAZORPAY_KEY_SECRET"]:
+        import razorpay
+
+        client = current_app.extensions["razorpay"] = razorpay.Client(
+            auth=(config["RAZORPAY_KEY_ID"], config["RAZORPAY_KEY_SECRET"]),
+            base_url=config["RAZORPAY_BASE_URL"]
+        )
+
+    return client
 
 PRO_PRICE = 49900  # ₹499.00 in paise
 
 # =====================================================
-# 🎭 EMOJI MAP
+# ⏳ BACKGROUND JOBS (HF FALLBACK OFF THE REQUEST)
+# =====================================================
+
+def install_job_queue(app):
+
+    if not app.config["CHAT_JOB_QUEUE"]:
+        return
+
+    queue = app.extensions["job_queue"] = JobQueue(
+        app.config["JOB_QUEUE_PATH"],
+        workers=app.config["JOB_WORKERS"],
+        max_attempts=app.config["JOB_MAX_ATTEMPTS"]
+    )
+    queue.register(FALLBACK_JOB, run_fallback_job, on_dead=fallback_job_dead)
+    queue.register(WEBHOOK_JOB, handle_webhook_event)
+
+    @app.before_request
+    def start_job_workers():
+        queue.ensure_started(app)
+
+def job_queue():
+    # None when CHAT_JOB_QUEUE is off
+    return current_app.extensions.get("job_queue")
+
+# =====================================================
+# 🧹 SUBSCRIPTION EXPIRY SWEEP (0 = off, use the CLI)
 # =====================================================
 
-EMOJI_MAP = {
-    "sad": "😔",
-    "lonely": "🥺",
-    "alone": "🥺",
-    "heartbroken": "💔",
-    "anxious": "😟",
-    "stress": "😣",
-    "stressed": "😣",
-    "happy": "😊",
-    "calm": "😌",
-    "neutral": "🤍"
-}
+def install_expiry_sweeper(app):
 
-def detect_simple_emotion(text):
-    text = text.lower()
-    for key in EMOJI_MAP:
-        if key in text:
-            return key
-    return "neutral"
+    if app.config["SUBSCRIPTION_SWEEP_INTERVAL"] <= 0:
+        return
+
+    sweeper = app.extensions["expiry_sweeper"] = ExpirySweeper(
+        interval=app.config["SUBSCRIPTION_SWEEP_INTERVAL"],
+        batch_size=app.config["SUBSCRIPTION_SWEEP_BATCH"]
+    )
+
+    @app.before_request
+    def start_expiry_sweeper():
+        sweeper.ensure_started(app)
+
+# =====================================================
+# 📜 CHAT HISTORY PAGING
+# =====================================================
+
+CHAT_PAGE_MAX = 200
+
+def load_messages(session_id, before=None, limit=None):
+
+    limit = limit or current_app.config["CHAT_PAGE_SIZE"]
+
+    # Column-only keyset query: newest `limit` rows older than `before`
+    query = db.session.query(
+        Message.id, Message.role, Message.text, Message.emotion
+    ).filter(Message.session_id == session_id)
+
+    if before:
+        query = query.filter(Message.id < before)
+
+    rows = query.order_by(Message.id.desc()).limit(limit).all()
+    rows.reverse()
+
+    return [{
+        "id": m.id,
+        "role": m.role,
+        "text": m.text,
+        "emotion": emotion_emoji(m.emotion or detect_simple_emotion(m.text))
+    } for m in rows]
 
 # =====================================================
 # 🏠 LANDING
 # =====================================================
 
-@app.route("/")
+STATIC_PAGES = ["landing.html", "login.html", "register.html"]
+
+def static_page(name):
+    # Pending flash messages make the page session specific
+    if "_flashes" in session:
+        return render_template(name)
+    return current_app.extensions["static_pages"].serve(name)
+
+@views.route("/")
 def landing():
     if "user_id" in session:
-        return redirect(url_for("dashboard"))
-    return render_template("landing.html")
+        return redirect(url_for(".dashboard"))
+    return static_page("landing.html")
 
 # =====================================================
 # 🔐 REGISTER
 # =====================================================
 
-@app.route("/register", methods=["GET", "POST"])
+@views.route("/register", methods=["GET", "POST"])
 def register():
 
     if request.method == "POST":
@@ -101,21 +225,30 @@ def register():
             return render_template("register.html")
 
         new_user = User(name=name, email=email)
-        new_user.set_password(password)
+
+        try:
+            HASHING_POOL.run(new_user.set_password, password)
+        except HashingBusy:
+            flash("We're busy right now. Please try again in a moment.", "danger")
+            return render_template("register.html"), 503
+
+        # Chat session and health record are created once, here
+        new_user.sessions.append(ChatSession())
+        new_user.health = HealthData()
 
         db.session.add(new_user)
         db.session.commit()
 
         flash("Account created successfully. Please login.", "success")
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
 
-    return render_template("register.html")
+    return static_page("register.html")
 
 # =====================================================
 # 🔐 LOGIN
 # =====================================================
 
-@app.route("/login", methods=["GET", "POST"])
+@views.route("/login", methods=["GET", "POST"])
 def login():
 
     if request.method == "POST":
@@ -128,77 +261,102 @@ def login():
             flash("No account found with this email.", "danger")
             return render_template("login.html")
 
-        if not user.check_password(password):
+        try:
+            valid = HASHING_POOL.run(user.check_password, password)
+        except HashingBusy:
+            flash("We're busy right now. Please try again in a moment.", "danger")
+            return render_template("login.html"), 503
+
+        if not valid:
             flash("Incorrect password.", "danger")
             return render_template("login.html")
 
+        if user.password_needs_rehash():
+            try:
+                HASHING_POOL.run(user.set_password, password)
+                db.session.commit()
+            except HashingBusy:
+                pass
+
+        ensure_user_rows(user)
+
         session.clear()
         session["user_id"] = user.id
 
-        return redirect(url_for("dashboard"))
+        return redirect(url_for(".dashboard"))
 
-    return render_template("login.html")
+    return static_page("login.html")
 
 # =====================================================
 # 💳 CREATE RAZORPAY ORDER
 # =====================================================
 
-@app.route("/create-order", methods=["POST"])
+@views.route("/create-order", methods=["POST"])
 def create_order():
 
     if "user_id" not in session:
         return jsonify({"error": "Unauthorized"}), 401
 
-    if not razorpay_client:
+    client = payment_client()
+    if not client:
         return jsonify({"error": "Payment system not configured"}), 500
 
+    user = db.session.get(User, session["user_id"])
+
     try:
-        order = razorpay_client.order.create({
-            "amount": PRO_PRICE,
-            "currency": "INR",
-            "payment_capture": 1
-        })
+        # Repeat clicks get the same pending order; only a miss calls Razorpay
+        order = create_or_reuse_order(client, user, PRO_PRICE)
 
         return jsonify({
-            "order_id": order["id"],
-            "razorpay_key": RAZORPAY_KEY_ID,
-            "amount": PRO_PRICE
+            "order_id": order.razorpay_order_id,
+            "razorpay_key": current_app.config["RAZORPAY_KEY_ID"],
+            "amount": order.amount
         })
 
+    except OrderInProgress:
+        return jsonify({"error": "Your order is being created, please try again"}), 409
+
+    except OrderAlreadyPaid:
+        return jsonify({"error": "This order has already been paid"}), 409
+
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return jsonify({"error": str(e)}), 502
 
 # =====================================================
 # ✅ VERIFY PAYMENT
 # =====================================================
 
-@app.route("/verify-payment", methods=["POST"])
+@views.route("/verify-payment", methods=["POST"])
 def verify_payment():
 
     if "user_id" not in session:
         return jsonify({"error": "Unauthorized"}), 401
 
-    if not razorpay_client:
+    client = payment_client()
+    if not client:
         return jsonify({"error": "Payment system not configured"}), 500
 
     data = request.json
 
     try:
-        razorpay_client.utility.verify_payment_signature({
+        client.utility.verify_payment_signature({
             "razorpay_order_id": data["razorpay_order_id"],
             "razorpay_payment_id": data["razorpay_payment_id"],
             "razorpay_signature": data["razorpay_signature"]
         })
 
         user = db.session.get(User, session["user_id"])
+        order = PaymentOrder.query.filter_by(
+            razorpay_order_id=data["razorpay_order_id"],
+            user_id=user.id
+        ).first()
 
-        user.plan = "PRO"
-        user.subscription_status = "ACTIVE"
-        user.subscription_start = datetime.utcnow()
-        user.subscription_end = datetime.utcnow() + timedelta(days=30)
-        user.razorpay_payment_id = data["razorpay_payment_id"]
+        # A valid signature for someone else's (or no) order activates nothing
+        if order is None:
+            return jsonify({"success": False, "error": "Unknown order"}), 400
 
-        db.session.commit()
+        # The webhook may already have activated it
+        activate_subscription(user, data["razorpay_payment_id"], order)
 
         return jsonify({"success": True})
 
@@ -206,97 +364,316 @@ def verify_payment():
         return jsonify({"success": False, "error": str(e)}), 400
 
 # =====================================================
-# 💬 DASHBOARD
+# 🪝 RAZORPAY WEBHOOK
 # =====================================================
 
-@app.route("/dashboard", methods=["GET", "POST"])
-def dashboard():
+@views.route("/razorpay/webhook", methods=["POST"])
+def razorpay_webhook():
 
-    if "user_id" not in session:
-        return redirect(url_for("login"))
+    client = payment_client()
+    secret = current_app.config["RAZORPAY_WEBHOOK_SECRET"]
+    if not client or not secret:
+        return jsonify({"error": "Webhook not configured"}), 500
 
-    user = db.session.get(User, session["user_id"])
+    body = request.get_data(as_text=True)
 
-    chat_session = ChatSession.query.filter_by(user_id=user.id).first()
+    try:
+        client.utility.verify_webhook_signature(
+            body, request.headers.get("X-Razorpay-Signature", ""), secret
+        )
+    except Exception:
+        return jsonify({"error": "Invalid signature"}), 400
 
-    if not chat_session:
-        chat_session = ChatSession(user_id=user.id)
-        db.session.add(chat_session)
-        db.session.commit()
+    event = json.loads(body)
 
-    health = HealthData.query.filter_by(user_id=user.id).first()
+    # Acknowledge fast; Razorpay retries anything slow or non-2xx
+    queue = job_queue()
+    if queue is not None:
+        queue.enqueue(WEBHOOK_JOB, event)
+    else:
+        handle_webhook_event(event)
 
-    if not health:
-        health = HealthData(user_id=user.id)
-        db.session.add(health)
-        db.session.commit()
+    return jsonify({"ok": True})
 
-    if request.method == "POST":
+# =====================================================
+# 💬 DASHBOARD
+# =====================================================
 
-        user_input = request.form.get("message").strip()
+def dashboard_etag(user, chat_session, health):
 
-        db.session.add(Message(
-            session_id=chat_session.id,
-            role="user",
-            text=user_input
-        ))
-        db.session.commit()
+    # Everything the page shows changes one of these: a new message id,
+    # a HealthData write, the plan, the rule pack (emoji), the Razorpay
+    # key or the day (mood / symptom windows). No Last-Modified: half of
+    # these have no timestamp, so If-Modified-Since would serve stale pages.
+    last_id = db.session.query(Message.id).filter(
+        Message.session_id == chat_session.id
+    ).order_by(Message.id.desc()).limit(1).scalar() or 0
 
-        memory = {
-            "symptoms": health.symptoms or [],
-            "pcos_score": health.pcos_score,
-            "clinical_risk_level": health.clinical_risk
-        }
+    return make_etag(
+        user.id, last_id, health.updated_at, user.plan, user.subscription_status,
+        RULES.current().version, current_app.config["RAZORPAY_KEY_ID"], datetime.utcnow().date()
+    )
 
-        reply, updated_memory = get_jeevika_response(user_input, memory)
+@views.route("/dashboard", methods=["GET", "POST"])
+def dashboard():
 
-        health.pcos_score = updated_memory.get("pcos_score", 0)
-        health.clinical_risk = updated_memory.get("clinical_risk_level", "LOW")
-        db.session.commit()
+    if "user_id" not in session:
+        return redirect(url_for(".login"))
 
-        db.session.add(Message(
-            session_id=chat_session.id,
-            role="bot",
-            text=reply
-        ))
-        db.session.commit()
+    context = load_user_context(session["user_id"])
+    if context is None:
+        session.clear()
+        return redirect(url_for(".login"))
+
+    user, chat_session, health = context
 
-        return redirect(url_for("dashboard"))
+    if request.method == "POST":
 
-    db_messages = Message.query.filter_by(
-        session_id=chat_session.id
-    ).order_by(Message.id.asc()).all()
+        user_input = request.form.get("message").strip()
 
-    messages = [{
-        "role": m.role,
-        "text": m.text,
-        "emotion": EMOJI_MAP.get(detect_simple_emotion(m.text), "🤍")
-    } for m in db_messages]
+        run_chat_turn(user, chat_session, health, user_input, job_queue())
 
-    return render_template(
+        return redirect(url_for(".dashboard"))
+
+    etag = dashboard_etag(user, chat_session, health)
+    if is_fresh(etag):
+        return not_modified(etag)
+
+    messages = load_messages(chat_session.id)
+
+    response = make_response(render_template(
         "dashboard.html",
         messages=messages,
+        has_more=len(messages) == current_app.config["CHAT_PAGE_SIZE"],
         memory=health,
+        mood_days=daily_sentiment(user.id),
+        symptom_days=daily_symptoms(user.id),
         is_pro=user.is_pro(),
-        razorpay_key=RAZORPAY_KEY_ID
+        razorpay_key=current_app.config["RAZORPAY_KEY_ID"]
+    ))
+
+    return stamp(response, etag)
+
+# =====================================================
+# ⚡ LIVE CHAT (JSON + SSE)
+# =====================================================
+
+def sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@views.route("/api/chat", methods=["POST"])
+def api_chat():
+
+    if "user_id" not in session:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    payload = request.get_json(silent=True) or request.form
+    user_input = (payload.get("message") or "").strip()
+
+    if not user_input:
+        return jsonify({"error": "Message is required"}), 400
+
+    context = load_user_context(session["user_id"])
+    if context is None:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    user, chat_session, health = context
+
+    reply, memory = get_rule_response(user_input, memory_from_health(health))
+
+    # Rule engines answer instantly in a single JSON response
+    if reply is not None:
+        save_chat_turn(chat_session, health, user_input, reply, memory)
+        return jsonify({
+            "reply": reply,
+            "emotion": emotion_emoji(detect_simple_emotion(reply))
+        })
+
+    # HF fallback goes to a worker when the job queue is on; client polls
+    queue = job_queue()
+    if queue is not None:
+        job_id = queue_chat_turn(queue, user, chat_session, health, user_input, memory)
+        return jsonify({
+            "job_id": job_id,
+            "status_url": url_for(".api_job", job_id=job_id)
+        }), 202
+
+    # Otherwise it streams token by token as Server-Sent Events. The user
+    # message lands first so a client that disconnects mid-stream only
+    # loses the reply, never what they sent.
+    context = build_context(chat_session)
+    save_user_message(chat_session, health, user_input, memory)
+    session_id = chat_session.id
+
+    def generate():
+        parts = []
+        for token in hf_reply_stream(user_input, context=context):
+            parts.append(token)
+            yield sse("token", {"text": token})
+
+        reply = "".join(parts).strip()
+        save_bot_reply(session_id, reply)
+
+        yield sse("done", {
+            "reply": reply,
+            "emotion": emotion_emoji(detect_simple_emotion(reply))
+        })
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@views.route("/api/jobs/<int:job_id>")
+def api_job(job_id):
+
+    if "user_id" not in session:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    queue = job_queue()
+    job = queue.get(job_id) if queue else None
+
+    if not job or job["payload"].get("user_id") != session["user_id"]:
+        return jsonify({"error": "Not found"}), 404
+
+    return jsonify({
+        "id": job["id"],
+        "status": job["status"],
+        "result": job["result"]
+    })
+
+@views.route("/api/jobs/metrics")
+def api_job_metrics():
+    if not metrics_authorized(request):
+        return jsonify({"error": "Forbidden"}), 403
+    queue = job_queue()
+    if not queue:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, **queue.metrics()})
+
+# =====================================================
+# 📜 OLDER MESSAGES (INFINITE SCROLL)
+# =====================================================
+
+@views.route("/api/messages")
+def api_messages():
+
+    if "user_id" not in session:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    context = load_user_context(session["user_id"])
+    if context is None:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    chat_session = context[1]
+
+    before = request.args.get("before", type=int)
+    limit = request.args.get("limit", current_app.config["CHAT_PAGE_SIZE"], type=int)
+    limit = max(1, min(limit, CHAT_PAGE_MAX))
+
+    messages = load_messages(chat_session.id, before, limit)
+
+    return jsonify({
+        "messages": messages,
+        "has_more": len(messages) == limit
+    })
+
+# =====================================================
+# 📦 DATA EXPORT (STREAMED)
+# =====================================================
+
+def is_export_admin():
+    token = current_app.config["EXPORT_ADMIN_TOKEN"]
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    return bool(token and supplied) and hmac.compare_digest(supplied, token)
+
+@views.route("/api/export")
+def api_export():
+
+    fmt = request.args.get("format", "ndjson")
+    tables = request.args.get("tables", ",".join(EXPORT_TABLES)).split(",")
+
+    if is_export_admin():
+        # No user_id = every user
+        user_id = request.args.get("user_id", type=int)
+    elif "user_id" in session:
+        user_id = session["user_id"]
+    else:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        body = stream_export(fmt, tables, user_id)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    scope = f"user-{user_id}" if user_id is not None else "all"
+    name = tables[0] if len(tables) == 1 else "export"
+    extension = "csv" if fmt == "csv" else "ndjson"
+
+    return Response(
+        stream_with_context(body),
+        mimetype="text/csv" if fmt == "csv" else "application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="jeevika-{scope}-{name}.{extension}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no"
+        }
     )
 
 # =====================================================
 # 🔓 LOGOUT
 # =====================================================
 
-@app.route("/logout")
+@views.route("/logout")
 def logout():
     session.clear()
-    return redirect(url_for("landing"))
+    return redirect(url_for(".landing"))
 
 # =====================================================
 # HEALTH CHECK
 # =====================================================
 
-@app.route("/health")
+@views.route("/health")
 def health_check():
-    return {"status": "ok"}
+    # Liveness stays public for load balancers; backend stats don't
+    if not metrics_authorized(request):
+        return {"status": "ok"}
+    return {"status": "ok", "hf": hf_status()}
+
+# =====================================================
+# 🚀 APP FACTORY
+# gunicorn --preload 'app:create_app()' builds and warms once in the
+# master; workers fork with templates rendered and the rule pack loaded
+# =====================================================
+
+def create_app(config=None):
+
+    app = Flask(__name__)
+
+    with STARTUP.phase("config"):
+        configure(app, config)
+
+    with STARTUP.phase("routes"):
+        app.register_blueprint(views)
+        install_job_queue(app)
+        install_expiry_sweeper(app)
+        pages = app.extensions["static_pages"] = StaticPages(app, STATIC_PAGES)
+
+    with STARTUP.phase("rules"):
+        RULES.current()
+
+    with STARTUP.phase("prerender"):
+        pages.prerender()
+
+    STARTUP.log(app.logger)
+    return app
 
 if __name__ == "__main__":
+    app = create_app()
+
+    # Dev server convenience; deployments run `flask --app app init-db`
+    with app.app_context():
+        init_db()
+
     app.run(host="0.0.0.0", port=5000)
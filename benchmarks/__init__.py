@@ -0,0 +1,18 @@
+# ============================================
+# JEEVIKA – Benchmarks
+#
+#   python -m benchmarks                  # engine + routes
+#   python -m benchmarks engine --out run.json
+#   python -m benchmarks routes --sizes 10 1000 100000
+#   python -m benchmarks payments         # offline, via fake_razorpay
+#   python -m benchmarks startup          # worker boot, per phase
+#   python -m benchmarks generation       # micro-batching, stub or local model
+# ============================================
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,51 @@
+# ============================================
+# JEEVIKA – Benchmark Runner
+# ============================================
+
+import argparse
+
+from benchmarks import bench_engine, bench_generation, bench_payments, bench_routes, bench_startup
+from benchmarks.common import environment, write_results
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("suites", nargs="*", help="engine, routes, payments, startup and/or generation (default: engine + routes)")
+    parser.add_argument("--messages", type=int, default=2000, help="engine corpus size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000], help="route history sizes")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--pay-users", type=int, default=20, help="concurrent users in the payments suite")
+    parser.add_argument("--rzp-latency", type=float, default=0.05, help="fake Razorpay latency (s)")
+    parser.add_argument("--boots", type=int, default=10, help="fresh interpreters in the startup suite")
+    parser.add_argument("--gen-backend", choices=["stub", "local"], default="stub", help="generation suite backend")
+    parser.add_argument("--gen-concurrency", type=int, default=16, help="concurrent callers in the generation suite")
+    parser.add_argument("--out", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    suites = args.suites or ["engine", "routes"]
+    unknown = set(suites) - {"engine", "routes", "payments", "startup", "generation"}
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+
+    results = {"environment": environment()}
+
+    if "engine" in suites:
+        results["engine"] = bench_engine.run(args.messages, args.repeat)
+
+    if "routes" in suites:
+        results["routes"] = bench_routes.run(tuple(args.sizes), args.repeat)
+
+    if "payments" in suites:
+        results["payments"] = bench_payments.run(args.pay_users, latency=args.rzp_latency, repeat=args.repeat)
+
+    if "startup" in suites:
+        results["startup"] = bench_startup.run(args.boots)
+
+    if "generation" in suites:
+        results["generation"] = bench_generation.run(args.gen_backend, args.gen_concurrency)
+
+    write_results(results, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# ============================================
+# JEEVIKA – bcrypt Login Throughput
+# Logins (verifies) per second per core at several cost factors
+#
+#   python benchmarks/bench_bcrypt.py [--costs 10 11 12] [--seconds 3]
+# ============================================
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bcrypt
+
+from password_pool import HashingPool
+
+
+def verifies_per_second(pool, hashed, seconds, clients):
+
+    done = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def client():
+        while time.perf_counter() < deadline:
+            pool.run(bcrypt.checkpw, b"correct horse", hashed)
+            with lock:
+                done[0] += 1
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    return done[0] / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--costs", type=int, nargs="+", default=[10, 11, 12])
+    parser.add_argument("--seconds", type=float, default=3)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    pool = HashingPool(workers=cores, max_queue=cores * 4, timeout=60)
+    results = {"cores": cores, "costs": {}}
+
+    for cost in args.costs:
+        hashed = bcrypt.hashpw(b"correct horse", bcrypt.gensalt(rounds=cost))
+
+        single = verifies_per_second(HashingPool(workers=1, max_queue=1, timeout=60), hashed, args.seconds, 1)
+        pooled = verifies_per_second(pool, hashed, args.seconds, cores * 2)
+
+        results["costs"][cost] = {
+            "single_thread_logins_per_s": round(single, 1),
+            "pooled_logins_per_s": round(pooled, 1),
+            "pooled_logins_per_s_per_core": round(pooled / cores, 1),
+            "ms_per_verify": round(1000 / single, 1)
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# ============================================
+# JEEVIKA – Engine Microbenchmarks
+# Each engine stage + full router over the synthetic corpus
+# ============================================
+
+import copy
+
+from benchmarks import ROOT  # noqa: F401  (puts the app on sys.path)
+from benchmarks.common import measure
+from benchmarks.corpus import build_corpus, branch_cases
+
+import jeevika
+
+
+def _loop(corpus, fn):
+    def run():
+        for text, memory in corpus:
+            fn(text, memory)
+    return run
+
+
+def _fresh(corpus):
+    return [(text, jeevika.initialize_memory(copy.deepcopy(memory))) for text, memory in corpus]
+
+
+def run(messages=2000, repeat=20):
+
+    corpus = build_corpus(messages)
+    prepared = _fresh(corpus)
+    per_msg = len(corpus)
+
+    stages = {
+        "scan": lambda t, m: jeevika.scan(t),
+        "sentiment": lambda t, m: jeevika.sentiment_polarity(t),
+        "crisis_detection": lambda t, m: jeevika.crisis_detection(t),
+        "red_flag_detection": lambda t, m: jeevika.red_flag_detection(t),
+        "pain_engine": lambda t, m: jeevika.pain_engine(m, t),
+        "update_pcos": lambda t, m: jeevika.update_pcos(dict(m, symptoms=list(m["symptoms"])), t),
+        "iron_engine": lambda t, m: jeevika.iron_engine(dict(m), t),
+        "hormone_probability": lambda t, m: jeevika.hormone_probability(m),
+        "clinical_risk": lambda t, m: jeevika.clinical_risk(m),
+        "therapist_deepening": lambda t, m: jeevika.therapist_deepening(dict(m), t),
+        "detect_simple_emotion": lambda t, m: jeevika.detect_simple_emotion(t),
+        "get_jeevika_response": lambda t, m: jeevika.get_jeevika_response(t, copy.deepcopy(m))
+    }
+
+    results = {"messages": per_msg, "stages": {}, "branches": {}}
+
+    for name, fn in stages.items():
+        stats = measure(_loop(prepared, fn), repeat)
+        stats["us_per_msg"] = round(stats["mean_us"] / per_msg, 3)
+        results["stages"][name] = stats
+
+    batch_inputs = [t for t, _ in corpus]
+    stats = measure(
+        lambda: jeevika.get_jeevika_responses_batch(batch_inputs, [copy.deepcopy(m) for _, m in corpus]),
+        max(3, repeat // 4)
+    )
+    stats["us_per_msg"] = round(stats["mean_us"] / per_msg, 3)
+    results["stages"]["get_jeevika_responses_batch"] = stats
+
+    # Per-branch latency, and a check that each branch is actually exercised
+    for branch, (text, memory) in branch_cases().items():
+        reply, _ = jeevika.get_jeevika_response(text, copy.deepcopy(memory))
+        stats = measure(lambda: jeevika.get_jeevika_response(text, copy.deepcopy(memory)), repeat * 10)
+        stats["reply_prefix"] = reply[:40]
+        results["branches"][branch] = stats
+
+    return results
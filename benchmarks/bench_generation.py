@@ -0,0 +1,73 @@
+# ============================================
+# JEEVIKA – Generation Backend Benchmark (offline)
+# Micro-batching on vs off under concurrent callers
+# Stub simulates CPU cost; local runs a real model if installed
+# ============================================
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import ROOT  # noqa: F401  (puts the app on sys.path)
+from benchmarks.common import summarize
+
+from generation import LocalSeq2SeqBackend, StubBackend
+
+PARAMETERS = {"max_new_tokens": 32, "temperature": 0}
+
+
+def _drive(backend, concurrency, requests_per_caller):
+
+    samples = []
+
+    def caller(i):
+        for j in range(requests_per_caller):
+            prompt = f"User {i}: I have been feeling tired for {j} days"
+            start = time.perf_counter()
+            backend.generate(prompt, PARAMETERS)
+            samples.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(caller, range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    stats = backend.stats()
+    return {
+        "replies_per_s": round(len(samples) / elapsed, 1),
+        "latency": summarize(samples),
+        "mean_batch_size": stats["mean_batch_size"],
+        "largest_batch": stats["largest_batch"],
+        "failures": stats["failure"] + stats["rejected"]
+    }
+
+
+def run(backend="stub", concurrency=16, requests_per_caller=10, max_batches=(1, 4, 8, 16),
+        max_wait_ms=10, batch_ms=20.0, item_ms=2.0, model="google/flan-t5-small"):
+
+    results = {
+        "backend": backend,
+        "concurrency": concurrency,
+        "requests": concurrency * requests_per_caller,
+        "max_wait_ms": max_wait_ms,
+        "by_max_batch": {}
+    }
+
+    if backend == "stub":
+        # Fixed cost per forward pass + small cost per row, like a CPU model
+        results["stub_cost_ms"] = {"per_batch": batch_ms, "per_item": item_ms}
+
+    for max_batch in max_batches:
+        batching = {"max_batch": max_batch, "max_wait": max_wait_ms / 1000}
+
+        if backend == "local":
+            try:
+                generator = LocalSeq2SeqBackend(model, **batching)
+                generator.run_batch(["warm up"], PARAMETERS)
+            except ImportError as e:
+                return {**results, "skipped": f"local backend needs transformers + torch ({e})"}
+        else:
+            generator = StubBackend(batch_cost=batch_ms / 1000, item_cost=item_ms / 1000, **batching)
+
+        results["by_max_batch"][str(max_batch)] = _drive(generator, concurrency, requests_per_caller)
+
+    return results
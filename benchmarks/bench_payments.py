@@ -0,0 +1,127 @@
+# ============================================
+# JEEVIKA – Payment Flow Benchmark (offline)
+# Real HTTP app server + fake Razorpay: order reuse, double clicks,
+# checkout -> /verify-payment and webhook activation
+# ============================================
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks import ROOT  # noqa: F401  (puts the app on sys.path)
+from benchmarks.common import measure, summarize
+from benchmarks.fake_razorpay import FakeRazorpay
+
+KEY_ID = "rzp_test_bench"
+KEY_SECRET = "bench_secret"
+WEBHOOK_SECRET = "bench_webhook_secret"
+PASSWORD = "bench-password"
+
+
+def _serve_app(db_path):
+
+    from werkzeug.serving import make_server
+
+    from app import create_app, init_db
+
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
+        "RAZORPAY_KEY_ID": KEY_ID,
+        "RAZORPAY_KEY_SECRET": KEY_SECRET,
+        "RAZORPAY_WEBHOOK_SECRET": WEBHOOK_SECRET
+    })
+    with app.app_context():
+        init_db()
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return app, server, f"http://127.0.0.1:{server.server_port}"
+
+
+def _login(base, email):
+    client = requests.Session()
+    client.post(f"{base}/register", data={"username": "bench", "email": email, "password": PASSWORD})
+    client.post(f"{base}/login", data={"email": email, "password": PASSWORD})
+    return client
+
+
+def run(users=20, clicks=5, latency=0.05, repeat=20):
+
+    tmp = tempfile.mkdtemp(prefix="jeevika-pay-")
+    app, app_server, base = _serve_app(os.path.join(tmp, "bench.db"))
+
+    fake = FakeRazorpay(
+        KEY_ID, KEY_SECRET,
+        webhook_secret=WEBHOOK_SECRET,
+        webhook_url=f"{base}/razorpay/webhook",
+        latency=latency
+    )
+    fake_server = fake.serve()
+    fake_base = f"http://127.0.0.1:{fake_server.server_port}"
+
+    # payment_client() is built on first use, so it picks up the fake
+    app.config["RAZORPAY_BASE_URL"] = fake_base
+
+    results = {"users": users, "clicks_per_user": clicks, "razorpay_latency_s": latency}
+
+    try:
+        client = _login(base, "pay-latency@example.com")
+
+        first = time.perf_counter()
+        client.post(f"{base}/create-order")
+        results["create_order_first_us"] = round((time.perf_counter() - first) * 1e6, 2)
+        results["create_order_reused"] = measure(lambda: client.post(f"{base}/create-order"), repeat)
+
+        # Double clicks: every user fires `clicks` create-order calls at once
+        sessions = [_login(base, f"pay-{i}@example.com") for i in range(users)]
+        created_before = fake.calls["create"]
+        samples = []
+        statuses = {}
+
+        def click(session):
+            start = time.perf_counter()
+            response = session.post(f"{base}/create-order")
+            samples.append(time.perf_counter() - start)
+            return response
+
+        with ThreadPoolExecutor(max_workers=users * clicks) as pool:
+            responses = list(pool.map(click, [s for s in sessions for _ in range(clicks)]))
+
+        for response in responses:
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        results["double_click"] = {
+            "requests": len(responses),
+            "statuses": statuses,
+            "razorpay_orders_created": fake.calls["create"] - created_before,
+            "latency": summarize(samples)
+        }
+
+        # Full flow: order -> checkout -> verify; webhook races the verify call
+        started = time.perf_counter()
+        for session in sessions:
+            order = session.post(f"{base}/create-order").json()
+            paid = requests.post(f"{fake_base}/_test/pay/{order['order_id']}").json()
+            session.post(f"{base}/verify-payment", json=paid)
+        results["checkout_flow_per_user_ms"] = round((time.perf_counter() - started) * 1e3 / users, 2)
+
+        deadline = time.time() + 10
+        while fake.calls["webhooks"] < users and time.time() < deadline:
+            time.sleep(0.05)
+
+        from models import User
+        with app.app_context():
+            results["pro_users"] = User.query.filter_by(plan="PRO").count()
+        results["webhooks_delivered"] = fake.calls["webhooks"]
+
+    finally:
+        fake_server.shutdown()
+        app_server.shutdown()
+
+    return results
@@ -0,0 +1,126 @@
+# ============================================
+# JEEVIKA – Route Benchmarks
+# /dashboard GET (full and 304) + POST, static pages and /login
+# via the Flask test client on SQLite
+# ============================================
+
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from benchmarks import ROOT  # noqa: F401  (puts the app on sys.path)
+from benchmarks.common import measure
+
+PASSWORD = "bench-password"
+
+
+def _load_app(db_path):
+
+    from app import create_app, init_db
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}"})
+    with app.app_context():
+        init_db()
+
+    return app
+
+
+def _seed_history(app, email, messages):
+
+    from models import db, User, ChatSession, Message
+
+    with app.app_context():
+        user = User.query.filter_by(email=email).first()
+        chat_session = ChatSession.query.filter_by(user_id=user.id).first()
+
+        start = datetime.utcnow() - timedelta(minutes=messages)
+        rows = [{
+            "session_id": chat_session.id,
+            "role": "user" if i % 2 == 0 else "bot",
+            "text": f"history message {i} about my period and mood",
+            "emotion": "neutral",
+            "timestamp": start + timedelta(minutes=i)
+        } for i in range(messages)]
+
+        for i in range(0, len(rows), 5000):
+            db.session.execute(Message.__table__.insert(), rows[i:i + 5000])
+        db.session.commit()
+
+
+def _client_for(app, email):
+
+    client = app.test_client()
+    client.post("/register", data={"username": "bench", "email": email, "password": PASSWORD})
+    client.post("/login", data={"email": email, "password": PASSWORD})
+    return client
+
+
+def run(sizes=(10, 1000, 100000), repeat=30):
+
+    tmp = tempfile.mkdtemp(prefix="jeevika-bench-")
+    app = _load_app(os.path.join(tmp, "bench.db"))
+    results = {"database": "sqlite", "histories": {}}
+
+    for size in sizes:
+        email = f"bench-{size}@example.com"
+        client = _client_for(app, email)
+
+        started = time.perf_counter()
+        _seed_history(app, email, size)
+        seed_s = time.perf_counter() - started
+
+        entry = {"seed_s": round(seed_s, 2)}
+
+        entry["dashboard_get"] = measure(lambda: client.get("/dashboard"), repeat)
+
+        etag = client.get("/dashboard").headers.get("ETag")
+        entry["dashboard_get_304"] = measure(
+            lambda: client.get("/dashboard", headers={"If-None-Match": etag}), repeat
+        )
+        entry["dashboard_post"] = measure(
+            lambda: client.post("/dashboard", data={"message": "mild cramps and some acne"}),
+            repeat
+        )
+        entry["api_messages_page"] = measure(lambda: client.get("/api/messages?before=1000000"), repeat)
+        entry["query_count_dashboard_get"] = int(client.get("/dashboard").headers.get("X-Query-Count", 0))
+
+        results["histories"][str(size)] = entry
+
+    # Static pages: full GETs through the same route, pre-rendered bytes vs
+    # rendering the template per hit (the route before pre-rendering)
+    from flask import render_template
+
+    anonymous = app.test_client()
+    landing_etag = anonymous.get("/").headers.get("ETag")
+    gzip = {"Accept-Encoding": "gzip"}
+
+    import app as app_module
+
+    def per_hit(fn):
+        prerendered = app_module.static_page
+        app_module.static_page = render_template
+        try:
+            return fn()
+        finally:
+            app_module.static_page = prerendered
+
+    results["static_pages"] = {
+        "landing_get_rendered": per_hit(lambda: measure(lambda: anonymous.get("/"), repeat)),
+        "landing_get_prerendered": measure(lambda: anonymous.get("/"), repeat),
+        "landing_get_gzip_rendered": per_hit(lambda: measure(lambda: anonymous.get("/", headers=gzip), repeat)),
+        "landing_get_gzip_prerendered": measure(lambda: anonymous.get("/", headers=gzip), repeat),
+        "landing_get_304": measure(lambda: anonymous.get("/", headers={"If-None-Match": landing_etag}), repeat),
+        "login_get_rendered": per_hit(lambda: measure(lambda: anonymous.get("/login"), repeat)),
+        "login_get_prerendered": measure(lambda: anonymous.get("/login"), repeat)
+    }
+
+    login_client = app.test_client()
+    results["login_post"] = measure(
+        lambda: login_client.post("/login", data={"email": f"bench-{sizes[0]}@example.com", "password": PASSWORD}),
+        max(5, repeat // 3),
+        warmup=1
+    )
+    results["bcrypt_log_rounds"] = app.config.get("BCRYPT_LOG_ROUNDS")
+
+    return results
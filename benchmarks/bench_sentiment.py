@@ -0,0 +1,107 @@
+# ============================================
+# JEEVIKA – Sentiment Benchmark
+# Per-message latency + fast/TextBlob agreement
+# Agreement is reported on the synthetic corpus and on held-out chat
+# messages (benchmarks/data/chat_messages.txt) — the synthetic one is
+# built from lexicon words and flatters the fast path
+#
+#   python benchmarks/bench_sentiment.py [--messages 5000]
+# ============================================
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sentiment
+
+OPENERS = ["", "i feel", "i am", "today i am", "honestly i feel", "why am i so", "i'm not"]
+MODIFIERS = ["", "very", "really", "so", "extremely", "a little", "not"]
+WORDS = [
+    "happy", "sad", "tired", "lonely", "calm", "anxious", "good", "bad", "great",
+    "terrible", "hopeless", "better", "worse", "exhausted", "stressed", "fine",
+    "scared", "okay", "overwhelmed", "grateful", "weak", "strong", "confused"
+]
+TAILS = ["", "today", "about my periods", "because of work", "with this pain", "!", "all the time"]
+
+CHAT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "chat_messages.txt")
+
+
+def build_corpus(n, seed=7):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        parts = [rng.choice(OPENERS), rng.choice(MODIFIERS), rng.choice(WORDS)]
+        if rng.random() < 0.4:
+            parts += ["and", rng.choice(MODIFIERS), rng.choice(WORDS)]
+        parts.append(rng.choice(TAILS))
+        corpus.append(" ".join(p for p in parts if p))
+    return corpus
+
+
+def load_chat_corpus(path=CHAT_CORPUS):
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def agreement(corpus):
+
+    fast = [sentiment.fast_polarity(t) for t in corpus]
+    slow = [sentiment.textblob_polarity(t) for t in corpus]
+    diffs = [abs(a - b) for a, b in zip(fast, slow)]
+
+    def sign(x):
+        return (x > 0) - (x < 0)
+
+    return {
+        "messages": len(corpus),
+        "within_0.01_pct": round(100 * sum(d <= 0.01 for d in diffs) / len(diffs), 2),
+        "sign_pct": round(100 * sum(sign(a) == sign(b) for a, b in zip(fast, slow)) / len(diffs), 2),
+        "mean_abs_diff": round(sum(diffs) / len(diffs), 4),
+        "max_abs_diff": round(max(diffs), 4)
+    }
+
+
+def time_per_message(fn, corpus):
+    start = time.perf_counter()
+    for text in corpus:
+        fn(text)
+    return (time.perf_counter() - start) / len(corpus) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=5000)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.messages)
+    results = {"messages": len(corpus)}
+
+    start = time.perf_counter()
+    sentiment.textblob_available()
+    results["textblob_import_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+    results["fast_us_per_msg"] = round(time_per_message(sentiment.fast_polarity, corpus), 2)
+    results["textblob_us_per_msg"] = round(time_per_message(sentiment.textblob_polarity, corpus), 2)
+
+    # Warm numbers only mean something when the working set fits the cache
+    working_set = corpus[:sentiment.SENTIMENT_CACHE_SIZE // 2]
+    sentiment._cached_polarity.cache_clear()
+    results["memoized_cold_us_per_msg"] = round(time_per_message(sentiment.polarity, working_set), 2)
+    results["memoized_warm_us_per_msg"] = round(time_per_message(sentiment.polarity, working_set), 2)
+
+    if sentiment.textblob_available():
+        results["agreement"] = {
+            "synthetic": agreement(corpus),
+            "chat": agreement(load_chat_corpus())
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# ============================================
+# JEEVIKA – Worker Boot Benchmark
+# Fresh interpreters: import app + create_app(), per-phase timings
+# ============================================
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import ROOT
+from benchmarks.common import summarize
+
+BOOT = (
+    "import json, app; app.create_app(); "
+    "import sys; print(json.dumps({"
+    "'report': app.STARTUP.as_dict(), "
+    "'heavy_modules': sorted(m for m in ('razorpay', 'requests', 'textblob') if m in sys.modules)"
+    "}))"
+)
+
+
+def _boot(env):
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", BOOT],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    wall = time.perf_counter() - start
+    return wall, json.loads(out.strip().splitlines()[-1])
+
+
+def run(repeat=10):
+
+    tmp = tempfile.mkdtemp(prefix="jeevika-boot-")
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'boot.db')}",
+        "LOG_LEVEL": "WARNING"
+    }
+
+    # First boot warms the OS page cache and writes .pyc files
+    _boot(env)
+
+    walls = []
+    phases = {}
+    heavy = []
+
+    for _ in range(repeat):
+        wall, result = _boot(env)
+        walls.append(wall)
+        heavy = result["heavy_modules"]
+
+        phases.setdefault("total", []).append(result["report"]["total_ms"] / 1e3)
+        for name, ms in result["report"]["phases_ms"].items():
+            phases.setdefault(name, []).append(ms / 1e3)
+
+    return {
+        "process_wall": summarize(walls),
+        "phases": {name: summarize(samples) for name, samples in phases.items()},
+        # Should stay empty: these load on first use
+        "heavy_modules_loaded": heavy
+    }
@@ -0,0 +1,73 @@
+# ============================================
+# JEEVIKA – Benchmark Helpers
+# Timing, summary stats and JSON results
+# ============================================
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+
+
+def measure(fn, repeat, warmup=3):
+
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+
+    return summarize(samples)
+
+
+def summarize(samples):
+
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    return {
+        "n": len(samples),
+        "mean_us": round(statistics.fmean(samples) * 1e6, 2),
+        "p50_us": round(pct(50) * 1e6, 2),
+        "p95_us": round(pct(95) * 1e6, 2),
+        "max_us": round(ordered[-1] * 1e6, 2),
+        "ops_per_s": round(len(samples) / sum(samples), 1) if sum(samples) else None
+    }
+
+
+def environment():
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except Exception:
+        commit = None
+
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count()
+    }
+
+
+def write_results(results, path=None):
+
+    text = json.dumps(results, indent=2, sort_keys=True)
+
+    if path:
+        with open(path, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
@@ -0,0 +1,57 @@
+# ============================================
+# JEEVIKA – Synthetic Engine Corpus
+# At least one message (and memory) per router branch
+# ============================================
+
+import copy
+import random
+
+# branch -> (message, starting memory)
+BRANCH_CASES = {
+    "crisis": ("I just want to end my life", {}),
+    "red_flag": ("sudden severe abdominal pain since morning", {}),
+    "pain": ("the cramps are unbearable today", {}),
+    "iron": ("fatigue and dizziness again, pale skin too", {}),
+    "therapist_stress": ("so much stress at work", {}),
+    "therapist_anxiety": ("my anxiety is back", {}),
+    "therapist_lonely": ("I feel lonely lately", {}),
+    "therapist_sad": ("feeling sad tonight", {}),
+    "therapist_reflect": (
+        "I keep thinking about it",
+        {"emotional_depth_level": 5, "last_topic": "stress"}
+    ),
+    "hormone_insight": (
+        "my period is late again",
+        {"symptoms": ["irregular periods", "acne"], "pcos_score": 3}
+    ),
+    "pcos_update": ("irregular periods and acne and hair fall", {}),
+    "fallback": ("what should I eat for breakfast?", {})
+}
+
+FILLER = [
+    "hello", "thank you", "I had a long day", "can you help me",
+    "my period", "some acne", "weight gain lately", "mild cramps",
+    "moderate pain", "I am happy today", "feeling calm", "not sure"
+]
+
+
+def branch_cases():
+    return {k: (text, copy.deepcopy(memory)) for k, (text, memory) in BRANCH_CASES.items()}
+
+
+def build_corpus(n, seed=11):
+
+    rng = random.Random(seed)
+    cases = list(BRANCH_CASES.values())
+    corpus = []
+
+    for i in range(n):
+        if i < len(cases):
+            text, memory = cases[i]
+        elif rng.random() < 0.5:
+            text, memory = rng.choice(cases)
+        else:
+            text, memory = " and ".join(rng.sample(FILLER, rng.randint(1, 3))), {}
+        corpus.append((text, copy.deepcopy(memory)))
+
+    return corpus
@@ -0,0 +1,228 @@
+# ============================================
+# JEEVIKA – Fake Razorpay (offline payments)
+# Orders API subset + signed checkout results + webhooks
+#
+#   python -m benchmarks.fake_razorpay --port 9010 \
+#       --webhook-url http://127.0.0.1:5000/razorpay/webhook
+#
+# Point the app at it with RAZORPAY_BASE_URL=http://127.0.0.1:9010 and the
+# same RAZORPAY_KEY_ID / RAZORPAY_KEY_SECRET / RAZORPAY_WEBHOOK_SECRET.
+# ============================================
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from urllib.request import Request, urlopen
+
+
+def sign(secret, message):
+    return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+
+class FakeRazorpay:
+
+    def __init__(self, key_id, key_secret, webhook_secret=None, webhook_url=None, latency=0.0):
+        self.key_id = key_id
+        self.key_secret = key_secret
+        self.webhook_secret = webhook_secret
+        self.webhook_url = webhook_url
+        self.latency = latency
+
+        self.orders = {}
+        self.calls = {"create": 0, "fetch": 0, "pay": 0, "webhooks": 0}
+        self.lock = threading.Lock()
+
+    # ----------------------------------------
+    # Orders API
+    # ----------------------------------------
+
+    def create_order(self, data):
+        order = {
+            "id": "order_" + uuid.uuid4().hex[:14],
+            "entity": "order",
+            "amount": int(data["amount"]),
+            "amount_paid": 0,
+            "currency": data.get("currency", "INR"),
+            "receipt": data.get("receipt"),
+            "notes": data.get("notes") or {},
+            "status": "created",
+            "created_at": int(time.time())
+        }
+        with self.lock:
+            self.orders[order["id"]] = order
+            self.calls["create"] += 1
+        return order
+
+    def find_orders(self, receipt=None):
+        with self.lock:
+            self.calls["fetch"] += 1
+            items = [o for o in self.orders.values() if receipt is None or o["receipt"] == receipt]
+        return {"entity": "collection", "count": len(items), "items": items}
+
+    # ----------------------------------------
+    # Checkout stand-in: what the browser handler receives
+    # ----------------------------------------
+
+    def pay(self, order_id):
+        with self.lock:
+            order = self.orders[order_id]
+            order["status"] = "paid"
+            order["amount_paid"] = order["amount"]
+            self.calls["pay"] += 1
+
+        payment_id = "pay_" + uuid.uuid4().hex[:14]
+
+        if self.webhook_url and self.webhook_secret:
+            threading.Thread(target=self.send_webhook, args=(order, payment_id), daemon=True).start()
+
+        return {
+            "razorpay_order_id": order_id,
+            "razorpay_payment_id": payment_id,
+            "razorpay_signature": sign(self.key_secret, f"{order_id}|{payment_id}")
+        }
+
+    def webhook_event(self, order, payment_id):
+        return {
+            "entity": "event",
+            "event": "order.paid",
+            "created_at": int(time.time()),
+            "payload": {
+                "payment": {"entity": {
+                    "id": payment_id,
+                    "entity": "payment",
+                    "order_id": order["id"],
+                    "amount": order["amount"],
+                    "currency": order["currency"],
+                    "status": "captured"
+                }},
+                "order": {"entity": order}
+            }
+        }
+
+    def send_webhook(self, order, payment_id):
+        body = json.dumps(self.webhook_event(order, payment_id))
+        request = Request(self.webhook_url, data=body.encode(), method="POST", headers={
+            "Content-Type": "application/json",
+            "X-Razorpay-Signature": sign(self.webhook_secret, body)
+        })
+        try:
+            urlopen(request, timeout=10).close()
+            with self.lock:
+                self.calls["webhooks"] += 1
+        except OSError as e:
+            print(f"webhook to {self.webhook_url} failed: {e}")
+
+    # ----------------------------------------
+    # HTTP
+    # ----------------------------------------
+
+    def authorized(self, header):
+        expected = base64.b64encode(f"{self.key_id}:{self.key_secret}".encode()).decode()
+        return hmac.compare_digest(header or "", f"Basic {expected}")
+
+    def handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def log_message(self, *args):
+                pass
+
+            def reply(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client gave up (timeout tests); the order still exists
+                    pass
+
+            def error(self, status, description):
+                self.reply(status, {"error": {"code": "BAD_REQUEST_ERROR", "description": description}})
+
+            def body(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def route(self, method):
+                url = urlparse(self.path)
+                parts = url.path.strip("/").split("/")
+
+                if fake.latency:
+                    time.sleep(fake.latency)
+
+                # Test hooks, no API auth (the "browser" calls these)
+                if parts[:2] == ["_test", "pay"] and method == "POST":
+                    if parts[2] not in fake.orders:
+                        return self.error(404, "order not found")
+                    return self.reply(200, fake.pay(parts[2]))
+
+                if parts[:2] == ["_test", "stats"]:
+                    return self.reply(200, {"orders": len(fake.orders), **fake.calls})
+
+                if not fake.authorized(self.headers.get("Authorization")):
+                    return self.error(401, "The api key provided is invalid")
+
+                if parts[:2] == ["v1", "orders"]:
+                    if method == "POST" and len(parts) == 2:
+                        return self.reply(200, fake.create_order(self.body()))
+                    if method == "GET" and len(parts) == 2:
+                        receipt = parse_qs(url.query).get("receipt", [None])[0]
+                        return self.reply(200, fake.find_orders(receipt))
+                    if method == "GET" and len(parts) == 3 and parts[2] in fake.orders:
+                        return self.reply(200, fake.orders[parts[2]])
+
+                self.error(404, "not found")
+
+            def do_GET(self):
+                self.route("GET")
+
+            def do_POST(self):
+                self.route("POST")
+
+        return Handler
+
+    def serve(self, host="127.0.0.1", port=0):
+        server = ThreadingHTTPServer((host, port), self.handler())
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fake_razorpay")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9010)
+    parser.add_argument("--webhook-url")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every call")
+    args = parser.parse_args()
+
+    fake = FakeRazorpay(
+        os.environ.get("RAZORPAY_KEY_ID", "rzp_test_fake"),
+        os.environ.get("RAZORPAY_KEY_SECRET", "fake_secret"),
+        webhook_secret=os.environ.get("RAZORPAY_WEBHOOK_SECRET", "fake_webhook_secret"),
+        webhook_url=args.webhook_url,
+        latency=args.latency
+    )
+    server = fake.serve(args.host, args.port)
+    print(f"Fake Razorpay on http://{args.host}:{server.server_port}")
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# =====================================================
+# JEEVIKA – Chat Turn Service
+# Full engine memory in, one transaction out
+# =====================================================
+
+from jeevika import get_jeevika_response, get_rule_response, hf_reply, detect_simple_emotion, FALLBACK_REPLY
+from models import db, Message, ChatSession
+from conversation import build_context
+from timeseries import record_turn, recent_symptom_events, recent_sentiment
+
+# =====================================================
+# 🧠 HEALTHDATA <-> ENGINE MEMORY
+# =====================================================
+
+def memory_from_health(health):
+    return {
+        "symptoms": list(health.symptoms or []),
+        "symptom_timeline": recent_symptom_events(health.user_id),
+        "pcos_score": health.pcos_score or 0,
+        "pain_score": health.pain_score or 0,
+        "iron_score": health.iron_score or 0,
+        "estrogen_percent": health.estrogen_percent or 0.0,
+        "progesterone_percent": health.progesterone_percent or 0.0,
+        "sentiment_history": recent_sentiment(health.user_id),
+        "clinical_risk_level": health.clinical_risk or "LOW"
+    }
+
+
+def apply_memory(health, memory):
+
+    # Symptoms are only ever appended, each with one timeline entry, and the
+    # engine adds one sentiment sample per turn: only those rows are new.
+    added = len(memory["symptoms"]) - len(health.symptoms or [])
+    record_turn(
+        health.user_id,
+        memory["symptom_timeline"][-added:] if added > 0 else [],
+        memory["sentiment_history"][-1] if memory["sentiment_history"] else None
+    )
+
+    health.symptoms = list(memory["symptoms"])
+    health.pcos_score = memory["pcos_score"]
+    health.pain_score = memory["pain_score"]
+    health.iron_score = memory["iron_score"]
+    health.estrogen_percent = memory["estrogen_percent"]
+    health.progesterone_percent = memory["progesterone_percent"]
+    health.clinical_risk = memory["clinical_risk_level"]
+
+
+# =====================================================
+# 💬 CHAT TURN
+# =====================================================
+
+def run_chat_turn(user, chat_session, health, user_input, queue=None):
+
+    memory = memory_from_health(health)
+
+    # With a queue, only the rule engines run here; HF goes to a worker
+    if queue is not None:
+        reply, memory = get_rule_response(user_input, memory)
+        if reply is None:
+            return None, queue_chat_turn(queue, user, chat_session, health, user_input, memory)
+
+    else:
+        # Engine (and any HF call) runs before we touch the session,
+        # so no transaction is held open while waiting on the model.
+        reply, memory = get_jeevika_response(
+            user_input, memory, lambda: build_context(chat_session)
+        )
+
+    save_chat_turn(chat_session, health, user_input, reply, memory)
+
+    return reply, None
+
+
+def _message(session_id, role, text):
+    return Message(
+        session_id=session_id,
+        role=role,
+        text=text,
+        emotion=detect_simple_emotion(text)
+    )
+
+
+def save_chat_turn(chat_session, health, user_input, reply, memory):
+
+    db.session.add_all([
+        _message(chat_session.id, "user", user_input),
+        _message(chat_session.id, "bot", reply)
+    ])
+
+    apply_memory(health, memory)
+    db.session.commit()
+
+
+def save_user_message(chat_session, health, user_input, memory):
+
+    # User message and engine state land now; the bot reply follows later
+    message = _message(chat_session.id, "user", user_input)
+    db.session.add(message)
+    apply_memory(health, memory)
+    db.session.commit()
+
+    return message
+
+
+def save_bot_reply(session_id, reply):
+
+    message = _message(session_id, "bot", reply)
+    db.session.add(message)
+    db.session.commit()
+
+    return message
+
+
+# =====================================================
+# ⏳ QUEUED TURN (HF FALLBACK OFF THE REQUEST)
+# =====================================================
+
+FALLBACK_JOB = "chat_fallback"
+
+
+def queue_chat_turn(queue, user, chat_session, health, user_input, memory):
+
+    message = save_user_message(chat_session, health, user_input, memory)
+
+    return queue.enqueue(FALLBACK_JOB, {
+        "user_id": user.id,
+        "session_id": chat_session.id,
+        "message_id": message.id,
+        "text": user_input
+    })
+
+
+def run_fallback_job(payload):
+
+    # Context stops short of the message being answered
+    chat_session = db.session.get(ChatSession, payload["session_id"])
+    context = build_context(chat_session, payload.get("message_id")) if chat_session else None
+
+    # Raises on a model failure or open breaker so the queue retries
+    reply = hf_reply(payload["text"], context=context, strict=True)
+
+    message = save_bot_reply(payload["session_id"], reply)
+
+    return {"reply": reply, "message_id": message.id}
+
+
+def fallback_job_dead(payload, error):
+
+    # Out of retries: answer with the canned reply rather than leave the
+    # user's message hanging
+    message = save_bot_reply(payload["session_id"], FALLBACK_REPLY)
+
+    return {"reply": FALLBACK_REPLY, "message_id": message.id}
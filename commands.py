@@ -0,0 +1,323 @@
+# =====================================================
+# JEEVIKA – Maintenance CLI
+# Run with: flask --app app <command>
+# =====================================================
+
+import json
+from datetime import datetime, timedelta
+from functools import wraps
+
+import click
+from sqlalchemy import func, insert, inspect, select, text, update
+
+from jeevika import RULES, build_golden, detect_simple_emotion, verify_golden
+from rules import RulePackError, load_pack
+from models import db, Message, User, ChatSession, HealthData, SymptomEvent, SentimentSample
+from timeseries import parse_timestamp
+from export import EXPORT_FORMATS, EXPORT_TABLES, stream_export
+from subscriptions import expire_due_subscriptions
+from db_config import statement_timeout_off
+import sentiment
+
+
+# =====================================================
+# 🧱 SCHEMA HELPERS
+# =====================================================
+
+def ensure_column(model, name):
+
+    # create_all never alters existing tables, so add late columns by hand
+    table = model.__table__
+    existing = {c["name"] for c in inspect(db.engine).get_columns(table.name)}
+
+    if name in existing:
+        return False
+
+    column = table.columns[name]
+    ddl = column.type.compile(dialect=db.engine.dialect)
+
+    with db.engine.begin() as conn:
+        conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN {name} {ddl}'))
+
+    return True
+
+
+def ensure_indexes(model):
+
+    # Same story as columns: indexes added to a model later need creating
+    if db.engine.dialect.name != "postgresql":
+        for index in model.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
+        return
+
+    # Postgres: build without blocking writes to a live table. CONCURRENTLY
+    # can't run inside a transaction, hence autocommit.
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for index in model.__table__.indexes:
+            columns = ", ".join(f'"{c.name}"' for c in index.columns)
+            conn.execute(text(
+                f'CREATE {"UNIQUE " if index.unique else ""}INDEX CONCURRENTLY IF NOT EXISTS'
+                f' "{index.name}" ON "{model.__table__.name}" ({columns})'
+            ))
+
+
+# Columns added to tables that already exist in deployed databases
+LATE_COLUMNS = [
+    (Message, "emotion"),
+    (ChatSession, "summary"),
+    (ChatSession, "summary_through_id")
+]
+
+
+def init_db():
+
+    # Schema work lives here, not at import: workers boot without touching it
+    with statement_timeout_off(db.engine):
+        db.create_all()
+
+        for model, name in LATE_COLUMNS:
+            ensure_column(model, name)
+
+        for mapper in db.Model.registry.mappers:
+            ensure_indexes(mapper.class_)
+
+    return sorted(db.metadata.tables)
+
+
+def maintenance(command):
+
+    # CLI work may scan whole tables: no request-sized statement timeout
+    @wraps(command)
+    def run(*args, **kwargs):
+        with statement_timeout_off(db.engine):
+            return command(*args, **kwargs)
+
+    return run
+
+
+# =====================================================
+# 🎭 EMOTION BACKFILL
+# =====================================================
+
+def backfill_emotions(batch_size=1000):
+
+    updated = 0
+    last_id = 0
+
+    while True:
+        rows = db.session.query(Message.id, Message.text).filter(
+            Message.id > last_id,
+            Message.emotion.is_(None)
+        ).order_by(Message.id.asc()).limit(batch_size).all()
+
+        if not rows:
+            break
+
+        db.session.execute(update(Message), [
+            {"id": row.id, "emotion": detect_simple_emotion(row.text)}
+            for row in rows
+        ])
+        db.session.commit()
+
+        updated += len(rows)
+        last_id = rows[-1].id
+
+    return updated
+
+
+# =====================================================
+# 🧱 MISSING USER ROWS (ONE-OFF)
+# =====================================================
+
+def ensure_all_user_rows():
+
+    created = {}
+
+    for model in (ChatSession, HealthData):
+        missing = select(User.id).where(
+            ~select(model.id).where(model.user_id == User.id).exists()
+        )
+        result = db.session.execute(
+            insert(model).from_select(["user_id"], missing)
+        )
+        created[model.__tablename__] = result.rowcount
+
+    db.session.commit()
+    return created
+
+
+# =====================================================
+# 📈 JSON HISTORY -> TIME SERIES TABLES (ONE-OFF)
+# =====================================================
+
+def migrate_timeseries(batch_size=500):
+
+    moved = {"symptom_event": 0, "sentiment_sample": 0}
+    last_id = 0
+
+    while True:
+        rows = db.session.query(HealthData).filter(
+            HealthData.id > last_id
+        ).order_by(HealthData.id.asc()).limit(batch_size).all()
+
+        if not rows:
+            break
+
+        events = []
+        samples = []
+
+        # Samples already in the table were recorded after the blob
+        earliest = dict(db.session.query(
+            SentimentSample.user_id, func.min(SentimentSample.timestamp)
+        ).filter(
+            SentimentSample.user_id.in_([health.user_id for health in rows])
+        ).group_by(SentimentSample.user_id).all())
+
+        for health in rows:
+            for entry in health.symptom_timeline or []:
+                events.append({
+                    "user_id": health.user_id,
+                    "symptom": entry["symptom"],
+                    "timestamp": parse_timestamp(entry.get("timestamp"))
+                })
+
+            # The blob never stored when a sample was taken. Keep the order
+            # and date them at the record's creation, and never on or after
+            # the user's first real sample, so no day gains a fake mood.
+            stamped_at = health.created_at or datetime.utcnow()
+            first = earliest.get(health.user_id)
+            if first is not None and first <= stamped_at:
+                stamped_at = first - timedelta(seconds=1)
+            for polarity in health.sentiment_history or []:
+                samples.append({
+                    "user_id": health.user_id,
+                    "polarity": polarity,
+                    "timestamp": stamped_at
+                })
+
+            if health.symptom_timeline or health.sentiment_history:
+                health.symptom_timeline = []
+                health.sentiment_history = []
+
+        if events:
+            db.session.execute(insert(SymptomEvent), events)
+        if samples:
+            db.session.execute(insert(SentimentSample), samples)
+
+        # Blobs are emptied in the same commit, so a rerun never duplicates rows
+        db.session.commit()
+
+        moved["symptom_event"] += len(events)
+        moved["sentiment_sample"] += len(samples)
+        last_id = rows[-1].id
+
+    return moved
+
+
+def register_commands(app):
+
+    @app.cli.command("init-db")
+    def init_db_command():
+        tables = init_db()
+        click.echo(f"Schema ready: {', '.join(tables)}")
+
+    @app.cli.command("backfill-emotions")
+    @click.option("--batch-size", default=1000, show_default=True)
+    @maintenance
+    def backfill_emotions_command(batch_size):
+        if ensure_column(Message, "emotion"):
+            click.echo("Added message.emotion column")
+
+        updated = backfill_emotions(batch_size)
+        click.echo(f"Backfilled emotion on {updated} messages")
+
+    @app.cli.command("ensure-user-rows")
+    @maintenance
+    def ensure_user_rows_command():
+        for table, count in ensure_all_user_rows().items():
+            click.echo(f"Created {count} {table} rows")
+
+    @app.cli.command("migrate-timeseries")
+    @click.option("--batch-size", default=500, show_default=True)
+    @maintenance
+    def migrate_timeseries_command(batch_size):
+        # New tables only; create_all leaves existing ones alone
+        db.create_all()
+
+        for table, count in migrate_timeseries(batch_size).items():
+            click.echo(f"Moved {count} rows into {table}")
+
+    @app.cli.command("export")
+    @click.option("--user-id", type=int, help="Export one user (default: all users)")
+    @click.option("--format", "fmt", type=click.Choice(EXPORT_FORMATS), default="ndjson", show_default=True)
+    @click.option("--table", "tables", multiple=True, type=click.Choice(list(EXPORT_TABLES)),
+                  help="Repeatable; default: every table (NDJSON only)")
+    @click.option("--out", type=click.File("w", encoding="utf-8"), default="-", show_default=True)
+    @maintenance
+    def export_command(user_id, fmt, tables, out):
+        try:
+            chunks = stream_export(fmt, list(tables or EXPORT_TABLES), user_id)
+            for chunk in chunks:
+                out.write(chunk)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+
+    @app.cli.command("expire-subscriptions")
+    @click.option("--batch-size", default=500, show_default=True)
+    @maintenance
+    def expire_subscriptions_command(batch_size):
+        ensure_indexes(User)
+
+        result = expire_due_subscriptions(batch_size)
+        click.echo(f"Expired {result['expired']} subscriptions in {result['batches']} batches")
+
+    @app.cli.command("rules-check")
+    @click.argument("path")
+    def rules_check_command(path):
+        try:
+            table = load_pack(path)
+        except RulePackError as e:
+            raise click.ClickException(str(e))
+
+        mismatches = verify_golden(table, RULES.golden_cases())
+        for m in mismatches:
+            click.echo(json.dumps(m, ensure_ascii=False))
+
+        if mismatches:
+            raise click.ClickException(f"{len(mismatches)} golden case(s) changed")
+
+        click.echo(f"Rule pack {table.version} OK")
+
+    @app.cli.command("rules-golden")
+    def rules_golden_command():
+        # Re-record expected outcomes after an intended behaviour change.
+        # Run with RULE_BOOT_VERIFY=0: until re-recorded, the changed pack
+        # fails the boot check and the app would not import.
+        cases = [(case["text"], case.get("memory") or {}) for case in RULES.golden_cases()]
+        golden = build_golden(cases)
+
+        with open(RULES.golden_path, "w", encoding="utf-8") as f:
+            json.dump(golden, f, ensure_ascii=False, indent=2)
+
+        click.echo(f"Recorded {len(cases)} golden cases for {golden['version']}")
+
+    @app.cli.command("sentiment-lexicon")
+    def sentiment_lexicon_command():
+        # Re-export the fast scorer's word table from the installed TextBlob
+        if not sentiment.textblob_available():
+            raise click.ClickException("textblob is not installed")
+
+        words = sentiment.export_lexicon()
+        faces = sentiment.export_emoticons()
+
+        # One entry per line keeps re-exports reviewable as a diff
+        def rows(table):
+            return ",\n".join(f"  {json.dumps(k, ensure_ascii=False)}: {json.dumps(table[k])}" for k in sorted(table))
+
+        with open(sentiment.SENTIMENT_LEXICON, "w", encoding="utf-8") as f:
+            f.write(
+                '{"source": "textblob en-sentiment.xml", "words": {\n' + rows(words) +
+                '\n}, "emoticons": {\n' + rows(faces) + "\n}}\n"
+            )
+
+        click.echo(f"Exported {len(words)} words and {len(faces)} emoticons to {sentiment.SENTIMENT_LEXICON}")
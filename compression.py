@@ -0,0 +1,205 @@
+# =====================================================
+# JEEVIKA – Response Compression (WSGI)
+# gzip always • brotli when installed • streaming safe
+# =====================================================
+
+import gzip
+import os
+import zlib
+
+from werkzeug.wsgi import ClosingIterator
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+BROTLI_AVAILABLE = brotli is not None
+
+COMPRESSIBLE_TYPES = {
+    "text/html", "text/plain", "text/css", "text/csv", "text/event-stream",
+    "application/json", "application/javascript", "application/x-ndjson"
+}
+
+
+# =====================================================
+# 🤝 NEGOTIATION
+# =====================================================
+
+def choose_encoding(accept_encoding, allow_brotli=True):
+
+    offered = {}
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            offered[name] = q
+
+    if allow_brotli and brotli is not None and offered.get("br", 0) > 0:
+        return "br"
+    if offered.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def compress(body, encoding, level=6):
+    if encoding == "br":
+        return brotli.compress(body, quality=min(level, 11))
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class _StreamCompressor:
+
+    # Every chunk is flushed so SSE tokens and export rows arrive as they're produced
+
+    def __init__(self, encoding, level):
+        self.encoding = encoding
+        if encoding == "br":
+            self._c = brotli.Compressor(quality=min(level, 11))
+        else:
+            self._c = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data):
+        if self.encoding == "br":
+            return self._c.process(data) + self._c.flush()
+        return self._c.compress(data) + self._c.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        if self.encoding == "br":
+            return self._c.finish()
+        return self._c.flush(zlib.Z_FINISH)
+
+
+# =====================================================
+# 🧱 MIDDLEWARE
+# =====================================================
+
+class CompressionMiddleware:
+
+    def __init__(self, app, min_size=500, level=6, streaming=True, allow_brotli=True):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+        # False: leave responses without Content-Length (streams) untouched
+        self.streaming = streaming
+        self.allow_brotli = allow_brotli
+
+    def __call__(self, environ, start_response):
+
+        encoding = choose_encoding(environ.get("HTTP_ACCEPT_ENCODING"), self.allow_brotli)
+        if encoding is None or environ.get("REQUEST_METHOD") == "HEAD":
+            return self.app(environ, start_response)
+
+        captured = []
+
+        def capture(status, headers, exc_info=None):
+            captured[:] = [status, headers, exc_info]
+            return lambda data: None
+
+        app_iter = self.app(environ, capture)
+        iterator = iter(app_iter)
+
+        # start_response may legally be deferred until the first chunk
+        head = []
+        if not captured:
+            head = [chunk for chunk in [next(iterator, None)] if chunk is not None]
+
+        status, headers, exc_info = captured
+        plan = self._plan(status, headers)
+
+        if plan is None:
+            if status.startswith("304"):
+                # Must carry the same (weak) tag the compressed 200 did
+                headers = [(k, v) for k, v in headers if k.lower() != "etag"] + _weak_etag(headers)
+            start_response(status, headers, exc_info)
+            return ClosingIterator(_chain(head, iterator), getattr(app_iter, "close", None))
+
+        headers = [(k, v) for k, v in headers if k.lower() not in ("content-length", "etag", "vary")]
+        headers += _vary(captured[1]) + _weak_etag(captured[1])
+        headers.append(("Content-Encoding", encoding))
+
+        if plan == "buffered":
+            try:
+                body = compress(b"".join(_chain(head, iterator)), encoding, self.level)
+            finally:
+                if hasattr(app_iter, "close"):
+                    app_iter.close()
+
+            headers.append(("Content-Length", str(len(body))))
+            start_response(status, headers, exc_info)
+            return [body]
+
+        start_response(status, headers, exc_info)
+        return ClosingIterator(
+            _compress_stream(_chain(head, iterator), encoding, self.level),
+            getattr(app_iter, "close", None)
+        )
+
+    def _plan(self, status, headers):
+
+        code = int(status.split(" ", 1)[0])
+        if code < 200 or code in (204, 206, 304):
+            return None
+
+        lookup = {k.lower(): v for k, v in headers}
+
+        if "content-encoding" in lookup or "no-transform" in lookup.get("cache-control", ""):
+            return None
+
+        mimetype = lookup.get("content-type", "").split(";")[0].strip().lower()
+        if mimetype not in COMPRESSIBLE_TYPES:
+            return None
+
+        length = lookup.get("content-length")
+        if length is None:
+            return "stream" if self.streaming else None
+
+        return "buffered" if int(length) >= self.min_size else None
+
+
+def _chain(head, iterator):
+    yield from head
+    yield from iterator
+
+
+def _compress_stream(chunks, encoding, level):
+    compressor = _StreamCompressor(encoding, level)
+    for data in chunks:
+        if data:
+            yield compressor.chunk(data)
+    yield compressor.finish()
+
+
+def _vary(headers):
+    values = [
+        v.strip() for k, value in headers if k.lower() == "vary" for v in value.split(",")
+    ]
+    if "accept-encoding" not in {v.lower() for v in values}:
+        values.append("Accept-Encoding")
+    return [("Vary", ", ".join(values))]
+
+
+def _weak_etag(headers):
+    # Encoded bytes differ from the identity body, so the tag can only be weak
+    for k, v in headers:
+        if k.lower() == "etag":
+            return [("ETag", v if v.startswith("W/") else f"W/{v}")]
+    return []
+
+
+def install_compression(app):
+
+    if os.environ.get("COMPRESSION_ENABLED", "1").lower() not in ("1", "true", "yes", "on"):
+        return
+
+    app.wsgi_app = CompressionMiddleware(
+        app.wsgi_app,
+        min_size=int(os.environ.get("COMPRESSION_MIN_SIZE", 500)),
+        level=int(os.environ.get("COMPRESSION_LEVEL", 6)),
+        streaming=os.environ.get("COMPRESSION_STREAMING", "1").lower() in ("1", "true", "yes", "on")
+    )
@@ -0,0 +1,136 @@
+# =====================================================
+# JEEVIKA – Conversation Context for the HF Prompt
+# Recent turns verbatim • rolling summary for the rest • fixed budget
+# =====================================================
+
+import os
+import re
+
+from jeevika import hf_summarize
+from models import db, Message
+
+# Messages always shown verbatim (newest first, budget permitting)
+CONTEXT_RECENT = int(os.environ.get("CONTEXT_RECENT_MESSAGES", 6))
+
+# Summary is stale once this many messages have left the recent window
+SUMMARY_REFRESH_EVERY = int(os.environ.get("SUMMARY_REFRESH_EVERY", 6))
+
+# Most messages folded in one refresh; anything older is dropped for good
+SUMMARY_FOLD_MAX = int(os.environ.get("SUMMARY_FOLD_MAX", 40))
+
+# Token budgets (flan-t5 reads 512 input tokens)
+CONTEXT_TOKENS = int(os.environ.get("CONTEXT_TOKENS", 320))
+SUMMARY_TOKENS = int(os.environ.get("SUMMARY_TOKENS", 96))
+MESSAGE_TOKENS = int(os.environ.get("CONTEXT_MESSAGE_TOKENS", 60))
+
+# SentencePiece averages a little over one token per English word
+TOKENS_PER_WORD = 1.3
+
+_SPEAKERS = {"user": "User", "bot": "JEEVIKA"}
+_WS = re.compile(r"\s+")
+
+
+# =====================================================
+# 🔢 TOKEN BUDGET
+# =====================================================
+
+def estimate_tokens(text):
+    return int(len((text or "").split()) * TOKENS_PER_WORD + 0.5)
+
+
+def truncate_tokens(text, budget, keep="head"):
+
+    words = _WS.sub(" ", text or "").strip().split(" ")
+    limit = max(0, int(budget / TOKENS_PER_WORD))
+
+    if len(words) <= limit:
+        return " ".join(words)
+    if keep == "tail":
+        return "… " + " ".join(words[-limit:])
+    return " ".join(words[:limit]) + " …"
+
+
+def _line(row):
+    return f"{_SPEAKERS.get(row.role, row.role)}: {truncate_tokens(row.text, MESSAGE_TOKENS)}"
+
+
+# =====================================================
+# 📝 ROLLING SUMMARY
+# =====================================================
+
+def fold_summary(summary, rows):
+
+    # Old summary + messages leaving the window -> new summary
+    transcript = "\n".join(_line(row) for row in rows)
+    transcript = truncate_tokens(transcript, CONTEXT_TOKENS, keep="tail")
+
+    folded = hf_summarize(summary, transcript)
+
+    if not folded:
+        # Extractive fallback: what the user said carries the facts
+        said = " ".join(row.text for row in rows if row.role == "user")
+        folded = f"{summary} User said: {said}" if summary else f"User said: {said}"
+
+    # Newest facts win when the summary outgrows its budget
+    return truncate_tokens(folded, SUMMARY_TOKENS, keep="tail")
+
+
+# =====================================================
+# 🧱 CONTEXT BUILDER
+# =====================================================
+
+def build_context(chat_session, before_id=None):
+
+    # One keyset read over ix_message_session_id_id, bounded whatever
+    # the history length: only messages newer than the summary
+    query = db.session.query(Message.id, Message.role, Message.text).filter(
+        Message.session_id == chat_session.id
+    )
+
+    if chat_session.summary_through_id:
+        query = query.filter(Message.id > chat_session.summary_through_id)
+    if before_id:
+        query = query.filter(Message.id < before_id)
+
+    rows = query.order_by(Message.id.desc()).limit(CONTEXT_RECENT + SUMMARY_FOLD_MAX).all()
+    rows.reverse()
+
+    recent = rows[-CONTEXT_RECENT:] if CONTEXT_RECENT else []
+    overflow = rows[:len(rows) - len(recent)]
+
+    if len(overflow) >= SUMMARY_REFRESH_EVERY:
+        # Plain attribute writes: flushed with the turn's own commit, so no
+        # transaction is held open across the model calls in between
+        chat_session.summary = fold_summary(chat_session.summary, overflow)
+        chat_session.summary_through_id = overflow[-1].id
+    else:
+        # Not stale yet: unsummarized messages still go in verbatim
+        recent = rows
+
+    return render_context(chat_session.summary, recent)
+
+
+def render_context(summary, rows):
+
+    parts = []
+    budget = CONTEXT_TOKENS
+
+    if summary:
+        summary = truncate_tokens(summary, SUMMARY_TOKENS, keep="tail")
+        budget -= estimate_tokens(summary)
+
+    # Newest first until the budget runs out, then back in order
+    lines = []
+    for row in reversed(rows):
+        line = _line(row)
+        cost = estimate_tokens(line)
+        if cost > budget:
+            break
+        lines.append(line)
+        budget -= cost
+
+    if summary:
+        parts.append(f"Conversation so far: {summary}")
+    parts.extend(reversed(lines))
+
+    return "\n".join(parts)
@@ -0,0 +1,113 @@
+# =====================================================
+# JEEVIKA – Database Engine Tuning
+# Env driven pool / timeout options • SQLite WAL pragmas
+# =====================================================
+
+import os
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
+def _env_bool(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def is_sqlite(database_url):
+    return database_url.startswith("sqlite")
+
+
+# =====================================================
+# ⚙️ ENGINE OPTIONS
+# =====================================================
+
+def engine_options(database_url):
+
+    if is_sqlite(database_url):
+        # busy_timeout is set by pragma below; the driver timeout matches it
+        return {
+            "connect_args": {"timeout": sqlite_settings()["busy_timeout"] / 1000}
+        }
+
+    options = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", 1800)),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", 30)),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True)
+    }
+
+    statement_timeout = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 5000))
+    if statement_timeout and database_url.startswith("postgresql"):
+        options["connect_args"] = {"options": f"-c statement_timeout={statement_timeout}"}
+
+    return options
+
+
+@contextmanager
+def statement_timeout_off(engine):
+
+    # Maintenance (release-step DDL, backfills, exports) legitimately runs
+    # for minutes: lift DB_STATEMENT_TIMEOUT_MS for every connection
+    # checked out meanwhile, then drop them so the app default returns
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+
+    def lift(dbapi_connection, connection_record, connection_proxy):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("SET statement_timeout = 0")
+        cursor.close()
+
+    event.listen(engine, "checkout", lift)
+    try:
+        yield
+    finally:
+        event.remove(engine, "checkout", lift)
+        engine.dispose()
+
+
+# =====================================================
+# 🪶 SQLITE PRAGMAS
+# =====================================================
+
+def sqlite_settings():
+    return {
+        "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+        # Negative = KiB, so -20000 is ~20 MB of page cache per connection
+        "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", -20000))
+    }
+
+
+def install_sqlite_pragmas(engine):
+
+    settings = sqlite_settings()
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in settings.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+# =====================================================
+# 🧾 STARTUP SUMMARY
+# =====================================================
+
+def describe(database_url, options):
+
+    backend = database_url.split(":", 1)[0]
+
+    if is_sqlite(database_url):
+        pragmas = ", ".join(f"{k}={v}" for k, v in sqlite_settings().items())
+        return f"Database {backend}: {pragmas}"
+
+    shown = {k: v for k, v in options.items() if k != "connect_args"}
+    timeout = os.environ.get("DB_STATEMENT_TIMEOUT_MS", "5000")
+    return f"Database {backend}: {shown}, statement_timeout={timeout}ms"
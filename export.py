@@ -0,0 +1,173 @@
+# =====================================================
+# JEEVIKA – Streaming Data Export
+# Server-side cursors • NDJSON / CSV • flat memory
+# =====================================================
+
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+
+from sqlalchemy import select
+
+from models import db, User, ChatSession, Message, HealthData, SymptomEvent, SentimentSample
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", 1000))
+
+
+# =====================================================
+# 🧾 WHAT GETS EXPORTED (COLUMNS ONLY, NO ORM OBJECTS)
+# =====================================================
+
+def _columns(*columns):
+    return {c.key: c for c in columns}
+
+
+EXPORT_TABLES = {
+    "users": (
+        User.id,
+        _columns(
+            User.id, User.name, User.email, User.verified, User.plan,
+            User.subscription_status, User.subscription_start,
+            User.subscription_end, User.created_at
+        )
+    ),
+    "chat_sessions": (
+        ChatSession.user_id,
+        _columns(ChatSession.id, ChatSession.user_id, ChatSession.created_at)
+    ),
+    "messages": (
+        ChatSession.user_id,
+        _columns(
+            Message.id, Message.session_id, ChatSession.user_id, Message.role,
+            Message.text, Message.emotion, Message.timestamp
+        )
+    ),
+    "health_data": (
+        HealthData.user_id,
+        _columns(
+            HealthData.user_id, HealthData.pcos_score, HealthData.pain_score,
+            HealthData.iron_score, HealthData.estrogen_percent,
+            HealthData.progesterone_percent, HealthData.clinical_risk,
+            HealthData.symptoms, HealthData.updated_at
+        )
+    ),
+    "symptom_events": (
+        SymptomEvent.user_id,
+        _columns(SymptomEvent.user_id, SymptomEvent.symptom, SymptomEvent.timestamp)
+    ),
+    "sentiment_samples": (
+        SentimentSample.user_id,
+        _columns(SentimentSample.user_id, SentimentSample.polarity, SentimentSample.timestamp)
+    )
+}
+
+
+def _statement(table, user_id=None):
+
+    owner, columns = EXPORT_TABLES[table]
+    stmt = select(*columns.values())
+
+    if table == "messages":
+        stmt = stmt.join(ChatSession, Message.session_id == ChatSession.id)
+
+    if user_id is not None:
+        stmt = stmt.where(owner == user_id)
+
+    # Primary key order: stable output, and an index walk on every table
+    key = next(iter(columns.values())).table.primary_key.columns
+    return stmt.order_by(*key)
+
+
+def iter_rows(table, user_id=None):
+
+    names = list(EXPORT_TABLES[table][1])
+
+    # yield_per streams through a server-side cursor (Postgres) and keeps
+    # only one batch of plain tuples alive at a time.
+    result = db.session.execute(
+        _statement(table, user_id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+    try:
+        for row in result:
+            yield dict(zip(names, row))
+    finally:
+        result.close()
+
+
+# =====================================================
+# 🖨️ FORMATTERS (CHUNKED)
+# =====================================================
+
+def _plain(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _flat(value):
+    value = _plain(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def stream_ndjson(tables, user_id=None, chunk_rows=None):
+
+    chunk_rows = chunk_rows or EXPORT_BATCH_SIZE
+
+    for table in tables:
+        lines = []
+        for row in iter_rows(table, user_id):
+            row = {k: _plain(v) for k, v in row.items()}
+            lines.append(json.dumps({"type": table, **row}, ensure_ascii=False))
+
+            if len(lines) >= chunk_rows:
+                yield "\n".join(lines) + "\n"
+                lines = []
+
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+
+def stream_csv(table, user_id=None, chunk_rows=None):
+
+    chunk_rows = chunk_rows or EXPORT_BATCH_SIZE
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(list(EXPORT_TABLES[table][1]))
+
+    for i, row in enumerate(iter_rows(table, user_id), 1):
+        writer.writerow([_flat(v) for v in row.values()])
+
+        if i % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_export(fmt, tables, user_id=None):
+
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}")
+
+    unknown = [t for t in tables if t not in EXPORT_TABLES]
+    if unknown:
+        raise ValueError(f"Unknown export table(s): {', '.join(unknown)}")
+
+    if fmt == "csv":
+        # One header per file, so CSV is one table at a time
+        if len(tables) != 1:
+            raise ValueError("CSV export needs exactly one table")
+        return stream_csv(tables[0], user_id)
+
+    return stream_ndjson(tables, user_id)
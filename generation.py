@@ -0,0 +1,360 @@
+# ============================================
+# JEEVIKA – Generation Backends
+# Remote HF • local CPU seq2seq • deterministic stub
+# Concurrent calls grouped into micro-batches
+#
+# Batches only form across threads of one process: run gunicorn with
+# gthread workers (see Procfile.txt), or turn on CHAT_JOB_QUEUE so the job
+# workers feed the batcher. Sync workers handle one request at a time
+# and every batch is size 1. Each worker process also loads its own copy
+# of the local model: size WEB_CONCURRENCY for the RAM that takes.
+# ============================================
+
+import abc
+import importlib.util
+import logging
+import os
+import queue
+import threading
+import time
+import zlib
+from concurrent.futures import Future
+
+log = logging.getLogger("jeevika.generation")
+
+GENERATION_BACKENDS = ("remote", "local", "stub")
+
+# A backend is anything with generate(prompt, parameters) -> str | None,
+# stream(prompt, parameters) -> tokens, stats() -> dict, `configured`
+# and an `on_outcome` callback slot. HFClient is the "remote" one.
+
+
+class BatcherBusy(Exception):
+    pass
+
+
+# ============================================
+# 📦 MICRO-BATCHER
+# ============================================
+
+class MicroBatcher:
+
+    def __init__(self, run_batch, max_batch=8, max_wait=0.01, max_queue=256, name="generation"):
+        # run_batch(prompts, parameters) -> one output per prompt
+        self.run_batch = run_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.name = name
+
+        self._queue = None
+        self._started_pid = None
+        self._start_lock = threading.Lock()
+
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._largest = 0
+        self._queue_wait = 0.0
+
+    def _ensure_started(self):
+
+        # Threads and queue locks don't survive fork: one batcher per process
+        if self._started_pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._started_pid == os.getpid():
+                return
+
+            self._queue = queue.Queue(self.max_queue)
+            threading.Thread(target=self._loop, name=f"{self.name}-batcher", daemon=True).start()
+            self._started_pid = os.getpid()
+
+    def submit(self, prompt, parameters=None):
+
+        self._ensure_started()
+
+        future = Future()
+        try:
+            self._queue.put_nowait((prompt, parameters or {}, future, time.monotonic()))
+        except queue.Full:
+            raise BatcherBusy(f"{self.max_queue} generations already queued")
+
+        return future
+
+    def _collect(self):
+
+        # Block for the first request, then give others max_wait to join
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._collect()
+            started = time.monotonic()
+
+            # One model call per distinct parameter set (sampling settings differ)
+            groups = {}
+            for item in batch:
+                groups.setdefault(tuple(sorted(item[1].items())), []).append(item)
+
+            for items in groups.values():
+                try:
+                    outputs = list(self.run_batch([item[0] for item in items], items[0][1]))
+
+                    # Rows can't be matched to prompts if the counts differ:
+                    # fail them all rather than leave callers waiting
+                    if len(outputs) != len(items):
+                        raise RuntimeError(f"run_batch returned {len(outputs)} outputs for {len(items)} prompts")
+                except Exception as e:
+                    for item in items:
+                        item[2].set_exception(e)
+                    continue
+
+                for item, output in zip(items, outputs):
+                    item[2].set_result(output)
+
+            with self._lock:
+                self._batches += len(groups)
+                self._items += len(batch)
+                self._largest = max(self._largest, len(batch))
+                self._queue_wait += sum(started - item[3] for item in batch)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "batches": self._batches,
+                "batched_items": self._items,
+                "mean_batch_size": round(self._items / self._batches, 2) if self._batches else None,
+                "largest_batch": self._largest,
+                "mean_queue_wait_ms": round(self._queue_wait * 1e3 / self._items, 2) if self._items else None,
+                "queued": self._queue.qsize() if self._queue else 0,
+                "max_batch": self.max_batch,
+                "max_wait_ms": round(self.max_wait * 1e3, 2)
+            }
+
+
+# ============================================
+# 🧱 BATCHED BACKEND BASE
+# ============================================
+
+class BatchedBackend(abc.ABC):
+
+    name = "batched"
+    configured = True
+
+    def __init__(self, max_batch=8, max_wait=0.01, max_queue=256, timeout=30.0):
+        self.timeout = timeout
+        self.batcher = MicroBatcher(self.run_batch, max_batch, max_wait, max_queue, name=self.name)
+
+        # Optional callback(outcome), e.g. a metrics counter
+        self.on_outcome = None
+
+        self._lock = threading.Lock()
+        self._counts = {"success": 0, "failure": 0, "rejected": 0}
+
+    def _count(self, outcome):
+        with self._lock:
+            self._counts[outcome] += 1
+        if self.on_outcome is not None:
+            self.on_outcome(outcome)
+
+    @abc.abstractmethod
+    def run_batch(self, prompts, parameters):
+        # One reply per prompt, in order, from a single model call
+        ...
+
+    def generate(self, prompt, parameters=None):
+
+        try:
+            future = self.batcher.submit(prompt, parameters)
+        except BatcherBusy:
+            self._count("rejected")
+            return None
+
+        try:
+            text = (future.result(timeout=self.timeout) or "").strip()
+        except Exception as e:
+            log.warning("%s generation failed: %s", self.name, e)
+            self._count("failure")
+            return None
+
+        self._count("success" if text else "failure")
+        return text or None
+
+    def stream(self, prompt, parameters=None):
+
+        # Batched decoding finishes all rows together; replay word by word
+        text = self.generate(prompt, parameters)
+        for i, word in enumerate((text or "").split(" ") if text else []):
+            yield word if i == 0 else " " + word
+
+    def stats(self):
+        with self._lock:
+            counts = dict(self._counts)
+        return {"backend": self.name, **self.batcher.stats(), **counts}
+
+
+# ============================================
+# 🖥️ LOCAL CPU SEQ2SEQ (transformers + torch)
+# ============================================
+
+class LocalSeq2SeqBackend(BatchedBackend):
+
+    name = "local"
+
+    def __init__(self, model_name="google/flan-t5-small", threads=None, max_input_tokens=512, **batching):
+        self.model_name = model_name
+        self.threads = threads
+        self.max_input_tokens = max_input_tokens
+
+        self._model = None
+        self._tokenizer = None
+        self._load_lock = threading.Lock()
+        self.load_seconds = None
+        self._importable = None
+
+        super().__init__(**batching)
+
+    @property
+    def configured(self):
+        # Found, not imported: torch stays out of boot (see _load). Without
+        # it every call would fail, so callers get the no-model reply instead.
+        if self._importable is None:
+            self._importable = all(importlib.util.find_spec(m) is not None for m in ("torch", "transformers"))
+            if not self._importable:
+                log.warning("GENERATION_BACKEND=local but torch/transformers are not installed")
+        return self._importable
+
+    def _load(self):
+
+        # Once per process, on first use: keeps torch out of worker boot
+        # and out of a --preload master that is about to fork
+        if self._model is not None:
+            return
+
+        with self._load_lock:
+            if self._model is not None:
+                return
+
+            started = time.monotonic()
+
+            import torch
+            from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+            if self.threads:
+                torch.set_num_threads(self.threads)
+
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+            model.eval()
+
+            self._tokenizer, self._model = tokenizer, model
+            self.load_seconds = time.monotonic() - started
+            log.info("Loaded %s in %.1fs", self.model_name, self.load_seconds)
+
+    def run_batch(self, prompts, parameters):
+
+        self._load()
+
+        import torch
+
+        inputs = self._tokenizer(
+            prompts, return_tensors="pt", padding=True,
+            truncation=True, max_length=self.max_input_tokens
+        )
+
+        temperature = float(parameters.get("temperature", 0) or 0)
+        options = {"max_new_tokens": int(parameters.get("max_new_tokens", 120))}
+        if temperature > 0:
+            options.update(do_sample=True, temperature=temperature)
+
+        with torch.inference_mode():
+            output = self._model.generate(**inputs, **options)
+
+        return self._tokenizer.batch_decode(output, skip_special_tokens=True)
+
+    def stats(self):
+        return {
+            "model": self.model_name,
+            "loaded": self._model is not None,
+            "load_seconds": round(self.load_seconds, 2) if self.load_seconds is not None else None,
+            **super().stats()
+        }
+
+
+# ============================================
+# 🧪 DETERMINISTIC STUB (OFFLINE TESTS + BENCHMARKS)
+# ============================================
+
+STUB_REPLIES = (
+    "I hear you 🤍 How long has this been going on?",
+    "That sounds hard. What helps you feel a little better?",
+    "Thank you for sharing that with me 🤍 Tell me more.",
+    "You're not alone in this. How are you feeling right now?"
+)
+
+
+class StubBackend(BatchedBackend):
+
+    name = "stub"
+
+    def __init__(self, batch_cost=0.0, item_cost=0.0, **batching):
+        # Simulated CPU time: fixed per model call + per row in the batch
+        self.batch_cost = batch_cost
+        self.item_cost = item_cost
+        super().__init__(**batching)
+
+    def run_batch(self, prompts, parameters):
+
+        if self.batch_cost or self.item_cost:
+            time.sleep(self.batch_cost + self.item_cost * len(prompts))
+
+        # Same prompt -> same reply, across processes and runs
+        return [STUB_REPLIES[zlib.crc32(p.encode("utf-8")) % len(STUB_REPLIES)] for p in prompts]
+
+
+# ============================================
+# 🏭 FACTORY
+# ============================================
+
+def build_backend(remote):
+
+    kind = os.environ.get("GENERATION_BACKEND", "remote").lower()
+
+    if kind not in GENERATION_BACKENDS:
+        raise ValueError(f"GENERATION_BACKEND must be one of {', '.join(GENERATION_BACKENDS)}, not {kind!r}")
+
+    if kind == "remote":
+        return remote
+
+    batching = {
+        "max_batch": int(os.environ.get("GEN_MAX_BATCH", 8)),
+        "max_wait": float(os.environ.get("GEN_MAX_WAIT_MS", 10)) / 1000,
+        "max_queue": int(os.environ.get("GEN_MAX_QUEUE", 256)),
+        "timeout": float(os.environ.get("GEN_TIMEOUT", 30))
+    }
+
+    if kind == "stub":
+        return StubBackend(
+            batch_cost=float(os.environ.get("STUB_BATCH_MS", 0)) / 1000,
+            item_cost=float(os.environ.get("STUB_ITEM_MS", 0)) / 1000,
+            **batching
+        )
+
+    return LocalSeq2SeqBackend(
+        os.environ.get("LOCAL_MODEL", "google/flan-t5-small"),
+        threads=int(os.environ.get("GEN_THREADS", 0)) or None,
+        max_input_tokens=int(os.environ.get("GEN_MAX_INPUT_TOKENS", 512)),
+        **batching
+    )
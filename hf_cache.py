@@ -0,0 +1,190 @@
+# ============================================
+# JEEVIKA – HF Fallback Reply Cache
+# Normalized keys • LRU + TTL • Memory or shared SQLite
+# ============================================
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# ============================================
+# 🔑 PROMPT NORMALIZATION
+# ============================================
+
+# The cache is shared across users, so a key may only drop what can't
+# change the meaning: case, spacing, punctuation and pure filler. Word
+# order, pronouns and negations stay ("my sister has pcos, not me").
+FILLER_WORDS = {"um", "uh", "umm", "hmm", "hey", "hi", "hello", "please", "pls", "plz", "ok", "okay", "well"}
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def normalize_prompt(text):
+    words = _WORD.findall((text or "").lower().replace("\u2019", "'"))
+    return " ".join(w for w in words if w not in FILLER_WORDS)
+
+
+# ============================================
+# 🧠 IN-PROCESS BACKEND
+# ============================================
+
+class MemoryBackend:
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, ttl):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            value, stored_at = entry
+            if time.time() - stored_at > ttl:
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.time())
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+# ============================================
+# 🗄️ SHARED SQLITE BACKEND (ALL WORKERS)
+# ============================================
+
+class SQLiteBackend:
+
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+
+        # No connection here: the cache is built at import, and a
+        # gunicorn --preload master would hand it to every forked worker
+
+    def _conn(self):
+        pid = os.getpid()
+        cached = getattr(self._local, "conn", None)
+
+        # A connection inherited across fork must not be reused
+        if cached is None or cached[0] != pid:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hf_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " used_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_hf_cache_used_at ON hf_cache (used_at)")
+            cached = (pid, conn)
+            self._local.conn = cached
+
+        return cached[1]
+
+    def get(self, key, ttl):
+        conn = self._conn()
+        now = time.time()
+
+        row = conn.execute(
+            "SELECT value, stored_at FROM hf_cache WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        if now - row[1] > ttl:
+            conn.execute("DELETE FROM hf_cache WHERE key = ?", (key,))
+            return None
+
+        conn.execute("UPDATE hf_cache SET used_at = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def set(self, key, value):
+        conn = self._conn()
+        now = time.time()
+
+        conn.execute(
+            "INSERT OR REPLACE INTO hf_cache (key, value, stored_at, used_at) VALUES (?, ?, ?, ?)",
+            (key, value, now, now)
+        )
+        conn.execute(
+            "DELETE FROM hf_cache WHERE key IN ("
+            " SELECT key FROM hf_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def __len__(self):
+        return self._conn().execute("SELECT COUNT(*) FROM hf_cache").fetchone()[0]
+
+
+# ============================================
+# 📦 RESPONSE CACHE
+# ============================================
+
+class ResponseCache:
+
+    def __init__(self, backend, ttl=3600):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, prompt):
+        key = normalize_prompt(prompt)
+        value = self.backend.get(key, self.ttl) if key else None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    def set(self, prompt, value):
+        key = normalize_prompt(prompt)
+        if key:
+            self.backend.set(key, value)
+
+    def stats(self):
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+def build_cache():
+
+    kind = os.environ.get("HF_CACHE_BACKEND", "memory").lower()
+    size = int(os.environ.get("HF_CACHE_SIZE", 1024))
+    ttl = float(os.environ.get("HF_CACHE_TTL", 3600))
+
+    if kind in ("off", "none", ""):
+        return None
+
+    if kind == "sqlite":
+        backend = SQLiteBackend(os.environ.get("HF_CACHE_PATH", "hf_cache.db"), size)
+    else:
+        backend = MemoryBackend(size)
+
+    return ResponseCache(backend, ttl)
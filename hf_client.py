@@ -0,0 +1,274 @@
+# ============================================
+# JEEVIKA – Hugging Face Inference Client
+# Pooled connections • Bounded concurrency • Circuit breaker
+# ============================================
+
+import json
+import logging
+import threading
+import time
+
+log = logging.getLogger("jeevika.hf")
+
+
+# ============================================
+# ⚡ CIRCUIT BREAKER
+# ============================================
+
+class CircuitBreaker:
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self):
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            # HALF_OPEN: let exactly one trial call through
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    log.warning("HF circuit opened after %s failures", self._failures)
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def cancel(self):
+        # The call never reached the remote; free the half-open trial slot
+        with self._lock:
+            self._trial_in_flight = False
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def failures(self):
+        return self._failures
+
+
+# ============================================
+# 🤖 INFERENCE CLIENT
+# ============================================
+
+class HFClient:
+
+    def __init__(
+        self,
+        url,
+        api_key=None,
+        connect_timeout=3.0,
+        read_timeout=10.0,
+        max_concurrency=4,
+        acquire_timeout=0.5,
+        pool_size=10,
+        breaker=None
+    ):
+        self.url = url
+        self.api_key = api_key
+        self.timeout = (connect_timeout, read_timeout)
+        self.acquire_timeout = acquire_timeout
+        self.pool_size = pool_size
+
+        # Built on first call: requests is a slow import and most turns
+        # are answered by the rule engines
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        self.max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self.breaker = breaker or CircuitBreaker()
+
+        # Optional callback(outcome), e.g. a metrics counter
+        self.on_outcome = None
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._counts = {
+            "success": 0,
+            "failure": 0,
+            "short_circuited": 0,
+            "rejected": 0
+        }
+
+    @property
+    def configured(self):
+        return bool(self.api_key)
+
+    @property
+    def session(self):
+
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    if self.api_key:
+                        session.headers["Authorization"] = f"Bearer {self.api_key}"
+
+                    self._session = session
+
+        return self._session
+
+    def _count(self, outcome):
+        with self._lock:
+            self._counts[outcome] += 1
+        if self.on_outcome is not None:
+            self.on_outcome(outcome)
+
+    def generate(self, prompt, parameters=None):
+
+        if not self.breaker.allow():
+            self._count("short_circuited")
+            return None
+
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            self._count("rejected")
+            self.breaker.cancel()
+            return None
+
+        with self._lock:
+            self._in_flight += 1
+
+        try:
+            response = self.session.post(
+                self.url,
+                json={"inputs": prompt, "parameters": parameters or {}},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            result = response.json()
+            text = result[0]["generated_text"].strip()
+
+        except Exception as e:
+            log.warning("HF request failed: %s", e)
+            self.breaker.record_failure()
+            self._count("failure")
+            return None
+
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+        self.breaker.record_success()
+        self._count("success")
+        return text
+
+    def stream(self, prompt, parameters=None):
+
+        if not self.breaker.allow():
+            self._count("short_circuited")
+            return
+
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            self._count("rejected")
+            self.breaker.cancel()
+            return
+
+        with self._lock:
+            self._in_flight += 1
+
+        response = None
+        outcome = None
+
+        try:
+            response = self.session.post(
+                self.url,
+                json={"inputs": prompt, "parameters": parameters or {}, "stream": True},
+                timeout=self.timeout,
+                stream=True
+            )
+            response.raise_for_status()
+
+            if response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                # text-generation-inference style: data: {"token": {"text": ...}}
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    token = json.loads(line[5:]).get("token") or {}
+                    if token.get("text") and not token.get("special"):
+                        yield token["text"]
+            else:
+                # Endpoint ignored "stream"; replay the full text word by word
+                text = response.json()[0]["generated_text"].strip()
+                for i, word in enumerate(text.split(" ")):
+                    yield word if i == 0 else " " + word
+
+            outcome = "success"
+
+        except Exception as e:
+            log.warning("HF stream failed: %s", e)
+            outcome = "failure"
+
+        finally:
+            if response is not None:
+                response.close()
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+            if outcome == "success":
+                self.breaker.record_success()
+            elif outcome == "failure":
+                self.breaker.record_failure()
+            else:
+                # Consumer hung up mid-stream; not the remote's fault
+                self.breaker.cancel()
+
+            if outcome:
+                self._count(outcome)
+
+    def stats(self):
+        with self._lock:
+            counts = dict(self._counts)
+            in_flight = self._in_flight
+
+        return {
+            "backend": "remote",
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "in_flight": in_flight,
+            "max_concurrency": self.max_concurrency,
+            **counts
+        }
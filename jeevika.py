@@ -3,24 +3,55 @@
 # Emotion First • Medically Responsible • Production Safe
 # ============================================
 
-import requests
+import copy
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from time import perf_counter
+
+from hf_cache import build_cache
+from hf_client import HFClient, CircuitBreaker
+from generation import build_backend
+from rules import RuleBook, DEFAULT_PACK, GOLDEN_CORPUS, scan_with
+from sentiment import polarity as score_polarity
+
+HF_API_URL = "https://api-inference.huggingface.co/models/google/flan-t5-large"
+HF_API_KEY = os.environ.get("HF_API_KEY")
+
+HF_CLIENT = HFClient(
+    HF_API_URL,
+    api_key=HF_API_KEY,
+    connect_timeout=float(os.environ.get("HF_CONNECT_TIMEOUT", 3)),
+    read_timeout=float(os.environ.get("HF_READ_TIMEOUT", 10)),
+    max_concurrency=int(os.environ.get("HF_MAX_CONCURRENCY", 4)),
+    pool_size=int(os.environ.get("HF_POOL_SIZE", 10)),
+    breaker=CircuitBreaker(
+        failure_threshold=int(os.environ.get("HF_BREAKER_THRESHOLD", 5)),
+        reset_timeout=float(os.environ.get("HF_BREAKER_RESET", 30))
+    )
+)
+
+# What hf_reply generates with: HF_CLIENT unless GENERATION_BACKEND
+# picks the local CPU model or the offline stub (see generation.py)
+GENERATOR = build_backend(HF_CLIENT)
+
+HF_CACHE = build_cache()
 
 # ============================================
-# SAFE TEXTBLOB IMPORT
+# 📚 RULE PACK (PHRASES + WEIGHTS)
 # ============================================
 
-try:
-    from textblob import TextBlob
-    TEXTBLOB_AVAILABLE = True
-except:
-    TEXTBLOB_AVAILABLE = False
+# RULES is built at the bottom of this module: the pack is verified
+# against the golden corpus at boot, which needs the engine below.
 
 
-HF_API_URL = "https://api-inference.huggingface.co/models/google/flan-t5-large"
-HF_API_KEY = os.environ.get("HF_API_KEY")
-HEADERS = {"Authorization": f"Bearer {HF_API_KEY}"} if HF_API_KEY else {}
+def scan(text, table=None):
+    return scan_with(table or RULES.current(), text)
+
+
+def emotion_emoji(key):
+    return RULES.current().emoji_map.get(key, "🤍")
+
 
 # ============================================
 # 🧠 MEMORY INITIALIZER
@@ -28,7 +59,8 @@ HEADERS = {"Authorization": f"Bearer {HF_API_KEY}"} if HF_API_KEY else {}
 
 def initialize_memory(memory):
 
-    if not memory:
+    # Fill an empty dict in place: batch replays share one dict per history
+    if memory is None:
         memory = {}
 
     defaults = {
@@ -56,15 +88,18 @@ def initialize_memory(memory):
 # 📊 SENTIMENT ENGINE
 # ============================================
 
-def sentiment_engine(memory, text):
+def sentiment_polarity(text):
+
+    try:
+        return score_polarity(text)
+    except:
+        return 0
+
 
-    polarity = 0
+def sentiment_engine(memory, text, polarity=None):
 
-    if TEXTBLOB_AVAILABLE:
-        try:
-            polarity = TextBlob(text).sentiment.polarity
-        except:
-            polarity = 0
+    if polarity is None:
+        polarity = sentiment_polarity(text)
 
     memory["sentiment_history"].append(round(polarity, 3))
     memory["sentiment_history"] = memory["sentiment_history"][-50:]
@@ -76,16 +111,10 @@ def sentiment_engine(memory, text):
 # 🚨 CRISIS DETECTION
 # ============================================
 
-def crisis_detection(text):
-    text = text.lower()
+def crisis_detection(text, matches=None):
+    matches = matches or scan(text)
 
-    crisis_words = [
-        "kill myself", "suicide",
-        "end my life", "self harm",
-        "i want to die"
-    ]
-
-    if any(w in text for w in crisis_words):
+    if matches.has_any(matches.table.crisis_words):
         return (
             "I’m really concerned about you 🤍\n\n"
             "You deserve immediate support.\n"
@@ -100,18 +129,10 @@ def crisis_detection(text):
 # 🩺 RED FLAG DETECTION
 # ============================================
 
-def red_flag_detection(text):
-    text = text.lower()
-
-    red_flags = [
-        "sharp right lower pain",
-        "severe one sided pelvic pain",
-        "sudden severe abdominal pain",
-        "fainting with pain",
-        "vomiting with severe pain"
-    ]
+def red_flag_detection(text, matches=None):
+    matches = matches or scan(text)
 
-    if any(r in text for r in red_flags):
+    if matches.has_any(matches.table.red_flags):
         return (
             "⚠️ This may require urgent medical care.\n\n"
             "Please seek emergency attention immediately."
@@ -124,19 +145,11 @@ def red_flag_detection(text):
 # 📈 PAIN ENGINE
 # ============================================
 
-def pain_engine(memory, text):
-    text = text.lower()
+def pain_engine(memory, text, matches=None):
+    matches = matches or scan(text)
 
-    levels = {
-        "unbearable": 9,
-        "very severe": 8,
-        "severe": 7,
-        "moderate": 5,
-        "mild": 3
-    }
-
-    for word, score in levels.items():
-        if word in text:
+    for word, score in matches.table.pain_levels:
+        if word in matches:
             memory["pain_score"] = max(memory["pain_score"], score)
 
     return memory
@@ -146,21 +159,11 @@ def pain_engine(memory, text):
 # 📊 PCOS ENGINE
 # ============================================
 
-def update_pcos(memory, text):
-    text = text.lower()
+def update_pcos(memory, text, matches=None):
+    matches = matches or scan(text)
 
-    symptom_map = {
-        "irregular periods": 2,
-        "missed period": 2,
-        "hair fall": 1,
-        "acne": 1,
-        "weight gain": 1,
-        "belly fat": 1,
-        "mood swings": 1
-    }
-
-    for symptom, value in symptom_map.items():
-        if symptom in text and symptom not in memory["symptoms"]:
+    for symptom, value in matches.table.pcos_symptoms:
+        if symptom in matches and symptom not in memory["symptoms"]:
 
             memory["symptoms"].append(symptom)
             memory["pcos_score"] += value
@@ -179,21 +182,16 @@ def update_pcos(memory, text):
 # 🧬 IRON ENGINE
 # ============================================
 
-def iron_engine(memory, text):
-    text = text.lower()
+def iron_engine(memory, text, matches=None):
+    matches = matches or scan(text)
 
-    iron_symptoms = [
-        "fatigue",
-        "tired all the time",
-        "pale skin",
-        "dizziness"
-    ]
+    table = matches.table
 
-    for s in iron_symptoms:
-        if s in text:
-            memory["iron_score"] = min(memory["iron_score"] + 1, 5)
+    for s in table.iron_symptoms:
+        if s in matches:
+            memory["iron_score"] = min(memory["iron_score"] + 1, table.iron_max)
 
-    if memory["iron_score"] >= 3:
+    if memory["iron_score"] >= table.iron_alert:
         return (
             "Some of your symptoms *could* be linked to low iron levels 🤍\n\n"
             "You may consider checking hemoglobin and ferritin levels with a doctor."
@@ -206,18 +204,13 @@ def iron_engine(memory, text):
 # 🧬 HORMONE PROBABILITY (SOFT)
 # ============================================
 
-def hormone_probability(memory):
+def hormone_probability(memory, table=None):
 
-    estrogen = 0
-    progesterone = 0
+    table = table or RULES.current()
     s = memory["symptoms"]
 
-    if "weight gain" in s: estrogen += 2
-    if "belly fat" in s: estrogen += 2
-    if "acne" in s: estrogen += 1
-
-    if "irregular periods" in s: progesterone += 2
-    if "mood swings" in s: progesterone += 1
+    estrogen = sum(w for symptom, w in table.estrogen_weights if symptom in s)
+    progesterone = sum(w for symptom, w in table.progesterone_weights if symptom in s)
 
     total = estrogen + progesterone
 
@@ -235,17 +228,20 @@ def hormone_probability(memory):
 # 🏥 CLINICAL RISK (INTERNAL ONLY)
 # ============================================
 
-def clinical_risk(memory):
+def clinical_risk(memory, table=None):
+
+    table = table or RULES.current()
+    pcos_weight, pain_weight, iron_weight = table.risk_weights
 
     score = (
-        memory["pcos_score"] * 2 +
-        memory["pain_score"] +
-        memory["iron_score"]
+        memory["pcos_score"] * pcos_weight +
+        memory["pain_score"] * pain_weight +
+        memory["iron_score"] * iron_weight
     )
 
-    if score >= 15:
+    if score >= table.risk_high:
         memory["clinical_risk_level"] = "HIGH"
-    elif score >= 8:
+    elif score >= table.risk_moderate:
         memory["clinical_risk_level"] = "MODERATE"
     else:
         memory["clinical_risk_level"] = "LOW"
@@ -257,30 +253,30 @@ def clinical_risk(memory):
 # 🧠 THERAPIST ENGINE (EMOTION FIRST)
 # ============================================
 
-def therapist_deepening(memory, text):
+THERAPIST_REPLIES = {
+    "stress": "Stress can feel overwhelming 🤍 What’s causing the most pressure right now?",
+    "anxiety": "Anxiety can make everything feel urgent 🤍 What thoughts are racing?",
+    "lonely": "Feeling alone can feel heavy 🤍 What feels most isolating?",
+    "sad": "What thought keeps replaying when you feel this sadness?"
+}
 
-    text = text.lower()
 
-    if memory["emotional_depth_level"] < 10:
-        memory["emotional_depth_level"] += 1
+def therapist_deepening(memory, text, matches=None):
 
-    if "stress" in text:
-        memory["last_topic"] = "stress"
-        return "Stress can feel overwhelming 🤍 What’s causing the most pressure right now?"
+    matches = matches or scan(text)
+    table = matches.table
 
-    if "anxiety" in text:
-        memory["last_topic"] = "anxiety"
-        return "Anxiety can make everything feel urgent 🤍 What thoughts are racing?"
-
-    if "alone" in text or "lonely" in text:
-        memory["last_topic"] = "lonely"
-        return "Feeling alone can feel heavy 🤍 What feels most isolating?"
+    if memory["emotional_depth_level"] < table.max_depth:
+        memory["emotional_depth_level"] += 1
 
-    if "sad" in text:
-        memory["last_topic"] = "sad"
-        return "What thought keeps replaying when you feel this sadness?"
+    for topic, phrases in table.therapist_topics:
+        if matches.has_any(phrases):
+            memory["last_topic"] = topic
+            return THERAPIST_REPLIES.get(
+                topic, "That sounds like a lot to carry 🤍 Tell me more about it?"
+            )
 
-    if memory["emotional_depth_level"] >= 4 and memory["last_topic"]:
+    if memory["emotional_depth_level"] >= table.reflect_depth and memory["last_topic"]:
         return (
             "Let’s gently reflect on that 🤍\n"
             "What evidence supports this thought — and what challenges it?"
@@ -289,94 +285,390 @@ def therapist_deepening(memory, text):
     return None
 
 
+# ============================================
+# 🎭 SIMPLE EMOTION
+# ============================================
+
+def detect_simple_emotion(text, matches=None):
+    matches = matches or scan(text)
+
+    for key in matches.table.emoji_map:
+        if key in matches:
+            return key
+    return "neutral"
+
+
 # ============================================
 # 🤖 HF FALLBACK
 # ============================================
 
-def hf_reply(user_input):
+HF_PARAMETERS = {"max_new_tokens": 120, "temperature": 0.6}
 
-    if not HF_API_KEY:
-        return "I’m here with you 🤍 Can you tell me more about what you're experiencing?"
+NO_KEY_REPLY = "I’m here with you 🤍 Can you tell me more about what you're experiencing?"
+FALLBACK_REPLY = "Tell me more about that 🤍"
 
-    prompt = (
+
+class ReplyUnavailable(Exception):
+    # Model failed or its breaker is open; raised instead of the canned
+    # reply when the caller can retry later (the job queue)
+    pass
+
+
+def _hf_prompt(user_input, context=None):
+    # context: rolling summary + recent turns from conversation.build_context
+    return (
         "You are JEEVIKA, a calm, empathetic women's health AI.\n"
         "Be supportive, short, human.\n\n"
-        f"User: {user_input}"
+        + (f"{context}\n" if context else "")
+        + f"User: {user_input}"
     )
 
-    payload = {
-        "inputs": prompt,
-        "parameters": {"max_new_tokens": 120, "temperature": 0.6}
+
+def _hf_cacheable(matches):
+    # Safety-critical messages always go to the model fresh
+    return HF_CACHE is not None and not (
+        matches.has_any(matches.table.crisis_words) or
+        matches.has_any(matches.table.red_flags)
+    )
+
+
+def hf_reply(user_input, matches=None, context=None, strict=False):
+
+    if not GENERATOR.configured:
+        return NO_KEY_REPLY
+
+    matches = matches or scan(user_input)
+    # Cached replies were generated without history: a turn with context
+    # neither reads nor writes the shared cache
+    cacheable = not context and _hf_cacheable(matches)
+
+    if cacheable:
+        cached = HF_CACHE.get(user_input)
+        if cached is not None:
+            return cached
+
+    reply = GENERATOR.generate(_hf_prompt(user_input, context), HF_PARAMETERS)
+
+    if reply:
+        if cacheable:
+            HF_CACHE.set(user_input, reply)
+        return reply
+
+    if strict:
+        raise ReplyUnavailable("No reply from the generation backend")
+
+    return FALLBACK_REPLY
+
+
+def hf_reply_stream(user_input, matches=None, context=None):
+
+    if not GENERATOR.configured:
+        yield NO_KEY_REPLY
+        return
+
+    matches = matches or scan(user_input)
+    # Cached replies were generated without history: a turn with context
+    # neither reads nor writes the shared cache
+    cacheable = not context and _hf_cacheable(matches)
+
+    if cacheable:
+        cached = HF_CACHE.get(user_input)
+        if cached is not None:
+            yield cached
+            return
+
+    parts = []
+    for token in GENERATOR.stream(_hf_prompt(user_input, context), HF_PARAMETERS):
+        parts.append(token)
+        yield token
+
+    reply = "".join(parts).strip()
+
+    if not reply:
+        yield FALLBACK_REPLY
+    elif cacheable:
+        HF_CACHE.set(user_input, reply)
+
+
+SUMMARY_PARAMETERS = {"max_new_tokens": 96, "temperature": 0.2}
+
+
+def hf_summarize(summary, transcript):
+
+    # None = no key / model unavailable; the caller keeps an extractive summary
+    if not GENERATOR.configured:
+        return None
+
+    prompt = (
+        "Summarize this conversation between a user and JEEVIKA, a women's health assistant, "
+        "in at most three sentences. Keep symptoms, feelings and advice given.\n\n"
+        + (f"Earlier summary: {summary}\n\n" if summary else "")
+        + transcript
+    )
+
+    return GENERATOR.generate(prompt, SUMMARY_PARAMETERS)
+
+
+def hf_status():
+    return {
+        "configured": GENERATOR.configured,
+        "cache": HF_CACHE.stats() if HF_CACHE else None,
+        **GENERATOR.stats()
     }
 
-    try:
-        response = requests.post(
-            HF_API_URL,
-            headers=HEADERS,
-            json=payload,
-            timeout=30
-        )
-        result = response.json()
 
-        if isinstance(result, list) and "generated_text" in result[0]:
-            return result[0]["generated_text"].strip()
+# ============================================
+# ⏱️ STAGE OBSERVER (OPTIONAL METRICS HOOK)
+# ============================================
+
+# Anything with stage(name, seconds) and answered(name); None = no overhead
+STAGE_OBSERVER = None
+
+
+def set_stage_observer(observer):
+    global STAGE_OBSERVER
+    STAGE_OBSERVER = observer
 
-    except:
-        pass
 
-    return "Tell me more about that 🤍"
+def _stage(name, fn, *args):
+
+    if STAGE_OBSERVER is None:
+        return fn(*args)
+
+    start = perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        STAGE_OBSERVER.stage(name, perf_counter() - start)
+
+
+def _answered(name, reply, memory):
+    if STAGE_OBSERVER is not None:
+        STAGE_OBSERVER.answered(name)
+    return reply, memory
 
 
 # ============================================
 # 🌿 MAIN ROUTER (BALANCED + SAFE)
 # ============================================
 
-def get_jeevika_response(user_input, memory):
+def get_jeevika_response(user_input, memory, context_fn=None):
+    # context_fn() builds the HF prompt context; only called on fallback
+    return _route(
+        user_input, memory,
+        _stage("scan", scan, user_input),
+        _stage("sentiment", sentiment_polarity, user_input),
+        context_fn
+    )
+
+
+def get_rule_response(user_input, memory):
+    # Same pipeline without the HF fallback: reply is None when no rule answered
+    return _rules(
+        user_input, memory,
+        _stage("scan", scan, user_input),
+        _stage("sentiment", sentiment_polarity, user_input)
+    )
+
+
+def _route(user_input, memory, matches, polarity, context_fn=None):
+
+    reply, memory = _rules(user_input, memory, matches, polarity)
+
+    if reply is None:
+        context = _stage("context", context_fn) if context_fn else None
+        reply = _stage("hf_fallback", hf_reply, user_input, matches, context)
+        return _answered("hf_fallback", reply, memory)
+
+    return reply, memory
+
+
+def _rules(user_input, memory, matches, polarity):
 
     memory = initialize_memory(memory)
-    memory = sentiment_engine(memory, user_input)
+    memory = sentiment_engine(memory, user_input, polarity)
 
-    crisis = crisis_detection(user_input)
+    crisis = _stage("crisis", crisis_detection, user_input, matches)
     if crisis:
-        return crisis, memory
+        return _answered("crisis", crisis, memory)
 
-    emergency = red_flag_detection(user_input)
+    emergency = _stage("red_flag", red_flag_detection, user_input, matches)
     if emergency:
-        return emergency, memory
+        return _answered("red_flag", emergency, memory)
 
-    memory = pain_engine(memory, user_input)
-    if memory["pain_score"] >= 8:
-        return (
+    table = matches.table
+
+    memory = _stage("pain", pain_engine, memory, user_input, matches)
+    if memory["pain_score"] >= table.pain_alert:
+        return _answered("pain", (
             "That pain sounds quite intense 🤍\n\n"
             "It would be safest to consult a doctor soon."
-        ), memory
+        ), memory)
 
-    memory = update_pcos(memory, user_input)
+    memory = _stage("pcos", update_pcos, memory, user_input, matches)
 
-    iron = iron_engine(memory, user_input)
+    iron = _stage("iron", iron_engine, memory, user_input, matches)
     if iron:
-        return iron, memory
+        return _answered("iron", iron, memory)
 
-    memory = hormone_probability(memory)
-    memory = clinical_risk(memory)
+    memory = _stage("hormone", hormone_probability, memory, table)
+    memory = _stage("risk", clinical_risk, memory, table)
 
-    emotional = therapist_deepening(memory, user_input)
+    emotional = _stage("therapist", therapist_deepening, memory, user_input, matches)
     if emotional:
-        return emotional, memory
+        return _answered("therapist", emotional, memory)
 
     # Only show hormone insight if clearly health-related
-    health_keywords = [
-        "period", "pcos", "hormone",
-        "cycle", "irregular", "acne",
-        "hair fall", "weight gain"
-    ]
-
-    if any(word in user_input.lower() for word in health_keywords):
-        if memory["pcos_score"] >= 3:
-            return (
+    if matches.has_any(table.health_keywords):
+        if memory["pcos_score"] >= table.pcos_insight:
+            return _answered("hormone_insight", (
                 "There may be signs of hormonal imbalance based on what you've shared 🤍\n\n"
                 "This isn’t a diagnosis — only proper medical tests can confirm.\n\n"
                 "Would you like gentle lifestyle guidance to support hormone balance?"
-            ), memory
+            ), memory)
+
+    return None, memory
+
+
+# ============================================
+# 📦 BATCH ROUTER (BULK RE-SCORING)
+# ============================================
+
+def get_jeevika_responses_batch(inputs, memories=None, processes=None, chunk_size=2000, generate=False):
+
+    # Rules only by default: re-scoring a stored history is about memory
+    # and weights, and a million messages must not become a million model
+    # calls. Unanswered messages come back with reply None, as from
+    # get_rule_response; generate=True adds the fallback reply like
+    # get_jeevika_response does.
+    inputs = list(inputs)
+    memories = list(memories) if memories is not None else [None] * len(inputs)
+
+    if len(memories) != len(inputs):
+        raise ValueError("inputs and memories must have the same length")
+
+    if processes and processes > 1 and len(inputs) > chunk_size:
+        return _batch_in_pool(inputs, memories, processes, chunk_size, generate)
+
+    return _batch_serial(inputs, memories, generate)
+
+
+def _batch_serial(inputs, memories, generate=False):
+
+    # Repeated texts (greetings, common symptoms) are scanned and scored once,
+    # all against the same rule pack even if it reloads mid-batch
+    table = RULES.current()
+    matches = {}
+    polarity = {}
+    for text in inputs:
+        if text not in matches:
+            matches[text] = scan(text, table)
+            polarity[text] = sentiment_polarity(text)
+
+    route = _route if generate else _rules
+
+    results = []
+    for text, memory in zip(inputs, memories):
+        results.append(route(text, memory, matches[text], polarity[text]))
+
+    return results
+
+
+def _batch_in_pool(inputs, memories, processes, chunk_size, generate=False):
+
+    # Pairs sharing one memory dict replay a single history, so they must
+    # stay together (and in order) inside the same chunk.
+    groups = {}
+    for i, memory in enumerate(memories):
+        key = id(memory) if memory is not None else ("solo", i)
+        groups.setdefault(key, []).append(i)
+
+    chunks = [[]]
+    for indices in groups.values():
+        if chunks[-1] and len(chunks[-1]) + len(indices) > chunk_size:
+            chunks.append([])
+        chunks[-1].extend(indices)
+
+    results = [None] * len(inputs)
+
+    # Under the spawn start method (macOS, Windows) every worker re-imports
+    # this module, building its own HF client, reply cache and generator.
+    # They are cheap until used (no connection, model or requests import),
+    # and rules-only runs never use them.
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        jobs = [
+            (
+                indices,
+                pool.submit(
+                    _batch_serial,
+                    [inputs[i] for i in indices],
+                    [memories[i] for i in indices],
+                    generate
+                )
+            )
+            for indices in chunks
+        ]
+
+        for indices, job in jobs:
+            for i, result in zip(indices, job.result()):
+                results[i] = result
+
+    return results
+
+
+# ============================================
+# 🥇 GOLDEN CORPUS (RULE PACK ROLLBACK CHECK)
+# ============================================
+
+def _golden_outcome(table, case):
+
+    matches = scan(case["text"], table)
+    reply, memory = _rules(case["text"], copy.deepcopy(case.get("memory") or {}), matches, 0.0)
+
+    return {
+        "reply": reply,
+        "symptoms": memory["symptoms"],
+        "pcos_score": memory["pcos_score"],
+        "pain_score": memory["pain_score"],
+        "iron_score": memory["iron_score"],
+        "estrogen_percent": memory["estrogen_percent"],
+        "progesterone_percent": memory["progesterone_percent"],
+        "emotional_depth_level": memory["emotional_depth_level"],
+        "last_topic": memory["last_topic"],
+        "clinical_risk_level": memory["clinical_risk_level"],
+        "emotion": detect_simple_emotion(case["text"], matches)
+    }
+
+
+def verify_golden(table, cases):
+
+    mismatches = []
+    for case in cases:
+        actual = _golden_outcome(table, case)
+        if actual != case["expected"]:
+            mismatches.append({"text": case["text"], "expected": case["expected"], "actual": actual})
+
+    return mismatches
+
+
+def build_golden(texts_and_memories, table=None):
+
+    table = table or RULES.current()
+    cases = []
+    for text, memory in texts_and_memories:
+        case = {"text": text, "memory": memory}
+        case["expected"] = _golden_outcome(table, case)
+        cases.append(case)
+
+    return {"version": table.version, "cases": cases}
+
 
-    return hf_reply(user_input), memory
+# RULE_BOOT_VERIFY=0 only for `flask rules-golden` after an intended
+# behaviour change, when the pack no longer matches the recorded corpus
+RULES = RuleBook(
+    os.environ.get("RULE_PACK", DEFAULT_PACK),
+    golden_path=os.environ.get("RULE_GOLDEN", GOLDEN_CORPUS),
+    check_interval=float(os.environ.get("RULE_RELOAD_INTERVAL", 2)),
+    verifier=verify_golden,
+    verify_at_boot=os.environ.get("RULE_BOOT_VERIFY", "1").lower() in ("1", "true", "yes", "on")
+)
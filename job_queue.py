@@ -0,0 +1,349 @@
+# =====================================================
+# JEEVIKA – Background Job Queue
+# SQLite table • worker threads • retries • dead letters
+# =====================================================
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+log = logging.getLogger("jeevika.jobs")
+
+PENDING = "PENDING"
+RUNNING = "RUNNING"
+DONE = "DONE"
+DEAD = "DEAD"
+
+
+class JobQueue:
+
+    def __init__(
+        self,
+        path,
+        workers=2,
+        max_attempts=3,
+        retry_backoff=2.0,
+        poll_interval=0.25,
+        stale_after=300
+    ):
+        self.path = path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+
+        self.app = None
+        self._handlers = {}
+        self._on_dead = {}
+        self._local = threading.local()
+        self._started_pid = None
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+
+        # Claim tokens of the jobs this process is running right now
+        self._running = set()
+        self._running_lock = threading.Lock()
+
+        # No connection here: the queue is built with the app, and a
+        # gunicorn --preload master would hand it to every forked worker
+        self._schema_pid = None
+        self._schema_lock = threading.Lock()
+
+    # -------------------------------------------------
+    # 🔌 CONNECTIONS (per thread, per process)
+    # -------------------------------------------------
+
+    def _conn(self):
+        pid = os.getpid()
+        cached = getattr(self._local, "conn", None)
+
+        # A connection inherited across fork must not be reused
+        if cached is None or cached[0] != pid:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._ensure_schema(conn, pid)
+            self._local.conn = cached = (pid, conn)
+
+        return cached[1]
+
+    def _ensure_schema(self, conn, pid):
+
+        # Once per process, by whichever thread connects first
+        with self._schema_lock:
+            if self._schema_pid == pid:
+                return
+
+            self._create_tables(conn)
+            self._schema_pid = pid
+
+    def _create_tables(self, conn):
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " kind TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " max_attempts INTEGER NOT NULL,"
+            " result TEXT,"
+            " last_error TEXT,"
+            " run_after REAL NOT NULL,"
+            " claim TEXT,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_jobs_status_run_after ON jobs (status, run_after)")
+
+        # Queue files created before claim tokens
+        if "claim" not in {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}:
+            conn.execute("ALTER TABLE jobs ADD COLUMN claim TEXT")
+
+    # -------------------------------------------------
+    # 📥 PRODUCER SIDE
+    # -------------------------------------------------
+
+    def register(self, kind, handler, on_dead=None):
+        # on_dead(payload, error) runs once when retries run out; what it
+        # returns is stored as the job's result
+        self._handlers[kind] = handler
+        if on_dead is not None:
+            self._on_dead[kind] = on_dead
+
+    def enqueue(self, kind, payload):
+        now = time.time()
+        cursor = self._conn().execute(
+            "INSERT INTO jobs (kind, payload, status, max_attempts, run_after, created_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (kind, json.dumps(payload), PENDING, self.max_attempts, now, now, now)
+        )
+        self._wake.set()
+        return cursor.lastrowid
+
+    def get(self, job_id):
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "payload": json.loads(row["payload"]),
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["last_error"]
+        }
+
+    def metrics(self):
+        conn = self._conn()
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, DEAD: 0}
+
+        for status, count in conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+            counts[status] = count
+
+        oldest = conn.execute(
+            "SELECT MIN(created_at) FROM jobs WHERE status = ?", (PENDING,)
+        ).fetchone()[0]
+
+        return {
+            "depth": counts[PENDING] + counts[RUNNING],
+            "by_status": counts,
+            "oldest_pending_age_s": round(time.time() - oldest, 3) if oldest else 0.0,
+            "workers": self.workers if self._started_pid == os.getpid() else 0
+        }
+
+    # -------------------------------------------------
+    # ⚙️ WORKER SIDE
+    # -------------------------------------------------
+
+    def ensure_started(self, app=None):
+
+        if app is not None:
+            self.app = app
+
+        # Threads don't survive fork: start once in each worker process
+        if self._started_pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._started_pid == os.getpid():
+                return
+
+            self._requeue_stale()
+
+            for i in range(self.workers):
+                threading.Thread(
+                    target=self._work_loop,
+                    name=f"job-worker-{i}",
+                    daemon=True
+                ).start()
+
+            threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True).start()
+
+            self._started_pid = os.getpid()
+
+    def _requeue_stale(self):
+        # Jobs left RUNNING by a worker that died mid-job. Live jobs are
+        # kept fresh by the heartbeat, and a job requeued anyway (e.g. a
+        # stalled process) can no longer be finished under its old claim.
+        now = time.time()
+        self._conn().execute(
+            "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ? AND updated_at < ?",
+            (PENDING, now, RUNNING, now - self.stale_after)
+        )
+
+    def _claim(self):
+        conn = self._conn()
+        now = time.time()
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT id, kind, payload FROM jobs WHERE status = ? AND run_after <= ?"
+                " ORDER BY id LIMIT 1",
+                (PENDING, now)
+            ).fetchone()
+
+            claim = None
+            if row is not None:
+                claim = uuid.uuid4().hex
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, claim = ?, updated_at = ?"
+                    " WHERE id = ?",
+                    (RUNNING, claim, now, row["id"])
+                )
+
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return row, claim
+
+    def run_once(self):
+
+        row, claim = self._claim()
+        if row is None:
+            return False
+
+        with self._running_lock:
+            self._running.add(claim)
+
+        try:
+            handler = self._handlers.get(row["kind"])
+            payload = json.loads(row["payload"])
+
+            try:
+                if handler is None:
+                    raise LookupError(f"No handler for job kind {row['kind']!r}")
+                result = self._call(handler, payload)
+
+            except Exception as e:
+                self._fail(row, claim, payload, e)
+                return True
+
+            self._finish(row["id"], claim, DONE, result)
+            return True
+
+        finally:
+            with self._running_lock:
+                self._running.discard(claim)
+
+    def _call(self, fn, *args):
+        if self.app is not None:
+            with self.app.app_context():
+                return fn(*args)
+        return fn(*args)
+
+    def _finish(self, job_id, claim, status, result, error=None):
+
+        # Only the current claim holder may settle the job: if it was
+        # requeued and claimed again meanwhile, this run's outcome is dropped
+        settled = self._conn().execute(
+            "UPDATE jobs SET status = ?, result = ?, last_error = ?, claim = NULL, updated_at = ?"
+            " WHERE id = ? AND claim = ?",
+            (status, json.dumps(result), error, time.time(), job_id, claim)
+        ).rowcount
+
+        if not settled:
+            log.warning("Job %s was reclaimed while running; dropping this run's outcome", job_id)
+
+        return settled
+
+    def _fail(self, row, claim, payload, error):
+        conn = self._conn()
+        now = time.time()
+        attempts, max_attempts = conn.execute(
+            "SELECT attempts, max_attempts FROM jobs WHERE id = ?", (row["id"],)
+        ).fetchone()
+
+        if attempts < max_attempts:
+            log.warning("Job %s failed (attempt %s), retrying: %s", row["id"], attempts, error)
+            conn.execute(
+                "UPDATE jobs SET status = ?, last_error = ?, run_after = ?, claim = NULL, updated_at = ?"
+                " WHERE id = ? AND claim = ?",
+                (PENDING, repr(error), now + self.retry_backoff ** attempts, now, row["id"], claim)
+            )
+            return
+
+        # Same rule as _finish, checked before the side effects: a run that
+        # was reclaimed must not post a second dead-letter answer
+        current = conn.execute(
+            "SELECT 1 FROM jobs WHERE id = ? AND claim = ?", (row["id"], claim)
+        ).fetchone()
+
+        if current is None:
+            log.warning("Job %s was reclaimed while running; dropping this run's failure", row["id"])
+            return
+
+        log.error("Job %s dead after %s attempts: %s", row["id"], attempts, error)
+
+        result = None
+        on_dead = self._on_dead.get(row["kind"])
+
+        if on_dead is not None:
+            try:
+                result = self._call(on_dead, payload, error)
+            except Exception:
+                log.exception("Dead-letter handler for job %s failed", row["id"])
+
+        self._finish(row["id"], claim, DEAD, result, repr(error))
+
+    def _heartbeat_loop(self):
+
+        # Keep this process's RUNNING jobs younger than stale_after so a
+        # restarting sibling worker never requeues them
+        while True:
+            time.sleep(max(self.stale_after / 3, 0.05))
+
+            with self._running_lock:
+                claims = list(self._running)
+
+            if not claims:
+                continue
+
+            try:
+                self._conn().execute(
+                    f"UPDATE jobs SET updated_at = ? WHERE status = ? AND claim IN ({','.join('?' * len(claims))})",
+                    (time.time(), RUNNING, *claims)
+                )
+            except Exception:
+                log.exception("Job heartbeat failed")
+
+    def _work_loop(self):
+        while True:
+            try:
+                if self.run_once():
+                    continue
+            except Exception:
+                log.exception("Job worker error")
+
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
@@ -0,0 +1,66 @@
+# ============================================
+# JEEVIKA – Single Pass Phrase Matcher
+# One compiled scan per message, shared by every engine
+# ============================================
+
+import re
+
+
+# ============================================
+# 🧾 MATCH SET
+# ============================================
+
+class MatchSet:
+
+    __slots__ = ("text", "phrases", "table")
+
+    def __init__(self, text, phrases, table=None):
+        self.text = text
+        self.phrases = phrases
+        # Decision table whose matcher produced this set (see rules.py)
+        self.table = table
+
+    def __contains__(self, phrase):
+        return phrase in self.phrases
+
+    def has_any(self, phrases):
+        return any(p in self.phrases for p in phrases)
+
+    def __repr__(self):
+        return f"<MatchSet {sorted(self.phrases)}>"
+
+
+# ============================================
+# 🔎 PHRASE MATCHER
+# ============================================
+
+class PhraseMatcher:
+
+    def __init__(self, phrases):
+        self.phrases = frozenset(p.lower() for p in phrases)
+
+        # Longest phrase wins at each position; anything else starting at
+        # that position must be one of its prefixes, so we precompute them.
+        ordered = sorted(self.phrases, key=len, reverse=True)
+
+        self._prefixes = {
+            p: frozenset(q for q in self.phrases if p.startswith(q))
+            for p in ordered
+        }
+
+        alternation = "|".join(re.escape(p) for p in ordered)
+        self._pattern = re.compile(f"(?=({alternation}))") if ordered else None
+
+    def scan(self, text):
+        text = (text or "").lower()
+
+        if self._pattern is None:
+            return MatchSet(text, frozenset())
+
+        found = set()
+        for m in self._pattern.finditer(text):
+            longest = m.group(1)
+            if longest not in found:
+                found |= self._prefixes[longest]
+
+        return MatchSet(text, frozenset(found))
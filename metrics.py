@@ -0,0 +1,388 @@
+# =====================================================
+# JEEVIKA – Metrics
+# Counters + histograms • Prometheus text format
+# Multi-process: each worker snapshots to METRICS_DIR
+# Scraping needs METRICS_TOKEN (or an opted-in METRICS_ALLOWLIST)
+# =====================================================
+
+import atexit
+import fcntl
+import glob
+import hmac
+import json
+import os
+import threading
+import time
+
+LATENCY_BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50)
+
+
+def _label_key(labelnames, labels):
+    return tuple(str(labels.get(name, "")) for name in labelnames)
+
+
+def _format_labels(labelnames, key, extra=None):
+    pairs = list(zip(labelnames, key)) + (extra or [])
+    if not pairs:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+# =====================================================
+# 🔢 METRIC TYPES
+# =====================================================
+
+class Counter:
+
+    kind = "counter"
+
+    def __init__(self, registry, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = registry.lock
+        self._values = {}
+        registry.add(self)
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return [[list(k), v] for k, v in self._values.items()]
+
+    @staticmethod
+    def merge(a, b):
+        merged = {tuple(k): v for k, v in a}
+        for k, v in b:
+            merged[tuple(k)] = merged.get(tuple(k), 0) + v
+        return [[list(k), v] for k, v in merged.items()]
+
+    def render(self, values):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(values, key=lambda kv: kv[0]):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+
+    kind = "histogram"
+
+    def __init__(self, registry, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._lock = registry.lock
+        self._values = {}
+        registry.add(self)
+
+    def observe(self, value, **labels):
+        key = _label_key(self.labelnames, labels)
+
+        # Index of the first bucket the value fits in (len = +Inf only)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return [[list(k), [list(e[0]), e[1], e[2]]] for k, e in self._values.items()]
+
+    @staticmethod
+    def merge(a, b):
+        merged = {tuple(k): [list(e[0]), e[1], e[2]] for k, e in a}
+        for k, e in b:
+            current = merged.get(tuple(k))
+            if current is None:
+                merged[tuple(k)] = [list(e[0]), e[1], e[2]]
+            else:
+                current[0] = [x + y for x, y in zip(current[0], e[0])]
+                current[1] += e[1]
+                current[2] += e[2]
+        return [[list(k), e] for k, e in merged.items()]
+
+    def render(self, values):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+
+        for key, (counts, total, count) in sorted(values, key=lambda kv: kv[0]):
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                labels = _format_labels(self.labelnames, key, [("le", le)])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+
+        return lines
+
+
+# =====================================================
+# 🗂️ REGISTRY (+ CROSS-PROCESS SNAPSHOTS)
+# =====================================================
+
+class Registry:
+
+    def __init__(self, directory=None, flush_interval=5.0):
+        self.lock = threading.Lock()
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._metrics = {}
+        self._last_flush = 0.0
+        self._flushed_pid = None
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            atexit.register(self.retire)
+
+    def add(self, metric):
+        self._metrics[metric.name] = metric
+
+    def snapshot(self):
+        return {name: m.snapshot() for name, m in self._metrics.items()}
+
+    def _path(self, pid=None):
+        return os.path.join(self.directory, f"metrics_{pid or os.getpid()}.json")
+
+    def _write(self, path, snapshot):
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp, path)
+
+    def flush(self):
+        if not self.directory:
+            return
+
+        path = self._path()
+
+        # First flush in this process: a file under our pid belongs to an
+        # earlier worker that had the same pid, so bank it before overwriting
+        if self._flushed_pid != os.getpid():
+            self._fold(path)
+            self._flushed_pid = os.getpid()
+
+        self._write(path, self.snapshot())
+        self._last_flush = time.monotonic()
+
+    # -------------------------------------------------
+    # 🪦 RETIRED WORKERS
+    # Exited workers' numbers move into one retained total, so per-pid
+    # files don't pile up and counters never go backwards on pid reuse
+    # -------------------------------------------------
+
+    def _fold(self, path):
+
+        with open(os.path.join(self.directory, "metrics.lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            try:
+                with open(path) as f:
+                    snapshot = json.load(f)
+            except FileNotFoundError:
+                return
+            except (OSError, ValueError):
+                snapshot = {}
+
+            retired_path = os.path.join(self.directory, "metrics_retired.json")
+            retired = self._read(retired_path) or {}
+
+            for name, values in snapshot.items():
+                metric = self._metrics.get(name)
+                if metric is not None:
+                    retired[name] = metric.merge(retired.get(name, []), values)
+
+            self._write(retired_path, retired)
+            os.remove(path)
+
+    def retire(self):
+        # atexit in each worker: only the process that wrote the file folds it
+        if self.directory and self._flushed_pid == os.getpid():
+            self.flush()
+            self._fold(self._path())
+            self._flushed_pid = None
+
+    def _fold_dead_workers(self):
+
+        # Workers killed without running atexit (SIGKILL, OOM)
+        for path in glob.glob(os.path.join(self.directory, "metrics_[0-9]*.json")):
+            pid = int(os.path.basename(path)[len("metrics_"):-len(".json")])
+            if pid == os.getpid():
+                continue
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                self._fold(path)
+            except PermissionError:
+                pass
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def maybe_flush(self):
+        if self.directory and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def collect(self):
+
+        if not self.directory:
+            return self.snapshot()
+
+        # Our own numbers are always fresh; other workers' are <= flush_interval old.
+        # Exited workers are in metrics_retired.json.
+        self.flush()
+        self._fold_dead_workers()
+
+        combined = {}
+        for path in glob.glob(os.path.join(self.directory, "metrics_*.json")):
+            snapshot = self._read(path)
+            if snapshot is None:
+                continue
+
+            for name, values in snapshot.items():
+                metric = self._metrics.get(name)
+                if metric is None:
+                    continue
+                combined[name] = metric.merge(combined.get(name, []), values)
+
+        return combined
+
+    def render(self):
+        collected = self.collect()
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.extend(metric.render(collected.get(name, [])))
+        return "\n".join(lines) + "\n"
+
+
+# =====================================================
+# 📈 JEEVIKA METRICS
+# =====================================================
+
+REGISTRY = Registry(
+    directory=os.environ.get("METRICS_DIR"),
+    flush_interval=float(os.environ.get("METRICS_FLUSH_INTERVAL", 5))
+)
+
+ENGINE_STAGE_SECONDS = Histogram(
+    REGISTRY, "jeevika_engine_stage_seconds",
+    "Time spent in each engine stage", ["stage"]
+)
+ENGINE_ANSWERED = Counter(
+    REGISTRY, "jeevika_engine_answered_total",
+    "Replies by the engine stage that produced them", ["stage"]
+)
+REQUEST_SECONDS = Histogram(
+    REGISTRY, "jeevika_http_request_seconds",
+    "HTTP request latency", ["endpoint", "method", "status"]
+)
+REQUEST_QUERIES = Histogram(
+    REGISTRY, "jeevika_http_request_db_queries",
+    "Database queries per HTTP request", ["endpoint"], buckets=QUERY_BUCKETS
+)
+HF_CALLS = Counter(
+    REGISTRY, "jeevika_hf_calls_total",
+    "Hugging Face calls by outcome", ["outcome"]
+)
+
+
+class EngineObserver:
+
+    def stage(self, name, seconds):
+        ENGINE_STAGE_SECONDS.observe(seconds, stage=name)
+
+    def answered(self, name):
+        ENGINE_ANSWERED.inc(stage=name)
+
+
+# =====================================================
+# 🔐 SCRAPE ACCESS
+# Bearer METRICS_TOKEN. METRICS_ALLOWLIST (comma separated addresses) is
+# opt-in and empty by default: behind a reverse proxy on the same host
+# every client arrives from 127.0.0.1.
+# =====================================================
+
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+METRICS_ALLOWLIST = {
+    a.strip() for a in os.environ.get("METRICS_ALLOWLIST", "").split(",") if a.strip()
+}
+
+
+def metrics_authorized(request):
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+
+    if METRICS_TOKEN and supplied and hmac.compare_digest(supplied, METRICS_TOKEN):
+        return True
+
+    return request.remote_addr in METRICS_ALLOWLIST
+
+
+# =====================================================
+# 🌐 FLASK WIRING
+# =====================================================
+
+def install_metrics(app):
+
+    from flask import Response, abort, g, request
+
+    import jeevika
+    from query_counter import query_count
+
+    jeevika.set_stage_observer(EngineObserver())
+    jeevika.GENERATOR.on_outcome = lambda outcome: HF_CALLS.inc(outcome=outcome)
+
+    @app.before_request
+    def start_request_timer():
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def record_request(response):
+        started = g.pop("metrics_started", None)
+        if started is not None:
+            endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                endpoint=endpoint, method=request.method, status=response.status_code
+            )
+            REQUEST_QUERIES.observe(query_count(), endpoint=endpoint)
+            REGISTRY.maybe_flush()
+        return response
+
+    @app.route("/metrics")
+    def metrics():
+        if not metrics_authorized(request):
+            abort(403)
+        return Response(REGISTRY.render(), mimetype="text/plain; version=0.0.4")
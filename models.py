@@ -1,3 +1,4 @@
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from datetime import datetime
@@ -36,7 +37,8 @@ class User(db.Model):
     razorpay_payment_id = db.Column(db.String(120), nullable=True)
 
     subscription_start = db.Column(db.DateTime, nullable=True)
-    subscription_end = db.Column(db.DateTime, nullable=True)
+    # Indexed for the expiry sweep (see subscriptions.py)
+    subscription_end = db.Column(db.DateTime, nullable=True, index=True)
 
     # ------------------------------
 
@@ -65,7 +67,16 @@ class User(db.Model):
     def check_password(self, password):
         return bcrypt.check_password_hash(self.password_hash, password)
 
+    def password_needs_rehash(self):
+        # Hash format: $2b$<cost>$<salt+digest>
+        try:
+            cost = int(self.password_hash.split("$")[2])
+        except (AttributeError, IndexError, ValueError):
+            return True
+        return cost != current_app.config.get("BCRYPT_LOG_ROUNDS", 12)
+
     # 💎 Plan Checker (IMPORTANT)
+    # Attribute check only: the expiry sweeper flips lapsed users to EXPIRED
     def is_pro(self):
         return self.plan == "PRO" and self.subscription_status == "ACTIVE"
 
@@ -90,6 +101,11 @@ class ChatSession(db.Model):
 
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Rolling summary of every message up to summary_through_id (see
+    # conversation.py); newer messages go into the HF prompt verbatim
+    summary = db.Column(db.Text, nullable=True)
+    summary_through_id = db.Column(db.Integer, nullable=True)
+
     messages = db.relationship(
         "Message",
         backref="session",
@@ -119,8 +135,16 @@ class Message(db.Model):
     role = db.Column(db.String(10), nullable=False)
     text = db.Column(db.Text, nullable=False)
 
+    # Set once at insert (see detect_simple_emotion); NULL = not backfilled yet
+    emotion = db.Column(db.String(20), nullable=True)
+
     timestamp = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
+    # Keyset paging walks a session's messages by id
+    __table_args__ = (
+        db.Index("ix_message_session_id_id", "session_id", "id"),
+    )
+
     def __repr__(self):
         return f"<Message {self.role} @ {self.timestamp}>"
 
@@ -155,6 +179,9 @@ class HealthData(db.Model):
 
     # 📈 JSON Data
     symptoms = db.Column(JSON, default=lambda: [])
+
+    # Legacy blobs: history now lives in SymptomEvent / SentimentSample.
+    # Kept (and emptied) by `flask migrate-timeseries`.
     symptom_timeline = db.Column(JSON, default=lambda: [])
     sentiment_history = db.Column(JSON, default=lambda: [])
 
@@ -163,3 +190,86 @@ class HealthData(db.Model):
 
     def __repr__(self):
         return f"<HealthData user_id={self.user_id} risk={self.clinical_risk}>"
+
+# ==========================================
+# 📈 TIME SERIES (APPEND ONLY)
+# ==========================================
+
+class SymptomEvent(db.Model):
+    __tablename__ = "symptom_event"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    symptom = db.Column(db.String(50), nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.Index("ix_symptom_event_user_id_timestamp", "user_id", "timestamp"),
+    )
+
+    def __repr__(self):
+        return f"<SymptomEvent {self.symptom} @ {self.timestamp}>"
+
+
+class SentimentSample(db.Model):
+    __tablename__ = "sentiment_sample"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    polarity = db.Column(db.Float, nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.Index("ix_sentiment_sample_user_id_timestamp", "user_id", "timestamp"),
+    )
+
+    def __repr__(self):
+        return f"<SentimentSample {self.polarity} @ {self.timestamp}>"
+
+# ==========================================
+# 💳 PAYMENT ORDERS (RAZORPAY)
+# ==========================================
+
+class PaymentOrder(db.Model):
+    __tablename__ = "payment_order"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # Our idempotency key, sent to Razorpay as the order receipt
+    receipt = db.Column(db.String(40), unique=True, nullable=False)
+    razorpay_order_id = db.Column(db.String(120), unique=True, nullable=True)
+    razorpay_payment_id = db.Column(db.String(120), nullable=True)
+
+    amount = db.Column(db.Integer, nullable=False)
+    currency = db.Column(db.String(3), default="INR", nullable=False)
+
+    status = db.Column(db.String(20), default="CREATING", nullable=False)
+    # CREATING / CREATED / PAID
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index("ix_payment_order_user_id_status", "user_id", "status"),
+    )
+
+    def __repr__(self):
+        return f"<PaymentOrder {self.receipt} {self.status}>"
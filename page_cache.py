@@ -0,0 +1,112 @@
+# =====================================================
+# JEEVIKA – Page Caching
+# Pre-rendered static pages • ETag / Last-Modified • 304s
+# =====================================================
+
+import hashlib
+import os
+from datetime import datetime, timezone
+
+from flask import Response, render_template, request
+
+from compression import BROTLI_AVAILABLE, choose_encoding, compress
+
+# Browser cache lifetime for the pre-rendered pages (seconds)
+STATIC_PAGE_MAX_AGE = int(os.environ.get("STATIC_PAGE_MAX_AGE", 86400))
+
+
+def make_etag(*parts):
+    return hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+
+
+def _utc(moment):
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.replace(microsecond=0)
+
+
+# =====================================================
+# ✅ CONDITIONAL GET
+# =====================================================
+
+def is_fresh(etag, last_modified=None):
+
+    # If-None-Match wins over If-Modified-Since when both are sent. It uses
+    # weak comparison, so W/ tags from the compression middleware match.
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+
+    since = request.if_modified_since
+    if since and last_modified is not None:
+        return _utc(last_modified) <= since
+
+    return False
+
+
+def stamp(response, etag, last_modified=None, cache_control="private, no-cache", weak=False):
+    response.set_etag(etag, weak=weak)
+    if last_modified is not None:
+        response.last_modified = _utc(last_modified)
+    response.headers["Cache-Control"] = cache_control
+    return response
+
+
+def not_modified(etag, last_modified=None, cache_control="private, no-cache"):
+    return stamp(Response(status=304), etag, last_modified, cache_control)
+
+
+# =====================================================
+# 📄 PRE-RENDERED STATIC PAGES
+# =====================================================
+
+class StaticPages:
+
+    def __init__(self, app, templates):
+        self.app = app
+        self.templates = templates
+        self._pages = {}
+
+    def prerender(self):
+
+        rendered_at = datetime.utcnow()
+
+        # url_for needs a request context; nothing request specific is used
+        with self.app.test_request_context("/"):
+            for name in self.templates:
+                body = render_template(name).encode("utf-8")
+
+                # Compressed once here, at the highest levels, never per request
+                variants = {None: body, "gzip": compress(body, "gzip", 9)}
+                if BROTLI_AVAILABLE:
+                    variants["br"] = compress(body, "br", 11)
+
+                self._pages[name] = (variants, hashlib.sha1(body).hexdigest(), rendered_at)
+
+    def serve(self, name):
+
+        if name not in self._pages:
+            self.prerender()
+
+        variants, etag, rendered_at = self._pages[name]
+        cache_control = f"public, max-age={STATIC_PAGE_MAX_AGE}"
+
+        encoding = choose_encoding(request.headers.get("Accept-Encoding"))
+        if encoding not in variants:
+            encoding = None
+
+        if is_fresh(etag, rendered_at):
+            response = not_modified(etag, rendered_at, cache_control)
+        else:
+            response = Response(variants[encoding], mimetype="text/html")
+            stamp(response, etag, rendered_at, cache_control, weak=encoding is not None)
+
+            if encoding:
+                # Already encoded: the compression middleware passes it through
+                response.headers["Content-Encoding"] = encoding
+
+        # Same URL redirects or shows flashes for a different session cookie
+        response.vary.add("Cookie")
+        response.vary.add("Accept-Encoding")
+        return response
@@ -0,0 +1,81 @@
+# =====================================================
+# JEEVIKA – Bounded Password Hashing Pool
+# Keeps bcrypt off the request thread, sheds load when full
+#
+# bcrypt releases the GIL, so the pool only adds throughput when the
+# worker serves requests concurrently: run gunicorn with gthread workers
+# (--worker-class gthread --threads N, see Procfile.txt). Under sync
+# workers each request still waits on its own hash; the pool then only
+# bounds and sheds the backlog.
+# =====================================================
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+BCRYPT_WORKERS = int(os.environ.get("BCRYPT_WORKERS", os.cpu_count() or 2))
+BCRYPT_MAX_QUEUE = int(os.environ.get("BCRYPT_MAX_QUEUE", 16))
+BCRYPT_TIMEOUT = float(os.environ.get("BCRYPT_TIMEOUT", 10))
+
+
+class HashingBusy(Exception):
+    pass
+
+
+class HashingPool:
+
+    def __init__(self, workers=BCRYPT_WORKERS, max_queue=BCRYPT_MAX_QUEUE, timeout=BCRYPT_TIMEOUT):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        # Running + waiting jobs; anything beyond is rejected straight away
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.rejected = 0
+
+    def run(self, fn, *args):
+
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise HashingBusy("Password hashing queue is full")
+
+        with self._lock:
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+
+        # The slot is held until the hash really finishes: a caller that
+        # gives up on timeout must not free room for more work while its
+        # job still occupies a worker thread
+        future.add_done_callback(self._release)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            raise HashingBusy("Password hashing timed out")
+
+    def _release(self, _future=None):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "rejected": self.rejected
+            }
+
+
+HASHING_POOL = HashingPool()
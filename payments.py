@@ -0,0 +1,177 @@
+# =====================================================
+# JEEVIKA – Razorpay Orders & Subscriptions
+# Reuse pending orders • receipt idempotency • webhooks
+# =====================================================
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from models import db, User, PaymentOrder
+
+log = logging.getLogger("jeevika.payments")
+
+# A pending order is handed out again for this long instead of creating a new one
+ORDER_TTL = float(os.environ.get("RAZORPAY_ORDER_TTL", 900))
+
+RAZORPAY_TIMEOUT = (
+    float(os.environ.get("RAZORPAY_CONNECT_TIMEOUT", 3)),
+    float(os.environ.get("RAZORPAY_READ_TIMEOUT", 10))
+)
+
+SUBSCRIPTION_DAYS = 30
+
+CREATING = "CREATING"
+CREATED = "CREATED"
+PAID = "PAID"
+
+
+class OrderInProgress(Exception):
+    pass
+
+
+class OrderAlreadyPaid(Exception):
+    pass
+
+
+# =====================================================
+# 🧾 ORDERS
+# =====================================================
+
+def idempotency_key(user_id, now=None):
+    # One key per user per TTL window: double clicks and retries collide on it
+    window = int((now or time.time()) // ORDER_TTL)
+    return f"pro-{user_id}-{window}"
+
+
+def reusable_order(user_id, amount):
+    return PaymentOrder.query.filter(
+        PaymentOrder.user_id == user_id,
+        PaymentOrder.status == CREATED,
+        PaymentOrder.amount == amount,
+        PaymentOrder.created_at >= datetime.utcnow() - timedelta(seconds=ORDER_TTL)
+    ).order_by(PaymentOrder.id.desc()).first()
+
+
+def _claim(user_id, amount, currency):
+
+    key = idempotency_key(user_id)
+    order = PaymentOrder.query.filter_by(receipt=key).first()
+
+    if order is None:
+        order = PaymentOrder(user_id=user_id, receipt=key, amount=amount, currency=currency)
+        db.session.add(order)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Another request inserted the same key first and owns the call
+            db.session.rollback()
+            raise OrderInProgress(key)
+        return order, False
+
+    if order.status == CREATED:
+        return order, False
+
+    if order.status == PAID:
+        raise OrderAlreadyPaid(key)
+
+    # CREATING: someone is mid-call, or a previous attempt timed out/died
+    stale_after = timedelta(seconds=sum(RAZORPAY_TIMEOUT))
+    if order.updated_at and datetime.utcnow() - order.updated_at < stale_after:
+        raise OrderInProgress(key)
+
+    order.updated_at = datetime.utcnow()
+    db.session.commit()
+    return order, True
+
+
+def _find_remote(client, receipt):
+    # The timed-out attempt may have created the order after all
+    found = client.order.all({"receipt": receipt}, timeout=RAZORPAY_TIMEOUT)
+    items = found.get("items") or []
+    return items[0] if items else None
+
+
+def create_or_reuse_order(client, user, amount, currency="INR"):
+
+    order = reusable_order(user.id, amount)
+    if order is not None:
+        return order
+
+    order, recovering = _claim(user.id, amount, currency)
+    if order.status == CREATED:
+        return order
+
+    remote = _find_remote(client, order.receipt) if recovering else None
+
+    if remote is None:
+        remote = client.order.create({
+            "amount": amount,
+            "currency": currency,
+            "receipt": order.receipt,
+            "payment_capture": 1,
+            "notes": {"user_id": str(user.id)}
+        }, timeout=RAZORPAY_TIMEOUT)
+
+    order.razorpay_order_id = remote["id"]
+    order.status = CREATED
+    db.session.commit()
+
+    return order
+
+
+# =====================================================
+# 💎 SUBSCRIPTION ACTIVATION (VERIFY + WEBHOOK)
+# =====================================================
+
+def activate_subscription(user, payment_id, order):
+
+    # Checkout callback and webhook both land here; whichever is second is
+    # a no-op. The status flip is a compare-and-set so two concurrent
+    # callers (or a replayed callback) can't both extend the subscription.
+    flipped = db.session.execute(
+        update(PaymentOrder)
+        .where(PaymentOrder.id == order.id, PaymentOrder.status != PAID)
+        .values(status=PAID, razorpay_payment_id=payment_id, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+    if not flipped:
+        db.session.rollback()
+        return False
+
+    now = datetime.utcnow()
+
+    user.plan = "PRO"
+    user.subscription_status = "ACTIVE"
+    user.subscription_start = now
+    user.subscription_end = now + timedelta(days=SUBSCRIPTION_DAYS)
+    user.razorpay_payment_id = payment_id
+
+    db.session.commit()
+    db.session.refresh(order)
+    return True
+
+
+WEBHOOK_EVENTS = ("order.paid", "payment.captured")
+WEBHOOK_JOB = "razorpay_webhook"
+
+
+def handle_webhook_event(event):
+
+    if event.get("event") not in WEBHOOK_EVENTS:
+        return False
+
+    payment = event.get("payload", {}).get("payment", {}).get("entity", {})
+    order = PaymentOrder.query.filter_by(razorpay_order_id=payment.get("order_id")).first()
+
+    if order is None:
+        log.warning("Webhook for unknown order %s", payment.get("order_id"))
+        return False
+
+    user = db.session.get(User, order.user_id)
+    return activate_subscription(user, payment.get("id"), order)
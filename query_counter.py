@@ -0,0 +1,38 @@
+# =====================================================
+# JEEVIKA – Per Request Query Counter
+# Exposed as X-Query-Count; logged past a threshold
+# =====================================================
+
+import os
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# A chat turn: context, two history windows, messages, time series rows, health update
+QUERY_WARN_THRESHOLD = int(os.environ.get("QUERY_WARN_THRESHOLD", 10))
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        g.query_count = g.get("query_count", 0) + 1
+
+
+def query_count():
+    return g.get("query_count", 0) if has_request_context() else 0
+
+
+def install_query_counter(app):
+
+    @app.after_request
+    def report_query_count(response):
+        count = query_count()
+        response.headers["X-Query-Count"] = str(count)
+
+        if count > QUERY_WARN_THRESHOLD:
+            app.logger.warning(
+                "%s %s ran %s queries", request.method, request.path, count
+            )
+
+        return response
@@ -0,0 +1,281 @@
+# ============================================
+# JEEVIKA – Rule Packs
+# JSON pack -> validated, immutable decision table
+# Hot reload on file change, gated by a golden corpus
+# ============================================
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+from matcher import PhraseMatcher
+
+log = logging.getLogger("jeevika.rules")
+
+PACK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rule_packs")
+DEFAULT_PACK = os.path.join(PACK_DIR, "default.json")
+GOLDEN_CORPUS = os.path.join(PACK_DIR, "golden.json")
+
+
+class RulePackError(ValueError):
+    pass
+
+
+# ============================================
+# 🧾 DECISION TABLE
+# ============================================
+
+DecisionTable = namedtuple("DecisionTable", [
+    "version",
+    "crisis_words",
+    "red_flags",
+    "pain_levels",
+    "pain_alert",
+    "pcos_symptoms",
+    "pcos_insight",
+    "iron_symptoms",
+    "iron_max",
+    "iron_alert",
+    "estrogen_weights",
+    "progesterone_weights",
+    "risk_weights",
+    "risk_high",
+    "risk_moderate",
+    "therapist_topics",
+    "max_depth",
+    "reflect_depth",
+    "health_keywords",
+    "emoji_map",
+    "matcher"
+])
+
+
+def scan_with(table, text):
+    matches = table.matcher.scan(text)
+    matches.table = table
+    return matches
+
+
+# ============================================
+# ✅ VALIDATION
+# ============================================
+
+def _require(pack, path, kind):
+
+    value = pack
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            raise RulePackError(f"missing '{path}'")
+        value = value[key]
+
+    if not isinstance(value, kind):
+        raise RulePackError(f"'{path}' has the wrong type")
+
+    return value
+
+
+def _phrases(pack, path):
+
+    phrases = _require(pack, path, list)
+    for p in phrases:
+        if not isinstance(p, str) or not p.strip():
+            raise RulePackError(f"'{path}' must contain non-empty strings")
+        if p != p.lower():
+            raise RulePackError(f"'{path}' phrase {p!r} must be lowercase")
+
+    return tuple(phrases)
+
+
+def _weights(pack, path):
+
+    weights = _require(pack, path, dict)
+    for phrase, value in weights.items():
+        if not phrase.strip() or phrase != phrase.lower():
+            raise RulePackError(f"'{path}' key {phrase!r} must be a lowercase phrase")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise RulePackError(f"'{path}.{phrase}' must be a number")
+
+    # Order matters (first match wins / append order), so keep it as pairs
+    return tuple(weights.items())
+
+
+def _number(pack, path):
+    value = _require(pack, path, (int, float))
+    if isinstance(value, bool):
+        raise RulePackError(f"'{path}' must be a number")
+    return value
+
+
+# ============================================
+# 🏗️ COMPILE
+# ============================================
+
+def compile_pack(pack):
+
+    if not isinstance(pack, dict):
+        raise RulePackError("rule pack must be a JSON object")
+
+    version = _require(pack, "version", str)
+
+    topics = []
+    for i, entry in enumerate(_require(pack, "therapist.topics", list)):
+        if not isinstance(entry, dict) or not isinstance(entry.get("topic"), str):
+            raise RulePackError(f"'therapist.topics[{i}]' needs a 'topic' string")
+        topics.append((entry["topic"], _phrases(entry, "phrases")))
+
+    emoji_map = _require(pack, "emotions", dict)
+    if "neutral" not in emoji_map:
+        raise RulePackError("'emotions' must define 'neutral'")
+
+    risk = _require(pack, "risk", dict)
+
+    table = dict(
+        version=version,
+        crisis_words=_phrases(pack, "crisis_words"),
+        red_flags=_phrases(pack, "red_flags"),
+        pain_levels=_weights(pack, "pain.levels"),
+        pain_alert=_number(pack, "pain.alert_score"),
+        pcos_symptoms=_weights(pack, "pcos.symptoms"),
+        pcos_insight=_number(pack, "pcos.insight_score"),
+        iron_symptoms=_phrases(pack, "iron.symptoms"),
+        iron_max=_number(pack, "iron.max_score"),
+        iron_alert=_number(pack, "iron.alert_score"),
+        estrogen_weights=_weights(pack, "hormones.estrogen"),
+        progesterone_weights=_weights(pack, "hormones.progesterone"),
+        risk_weights=(
+            _number(risk, "pcos_weight"),
+            _number(risk, "pain_weight"),
+            _number(risk, "iron_weight")
+        ),
+        risk_high=_number(risk, "high"),
+        risk_moderate=_number(risk, "moderate"),
+        therapist_topics=tuple(topics),
+        max_depth=_number(pack, "therapist.max_depth"),
+        reflect_depth=_number(pack, "therapist.reflect_depth"),
+        health_keywords=_phrases(pack, "health_keywords"),
+        emoji_map=MappingProxyType(dict(_emoji_pairs(emoji_map))),
+    )
+
+    phrases = (
+        table["crisis_words"] + table["red_flags"] +
+        tuple(p for p, _ in table["pain_levels"]) +
+        tuple(p for p, _ in table["pcos_symptoms"]) +
+        table["iron_symptoms"] +
+        tuple(p for _, group in table["therapist_topics"] for p in group) +
+        table["health_keywords"] + tuple(table["emoji_map"])
+    )
+
+    return DecisionTable(matcher=PhraseMatcher(phrases), **table)
+
+
+def _emoji_pairs(mapping):
+    for key, value in mapping.items():
+        if not isinstance(value, str) or key != key.lower():
+            raise RulePackError(f"'emotions.{key}' must map a lowercase word to an emoji")
+        yield key, value
+
+
+def load_pack(path):
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            pack = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RulePackError(f"cannot read {path}: {e}")
+
+    return compile_pack(pack)
+
+
+# ============================================
+# 🔁 HOT RELOADING RULE BOOK
+# ============================================
+
+class RuleBook:
+
+    def __init__(self, path, golden_path=None, check_interval=2.0, verifier=None, verify_at_boot=True):
+        self.path = path
+        self.golden_path = golden_path
+        self.check_interval = check_interval
+
+        # verifier(table, cases) -> list of mismatches; set by the engine
+        self.verifier = verifier
+
+        self._lock = threading.Lock()
+        self._mtime = self._stat()
+
+        # A worker booting on a pack its siblings would have rejected on
+        # reload would serve different rules: refuse to start instead
+        table = load_pack(path)
+        if verify_at_boot:
+            self.verify(table)
+
+        self._table = table
+        self._checked_at = time.monotonic()
+
+    def _stat(self):
+
+        # Keyed on both files: re-recording the golden corpus re-checks
+        # the live pack as well
+        try:
+            pack = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+        try:
+            golden = os.stat(self.golden_path).st_mtime_ns if self.golden_path else None
+        except OSError:
+            golden = None
+
+        return pack, golden
+
+    def current(self):
+
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self._maybe_reload()
+
+        return self._table
+
+    def _maybe_reload(self):
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            mtime = self._stat()
+
+            if mtime is None or mtime == self._mtime:
+                return
+
+            # Remember the attempt either way so a bad file isn't retried every call
+            self._mtime = mtime
+
+            try:
+                candidate = load_pack(self.path)
+                self.verify(candidate)
+            except RulePackError as e:
+                log.error("Rule pack %s rejected, keeping %s: %s", self.path, self._table.version, e)
+                return
+
+            log.info("Rule pack %s -> %s", self._table.version, candidate.version)
+            self._table = candidate
+
+    def golden_cases(self):
+
+        if not self.golden_path or not os.path.exists(self.golden_path):
+            return []
+
+        with open(self.golden_path, encoding="utf-8") as f:
+            return json.load(f)["cases"]
+
+    def verify(self, table):
+
+        if self.verifier is None:
+            return
+
+        mismatches = self.verifier(table, self.golden_cases())
+        if mismatches:
+            raise RulePackError(
+                f"{len(mismatches)} golden case(s) changed, first: {mismatches[0]}"
+            )
@@ -0,0 +1,353 @@
+# ============================================
+# JEEVIKA – Sentiment Scoring
+# Fast lexicon path by default • TextBlob on demand
+# ============================================
+
+import json
+import os
+import re
+from functools import lru_cache
+
+SENTIMENT_MODE = os.environ.get("SENTIMENT_MODE", "fast").lower()
+SENTIMENT_CACHE_SIZE = int(os.environ.get("SENTIMENT_CACHE_SIZE", 4096))
+SENTIMENT_LEXICON = os.environ.get(
+    "SENTIMENT_LEXICON",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "sentiment_lexicon.json")
+)
+
+# ============================================
+# 📖 LEXICON (word: polarity, intensity, is_modifier)
+# Values taken from the pattern/TextBlob English lexicon.
+# The inline core only covers a deploy without sentiment_lexicon.json;
+# the full export (flask --app app sentiment-lexicon) is loaded below.
+# ============================================
+
+LEXICON = {
+    "good": (0.7, 1.0, False),
+    "great": (0.8, 1.0, False),
+    "happy": (0.8, 1.0, False),
+    "glad": (0.5, 1.0, False),
+    "better": (0.5, 1.0, False),
+    "best": (1.0, 1.0, False),
+    "fine": (0.4167, 1.0, False),
+    "nice": (0.6, 1.0, False),
+    "okay": (0.5, 1.0, False),
+    "ok": (0.5, 1.0, False),
+    "wonderful": (1.0, 1.0, False),
+    "amazing": (0.6, 1.0, False),
+    "awesome": (1.0, 1.0, False),
+    "excellent": (1.0, 1.0, False),
+    "fantastic": (0.4, 1.0, False),
+    "lovely": (0.5, 1.0, False),
+    "beautiful": (0.85, 1.0, False),
+    "perfect": (1.0, 1.0, False),
+    "calm": (0.3, 1.0, False),
+    "peaceful": (0.25, 1.0, False),
+    "positive": (0.2273, 1.0, False),
+    "strong": (0.4333, 1.0, False),
+    "healthy": (0.5, 1.0, False),
+    "comfortable": (0.4, 1.0, False),
+    "proud": (0.8, 1.0, False),
+    "excited": (0.375, 1.0, False),
+    "fun": (0.3, 1.0, False),
+    "funny": (0.25, 1.0, False),
+    "kind": (0.6, 1.0, False),
+    "gentle": (0.2, 1.0, False),
+    "sweet": (0.35, 1.0, False),
+    "safe": (0.5, 1.0, False),
+    "free": (0.4, 1.0, False),
+    "easy": (0.4333, 1.0, False),
+    "clear": (0.1, 1.0, False),
+    "fresh": (0.3, 1.0, False),
+    "warm": (0.6, 1.0, False),
+    "confident": (0.5, 1.0, False),
+    "cheerful": (0.4, 1.0, False),
+    "pleasant": (0.7333, 1.0, False),
+    "interesting": (0.5, 1.0, False),
+    "supportive": (0.5, 1.0, False),
+    "loving": (0.6, 1.0, False),
+    "loved": (0.7, 1.0, False),
+    "bad": (-0.7, 1.0, False),
+    "worse": (-0.4, 1.0, False),
+    "worst": (-1.0, 1.0, False),
+    "sad": (-0.5, 1.0, False),
+    "unhappy": (-0.6, 1.0, False),
+    "angry": (-0.5, 1.0, False),
+    "mad": (-0.625, 1.0, False),
+    "terrible": (-1.0, 1.0, False),
+    "horrible": (-1.0, 1.0, False),
+    "awful": (-1.0, 1.0, False),
+    "afraid": (-0.6, 1.0, False),
+    "anxious": (-0.25, 1.0, False),
+    "lonely": (-0.1, 1.0, False),
+    "worthless": (-0.8, 1.0, False),
+    "useless": (-0.5, 1.0, False),
+    "tired": (-0.4, 1.0, False),
+    "exhausted": (-0.4, 1.0, False),
+    "weak": (-0.375, 1.0, False),
+    "sick": (-0.7143, 1.0, False),
+    "ill": (-0.5, 1.0, False),
+    "painful": (-0.7, 1.0, False),
+    "broken": (-0.4, 1.0, False),
+    "miserable": (-1.0, 1.0, False),
+    "frustrated": (-0.7, 1.0, False),
+    "frustrating": (-0.4, 1.0, False),
+    "annoyed": (-0.4, 1.0, False),
+    "annoying": (-0.8, 1.0, False),
+    "irritating": (-0.4, 1.0, False),
+    "difficult": (-0.5, 1.0, False),
+    "hard": (-0.2917, 1.0, False),
+    "heavy": (-0.2, 1.0, False),
+    "dark": (-0.15, 1.0, False),
+    "empty": (-0.1, 1.0, False),
+    "confused": (-0.4, 1.0, False),
+    "overwhelming": (0.5, 1.0, False),
+    "guilty": (-0.5, 1.0, False),
+    "bitter": (-0.1, 1.0, False),
+    "cold": (-0.6, 1.0, False),
+    "cruel": (-1.0, 1.0, False),
+    "dull": (-0.2917, 1.0, False),
+    "boring": (-1.0, 1.0, False),
+    "poor": (-0.4, 1.0, False),
+    "wrong": (-0.5, 1.0, False),
+    "crazy": (-0.6, 1.0, False),
+    "stupid": (-0.8, 1.0, False),
+    "ugly": (-0.7, 1.0, False),
+    "disgusting": (-1.0, 1.0, False),
+    "gross": (0.0, 1.0, False),
+    "nasty": (-1.0, 1.0, False),
+    "serious": (-0.3333, 1.0, False),
+    "intense": (0.2, 1.0, False),
+    "sharp": (-0.125, 1.0, False),
+    "sudden": (0.0, 1.0, False),
+    "low": (0.0, 1.0, False),
+    "high": (0.16, 1.0, False),
+    "pale": (-0.21, 1.0, False),
+    "uncomfortable": (-0.5, 1.0, False),
+    "insecure": (-0.5, 1.0, False),
+    "desperate": (-0.6, 1.0, False),
+    "fearful": (-0.9, 1.0, False),
+    "shocked": (-0.7, 1.0, False),
+    "disappointed": (-0.75, 1.0, False),
+    "disappointing": (-0.6, 1.0, False),
+    "very": (0.2, 1.3, True),
+    "really": (0.2, 1.0, True),
+    "extremely": (-0.125, 1.0, True),
+    "pretty": (0.25, 1.0, False),
+    "totally": (0.0, 1.0, True),
+    "completely": (0.1, 1.0, True),
+    "absolutely": (0.2, 1.0, True),
+    "incredibly": (0.9, 1.0, True),
+    "terribly": (-1.0, 1.0, True),
+    "deeply": (0.0, 1.0, True),
+    "highly": (0.16, 1.0, True),
+    "seriously": (-0.3333, 1.0, True),
+    "especially": (0.0, 2.0, True),
+    "definitely": (0.0, 1.0, True),
+    "much": (0.2, 1.0, True),
+    "more": (0.5, 1.0, False),
+    "most": (0.5, 1.0, False),
+    "less": (-0.1667, 1.0, False),
+    "least": (-0.3, 1.0, False),
+    "little": (-0.1875, 1.0, False),
+    "slightly": (-0.1667, 1.0, True),
+    "barely": (0.05, 1.0, True),
+    "hardly": (-0.2917, 1.0, True),
+    "honestly": (0.6, 1.0, True),
+    "sorry": (-0.5, 1.0, False),
+    "lucky": (0.3333, 1.0, False),
+    "normal": (0.15, 1.0, False),
+    "mean": (-0.3125, 1.0, False),
+    "lazy": (-0.25, 1.0, False),
+    "tense": (-0.3333, 1.0, False),
+    "emotional": (0.0, 1.0, False),
+}
+
+# Emoticon: polarity. Matched as whole whitespace-separated tokens,
+# lowercased as pattern compares them
+EMOTICONS = {
+    ":)": 0.5, ":-)": 0.5, "=)": 0.5, ":d": 1.0, ":-d": 1.0, "<3": 1.0, "♥": 1.0,
+    ";)": 0.25, ";-)": 0.25, ":p": 0.75, ":-p": 0.75,
+    ":/": -0.25, ":-/": -0.25, ":s": -0.25,
+    ":(": -0.75, ":-(": -0.75, "=(": -0.75, ":'(": -1.0,
+}
+
+
+def export_lexicon():
+
+    # Flatten TextBlob's per-POS table the way its analyzer reads it
+    # untagged: the None entry holds the average, and any word with an
+    # adverb sense modifies the word after it
+    from textblob.en import sentiment as pattern
+
+    return {
+        word: [round(p, 4), round(i, 4), "RB" in senses]
+        for word, senses in pattern.items()
+        for p, _, i in [senses[None]]
+    }
+
+
+def export_emoticons():
+
+    # Letter-only ones ("XD") never reach pattern's emoticon check
+    from textblob._text import EMOTICONS as pattern
+
+    return {
+        e.lower(): p
+        for (_, p), faces in pattern.items()
+        for e in faces if not e.lower().isalpha()
+    }
+
+
+def _read_export(path):
+
+    if not path or not os.path.exists(path):
+        return {}
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_lexicon(path=SENTIMENT_LEXICON):
+    words = _read_export(path).get("words", {})
+    return {**LEXICON, **{w: (p, i, bool(m)) for w, (p, i, m) in words.items()}}
+
+
+def load_emoticons(path=SENTIMENT_LEXICON):
+    return {**EMOTICONS, **_read_export(path).get("emoticons", {})}
+
+
+WORDS = load_lexicon()
+FACES = load_emoticons()
+
+NEGATIONS = ("no", "not", "n't", "never")
+
+_TOKEN = re.compile(r"n't|[a-z0-9][a-z0-9'\-]*|!")
+
+
+# ============================================
+# ⚡ FAST PATH
+# Same chunking rules as pattern: modifiers scale the next word,
+# negations flip it by -0.5, "!" boosts the previous one.
+# ============================================
+
+def _clamp(value):
+    return max(-1.0, min(value, 1.0))
+
+
+def _tokens(text):
+    for chunk in text.lower().split():
+        if chunk in FACES:
+            yield chunk
+        else:
+            yield from _TOKEN.findall(chunk.replace("n't", " n't"))
+
+
+def fast_polarity(text):
+
+    scored = []
+    modifier = False
+    negated = False
+
+    for word in _tokens(text):
+        entry = WORDS.get(word)
+
+        if entry:
+            p, intensity, is_modifier = entry
+
+            if not modifier:
+                scored.append([p, intensity, False])
+            else:
+                scored[-1][0] = _clamp(p * scored[-1][1])
+                scored[-1][1] = intensity
+
+            if negated:
+                scored[-1][1] = 1.0 / scored[-1][1]
+                scored[-1][2] = True
+
+            modifier = is_modifier
+            negated = word in NEGATIONS
+
+        else:
+            if word in NEGATIONS:
+                negated = True
+            elif negated and len(word.strip("'")) > 1:
+                negated = False
+
+            if negated and modifier:
+                scored[-1][2] = True
+                negated = False
+            elif modifier and len(word) > 2:
+                modifier = False
+
+            if word == "!" and scored:
+                scored[-1][0] = _clamp(scored[-1][0] * 1.25)
+
+            if word in FACES:
+                scored.append([FACES[word], 1.0, False])
+
+    if not scored:
+        return 0.0
+
+    return sum(p * -0.5 if neg else p for p, _, neg in scored) / len(scored)
+
+
+# ============================================
+# 🎯 ACCURATE PATH (LAZY TEXTBLOB)
+# ============================================
+
+_TextBlob = None
+
+
+def textblob_available():
+
+    global _TextBlob
+
+    if _TextBlob is None:
+        try:
+            from textblob import TextBlob
+            _TextBlob = TextBlob
+        except ImportError:
+            _TextBlob = False
+
+    return _TextBlob is not False
+
+
+def textblob_polarity(text):
+
+    if not textblob_available():
+        return fast_polarity(text)
+
+    try:
+        return _TextBlob(text).sentiment.polarity
+    except Exception:
+        return 0.0
+
+
+# ============================================
+# 📊 PUBLIC SCORER (MEMOIZED)
+# ============================================
+
+def normalize(text):
+    return " ".join((text or "").lower().split())
+
+
+@lru_cache(maxsize=SENTIMENT_CACHE_SIZE)
+def _cached_polarity(key, mode):
+
+    if mode == "textblob":
+        return textblob_polarity(key)
+
+    return fast_polarity(key)
+
+
+def polarity(text, mode=None):
+
+    mode = mode or SENTIMENT_MODE
+
+    # TextBlob's tokenizer is case sensitive (":D" is a grin, ":d" is not):
+    # it scores and caches the text exactly as sent
+    if mode == "textblob":
+        return _cached_polarity(text or "", mode)
+
+    return _cached_polarity(normalize(text), mode)
@@ -0,0 +1,56 @@
+# =====================================================
+# JEEVIKA – Startup Timing
+# Per-phase boot report • imported first by app.py
+# =====================================================
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+log = logging.getLogger("jeevika.startup")
+
+# Worker boot budget; the report warns when a boot goes over it
+STARTUP_BUDGET = float(os.environ.get("STARTUP_BUDGET", 1.0))
+
+
+class StartupReport:
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []
+        self._mark = self.started
+
+    def lap(self, name):
+        # Everything since the previous phase ended, e.g. module imports
+        now = time.perf_counter()
+        self.phases.append((name, now - self._mark))
+        self._mark = now
+
+    @contextmanager
+    def phase(self, name):
+        self._mark = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.lap(name)
+
+    @property
+    def total(self):
+        return self._mark - self.started
+
+    def as_dict(self):
+        return {
+            "pid": os.getpid(),
+            "phases_ms": {name: round(seconds * 1e3, 2) for name, seconds in self.phases},
+            "total_ms": round(self.total * 1e3, 2),
+            "budget_ms": round(STARTUP_BUDGET * 1e3, 2)
+        }
+
+    def log(self, logger=None):
+        breakdown = ", ".join(f"{name}={seconds * 1e3:.1f}ms" for name, seconds in self.phases)
+        level = logging.WARNING if self.total > STARTUP_BUDGET else logging.INFO
+        (logger or log).log(level, "Startup %.1fms (pid %s): %s", self.total * 1e3, os.getpid(), breakdown)
+
+
+STARTUP = StartupReport()
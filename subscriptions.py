@@ -0,0 +1,109 @@
+# =====================================================
+# JEEVIKA – Subscription Expiry Sweeper
+# Set-based batched UPDATEs • CLI + in-process timer
+# =====================================================
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from models import db, User
+
+log = logging.getLogger("jeevika.subscriptions")
+
+ACTIVE = "ACTIVE"
+EXPIRED = "EXPIRED"
+
+
+# =====================================================
+# 🧹 ONE SWEEP
+# =====================================================
+
+def expire_due_subscriptions(batch_size=500, now=None):
+
+    now = now or datetime.utcnow()
+    expired = 0
+    batches = 0
+
+    while True:
+        # Walks ix_user_subscription_end; each batch is one UPDATE + commit
+        due = (
+            select(User.id)
+            .where(User.subscription_end < now, User.subscription_status == ACTIVE)
+            .order_by(User.subscription_end)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+
+        changed = db.session.execute(
+            update(User)
+            .where(User.id.in_(due))
+            .values(subscription_status=EXPIRED, updated_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+
+        if not changed:
+            break
+
+        expired += changed
+        batches += 1
+
+        if changed < batch_size:
+            break
+
+    return {"expired": expired, "batches": batches, "as_of": now.isoformat()}
+
+
+# =====================================================
+# ⏲️ IN-PROCESS TIMER
+# =====================================================
+
+class ExpirySweeper:
+
+    def __init__(self, interval=3600, batch_size=500):
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self.app = None
+        self.last_run = None
+        self._started_pid = None
+        self._start_lock = threading.Lock()
+
+    def run_once(self):
+        with self.app.app_context():
+            result = expire_due_subscriptions(self.batch_size)
+
+        self.last_run = result
+        if result["expired"]:
+            log.info("Expired %s subscriptions in %s batches", result["expired"], result["batches"])
+        return result
+
+    def ensure_started(self, app):
+
+        self.app = app
+
+        # Threads don't survive fork: start once in each worker process.
+        # Several workers sweeping is harmless, the UPDATE is idempotent.
+        if self._started_pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._started_pid == os.getpid():
+                return
+
+            threading.Thread(target=self._loop, name="expiry-sweeper", daemon=True).start()
+            self._started_pid = os.getpid()
+
+    def _loop(self):
+        while True:
+            try:
+                self.run_once()
+            except Exception:
+                log.exception("Subscription sweep failed")
+
+            time.sleep(self.interval)
@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Engine modules read these at import: no remote model, no shared cache
+os.environ.pop("HF_API_KEY", None)
+os.environ["HF_CACHE_BACKEND"] = "off"
+os.environ["GENERATION_BACKEND"] = "remote"
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+
+    from app import create_app, init_db
+
+    # A throwaway database and no background sweeper
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    flask_app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
+        "SUBSCRIPTION_SWEEP_INTERVAL": 0
+    })
+
+    with flask_app.app_context():
+        init_db()
+
+    return flask_app
+
+
+@pytest.fixture
+def user_session(app):
+
+    from models import db, User
+    from user_context import ensure_user_rows
+
+    # user_session(email) -> (user_id, chat_session_id): a registered user
+    # with the rows login creates, in the shared test database
+    def create(email, name="Test User"):
+        with app.app_context():
+            user = User(name=name, email=email)
+            user.set_password("pw")
+            db.session.add(user)
+            db.session.commit()
+            chat_session, _ = ensure_user_rows(user)
+            return user.id, chat_session.id
+
+    return create
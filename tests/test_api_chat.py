@@ -0,0 +1,42 @@
+# /api/chat Server-Sent Events path (no job queue, model fallback)
+
+from models import Message
+
+
+def _login(app, user_session, email):
+
+    user_id, session_id = user_session(email)
+
+    client = app.test_client()
+    with client.session_transaction() as s:
+        s["user_id"] = user_id
+
+    return client, session_id
+
+
+def _messages(app, session_id):
+    with app.app_context():
+        return [(m.role, m.text) for m in Message.query.filter_by(session_id=session_id).order_by(Message.id)]
+
+
+def test_stream_saves_user_message_and_reply(app, user_session):
+
+    client, session_id = _login(app, user_session, "sse-full@example.com")
+
+    response = client.post("/api/chat", json={"message": "what should I eat for breakfast?"})
+    body = response.get_data(as_text=True)
+
+    assert response.mimetype == "text/event-stream"
+    assert "event: done" in body
+    assert [role for role, _ in _messages(app, session_id)] == ["user", "bot"]
+
+
+def test_disconnect_mid_stream_keeps_user_message(app, user_session):
+
+    client, session_id = _login(app, user_session, "sse-drop@example.com")
+
+    response = client.post("/api/chat", json={"message": "what should I eat for lunch?"}, buffered=False)
+    next(iter(response.response))
+    response.close()
+
+    assert _messages(app, session_id) == [("user", "what should I eat for lunch?")]
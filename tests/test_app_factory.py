@@ -0,0 +1,31 @@
+# create_app(config): each app gets its own settings, nothing from import time
+
+from app import create_app, init_db
+from models import User
+
+
+def _app(tmp_path, name):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / name}",
+        "SUBSCRIPTION_SWEEP_INTERVAL": 0,
+        "RAZORPAY_KEY_ID": f"rzp_{name}"
+    })
+    with app.app_context():
+        init_db()
+    return app
+
+
+def test_apps_in_one_process_keep_their_own_database_and_config(tmp_path):
+
+    first, second = _app(tmp_path, "first.db"), _app(tmp_path, "second.db")
+
+    first.test_client().post("/register", data={
+        "username": "Asha", "email": "asha@example.com", "password": "pw"
+    })
+
+    with first.app_context():
+        assert User.query.filter_by(email="asha@example.com").count() == 1
+    with second.app_context():
+        assert User.query.count() == 0
+
+    assert second.config["RAZORPAY_KEY_ID"] == "rzp_second.db"
@@ -0,0 +1,52 @@
+# Bulk re-scoring: same results as the per-message path, no model calls
+
+import copy
+
+import jeevika
+from benchmarks.corpus import build_corpus
+
+
+def test_batch_is_rules_only_by_default(monkeypatch):
+
+    calls = []
+    monkeypatch.setattr(jeevika, "hf_reply", lambda *args, **kwargs: calls.append(args) or "model")
+
+    corpus = build_corpus(500)
+    results = jeevika.get_jeevika_responses_batch([t for t, _ in corpus], [copy.deepcopy(m) for _, m in corpus])
+
+    assert calls == []
+    for (text, memory), (reply, _) in zip(corpus, results):
+        assert reply == jeevika.get_rule_response(text, copy.deepcopy(memory))[0]
+
+
+def test_batch_generate_matches_per_message_path(monkeypatch):
+
+    monkeypatch.setattr(jeevika, "hf_reply", lambda *args, **kwargs: "model")
+
+    corpus = build_corpus(200)
+    results = jeevika.get_jeevika_responses_batch(
+        [t for t, _ in corpus], [copy.deepcopy(m) for _, m in corpus], generate=True
+    )
+
+    for (text, memory), (reply, _) in zip(corpus, results):
+        assert reply == jeevika.get_jeevika_response(text, copy.deepcopy(memory))[0]
+
+
+def test_turns_sharing_one_empty_memory_replay_a_single_history():
+
+    texts = ["I have irregular periods", "and acne", "also weight gain"]
+
+    history = {}
+    results = jeevika.get_jeevika_responses_batch(texts, [history] * len(texts))
+
+    # Every turn updated the caller's dict, not a fresh one each
+    assert all(memory is history for _, memory in results)
+    assert history["symptoms"] == ["irregular periods", "acne", "weight gain"]
+    assert history["pcos_score"] == 4
+    assert len(history["sentiment_history"]) == 3
+
+    # Same replay through the pool: chunks keep a shared history together
+    pooled = jeevika.get_jeevika_responses_batch(
+        texts * 2, [{}] * 3 + [{}] * 3, processes=2, chunk_size=3
+    )
+    assert [memory["pcos_score"] for _, memory in pooled] == [4] * 6
@@ -0,0 +1,57 @@
+# Engine memory must survive the round trip through HealthData between requests
+
+from chat_service import memory_from_health, run_chat_turn
+from models import db, User, Message
+from user_context import ensure_user_rows
+
+TURNS = [
+    "I have irregular periods and acne",
+    "the cramps are severe today",
+    "I feel fatigue and dizziness",
+    "I love talking to you",
+    "still fatigue, and my mood swings are bad"
+]
+
+
+def _turn(app, user_id, text):
+    # A fresh app context per turn: nothing carries over in the ORM session
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        chat_session, health = ensure_user_rows(user)
+        run_chat_turn(user, chat_session, health, text)
+
+
+def _memory(app, user_id):
+    with app.app_context():
+        chat_session, health = ensure_user_rows(db.session.get(User, user_id))
+        messages = Message.query.filter_by(session_id=chat_session.id).count()
+        return memory_from_health(health), messages
+
+
+def test_memory_accumulates_across_requests(app, user_session):
+
+    user_id, _ = user_session("asha@example.com")
+
+    for text in TURNS:
+        _turn(app, user_id, text)
+
+    memory, messages = _memory(app, user_id)
+
+    assert messages == 2 * len(TURNS)
+
+    assert memory["symptoms"] == ["irregular periods", "acne", "mood swings"]
+    assert [e["symptom"] for e in memory["symptom_timeline"]] == memory["symptoms"]
+    assert memory["pcos_score"] == 4
+    assert memory["pain_score"] == 7
+    # fatigue + dizziness on turn three, fatigue again on turn five
+    assert memory["iron_score"] == 3
+    # Last computed on turn four: 3 * 2 + 7 + 2
+    assert memory["clinical_risk_level"] == "HIGH"
+    # Turn five returns on the iron reply before the hormone split is
+    # recomputed, so the split still reflects acne + irregular periods
+    assert memory["estrogen_percent"] == 33.3
+    assert memory["progesterone_percent"] == 66.7
+
+    # One sample per turn, in order, the fourth clearly positive
+    assert len(memory["sentiment_history"]) == len(TURNS)
+    assert memory["sentiment_history"][3] > 0.3
@@ -0,0 +1,27 @@
+# Dashboard conditional GET: the ETag alone decides 304s
+
+from datetime import datetime, timedelta
+
+
+def _client(app, email):
+    client = app.test_client()
+    client.post("/register", data={"username": "Devi", "email": email, "password": "pw"})
+    client.post("/login", data={"email": email, "password": "pw"})
+    return client
+
+
+def test_dashboard_revalidates_by_etag_only(app):
+
+    client = _client(app, "devi@example.com")
+
+    page = client.get("/dashboard")
+    assert page.status_code == 200
+    assert page.headers.get("Last-Modified") is None
+
+    etag = page.headers["ETag"]
+    assert client.get("/dashboard", headers={"If-None-Match": etag}).status_code == 304
+
+    # A date far after every row timestamp says nothing about the rule
+    # pack, the Razorpay key or the day, so it never earns a 304
+    tomorrow = (datetime.utcnow() + timedelta(days=1)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+    assert client.get("/dashboard", headers={"If-Modified-Since": tomorrow}).status_code == 200
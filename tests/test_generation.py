@@ -0,0 +1,53 @@
+# Micro-batched generation backends
+
+import pytest
+
+from generation import BatchedBackend, LocalSeq2SeqBackend, StubBackend
+
+
+class ShortBatch(BatchedBackend):
+
+    name = "short"
+
+    def run_batch(self, prompts, parameters):
+        return ["only one"]
+
+
+def test_every_caller_is_answered_when_the_batch_comes_back_short():
+
+    backend = ShortBatch(max_batch=4, max_wait=0.2, timeout=2.0)
+    futures = [backend.batcher.submit(f"p{i}") for i in range(3)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="1 outputs for 3 prompts"):
+            future.result(timeout=2.0)
+
+    assert backend.generate("p") == "only one"
+
+
+def test_backend_without_run_batch_cannot_be_built():
+
+    class NoModel(BatchedBackend):
+        name = "none"
+
+    with pytest.raises(TypeError, match="run_batch"):
+        NoModel()
+
+
+def test_stub_batches_concurrent_callers():
+
+    backend = StubBackend(max_batch=4, max_wait=0.2)
+    futures = [backend.batcher.submit(f"p{i}") for i in range(4)]
+
+    assert all(f.result(timeout=2.0) for f in futures)
+    assert backend.stats()["largest_batch"] == 4
+
+
+def test_local_backend_is_unconfigured_without_torch(monkeypatch):
+
+    import generation
+
+    monkeypatch.setattr(generation.importlib.util, "find_spec", lambda name: None)
+    backend = LocalSeq2SeqBackend()
+
+    assert backend.configured is False
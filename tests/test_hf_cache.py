@@ -0,0 +1,73 @@
+# Shared SQLite reply cache: lazy, fork-safe connections
+
+import os
+
+import pytest
+
+import jeevika
+from hf_cache import MemoryBackend, ResponseCache, SQLiteBackend, normalize_prompt
+
+
+class EchoGenerator:
+
+    # Reply names the prompt it was generated from
+    configured = True
+
+    def generate(self, prompt, parameters=None):
+        return f"from: {prompt}"
+
+    def stream(self, prompt, parameters=None):
+        yield self.generate(prompt)
+
+
+def test_keys_keep_word_order_and_pronouns():
+    assert normalize_prompt("my sister has pcos, not me") != normalize_prompt("I have pcos, not my sister")
+    assert normalize_prompt("What helps during my period?") == "what helps during my period"
+
+
+def test_keys_ignore_case_spacing_punctuation_and_filler():
+    assert normalize_prompt("Hey,  what helps DURING my period??") == normalize_prompt("what helps during my period")
+
+
+def test_sqlite_backend_connects_lazily(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "cache.db"))
+
+    assert getattr(backend._local, "conn", None) is None
+    assert not (tmp_path / "cache.db").exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_forked_worker_opens_its_own_connection(tmp_path):
+    cache = ResponseCache(SQLiteBackend(str(tmp_path / "cache.db")), ttl=60)
+    cache.set("I feel tired", "Rest well 🤍")
+    parent_conn = cache.backend._conn()
+
+    read, write = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        ok = cache.backend._conn() is not parent_conn and cache.get("i FEEL  tired!") == "Rest well 🤍"
+        os.write(write, b"1" if ok else b"0")
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+    assert os.read(read, 1) == b"1"
+    assert cache.backend._conn() is parent_conn
+
+
+def test_turn_with_context_never_gets_a_context_free_cached_reply(monkeypatch):
+    monkeypatch.setattr(jeevika, "GENERATOR", EchoGenerator())
+    monkeypatch.setattr(jeevika, "HF_CACHE", ResponseCache(MemoryBackend(), ttl=60))
+
+    question = "what should I eat for breakfast?"
+    context = "Summary: user has low iron"
+
+    fresh = jeevika.hf_reply(question)
+    assert jeevika.hf_reply(question) == fresh
+
+    with_context = jeevika.hf_reply(question, context=context)
+    assert with_context != fresh and context in with_context
+    assert "".join(jeevika.hf_reply_stream(question, context=context)) == with_context
+
+    # ... and the contextual reply was not written back for everyone else
+    assert jeevika.hf_reply(question) == fresh
@@ -0,0 +1,160 @@
+# HFClient against a local stub inference server
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import jeevika
+from hf_client import CircuitBreaker, HFClient
+
+
+class StubHF:
+
+    def __init__(self):
+        self.mode = "ok"
+        self.delay = 0.0
+        self.requests = 0
+        self.peak = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+                with stub._lock:
+                    stub.requests += 1
+                    stub._active += 1
+                    stub.peak = max(stub.peak, stub._active)
+                try:
+                    time.sleep(stub.delay)
+                finally:
+                    with stub._lock:
+                        stub._active -= 1
+
+                if stub.mode == "fail":
+                    status, out = 503, b'{"error": "loading"}'
+                else:
+                    status, out = 200, json.dumps([{"generated_text": f" re: {body['inputs']} "}]).encode()
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(out)))
+                self.end_headers()
+                self.wfile.write(out)
+
+        return Handler
+
+
+@pytest.fixture
+def stub():
+    fake = StubHF()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), fake.handler())
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    fake.url = f"http://127.0.0.1:{server.server_port}/"
+    yield fake
+    server.shutdown()
+
+
+def test_generate_reuses_pooled_connections(stub):
+    client = HFClient(stub.url, api_key="k")
+
+    assert [client.generate("hi") for _ in range(3)] == ["re: hi"] * 3
+    assert client.stats()["success"] == 3
+
+
+def test_read_timeout_is_separate_from_connect_timeout(stub):
+    stub.delay = 1.0
+    client = HFClient(stub.url, connect_timeout=5.0, read_timeout=0.2)
+
+    started = time.monotonic()
+    assert client.generate("hi") is None
+    assert time.monotonic() - started < 0.9
+    assert client.stats()["failure"] == 1
+
+
+def test_connect_timeout_does_not_wait_for_read_timeout():
+    # Non-routable address: the TCP handshake never completes
+    client = HFClient("http://10.255.255.1/", connect_timeout=0.2, read_timeout=10.0)
+
+    started = time.monotonic()
+    assert client.generate("hi") is None
+    assert time.monotonic() - started < 3.0
+
+
+def test_concurrency_cap_rejects_overflow(stub):
+    stub.delay = 0.5
+    client = HFClient(stub.url, max_concurrency=2, acquire_timeout=0.05, read_timeout=5.0)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.generate("hi"))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert stub.peak <= 2
+    assert results.count(None) == 3
+    assert client.stats()["rejected"] == 3
+
+
+def test_breaker_opens_after_failures_and_short_circuits(stub):
+    stub.mode = "fail"
+    client = HFClient(stub.url, breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60))
+
+    for _ in range(3):
+        assert client.generate("hi") is None
+    assert client.stats()["circuit"] == CircuitBreaker.OPEN
+
+    sent = stub.requests
+    assert client.generate("hi") is None
+    assert stub.requests == sent
+    assert client.stats()["short_circuited"] == 1
+
+
+def test_half_open_trial_closes_breaker(stub):
+    stub.mode = "fail"
+    client = HFClient(stub.url, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=0.2))
+
+    client.generate("hi")
+    client.generate("hi")
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.25)
+    assert client.breaker.state == CircuitBreaker.HALF_OPEN
+
+    stub.mode = "ok"
+    assert client.generate("hi") == "re: hi"
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_half_open_trial_reopens(stub):
+    stub.mode = "fail"
+    client = HFClient(stub.url, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.2))
+
+    client.generate("hi")
+    time.sleep(0.25)
+    client.generate("hi")
+
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+
+def test_hf_reply_returns_canned_fallback(stub, monkeypatch):
+    stub.mode = "fail"
+    monkeypatch.setattr(jeevika, "GENERATOR", HFClient(stub.url, api_key="k"))
+
+    assert jeevika.hf_reply("what should I eat?") == jeevika.FALLBACK_REPLY
+    assert "".join(jeevika.hf_reply_stream("what should I eat?")) == jeevika.FALLBACK_REPLY
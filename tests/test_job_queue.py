@@ -0,0 +1,141 @@
+# SQLite job queue: retries, dead letters, claim tokens, heartbeat
+
+import threading
+import time
+
+import pytest
+
+import jeevika
+from chat_service import FALLBACK_JOB, fallback_job_dead, run_fallback_job
+from hf_client import CircuitBreaker, HFClient
+from job_queue import DEAD, DONE, PENDING, RUNNING, JobQueue
+from models import Message
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.db"), workers=1, max_attempts=2, retry_backoff=0)
+
+
+def test_failure_retries_then_dead_letter_result(queue):
+
+    queue.register("boom", lambda p: 1 / 0, on_dead=lambda p, e: {"gave_up": p["n"], "error": type(e).__name__})
+    job_id = queue.enqueue("boom", {"n": 7})
+
+    queue.run_once()
+    assert queue.get(job_id)["status"] == PENDING
+
+    queue.run_once()
+    job = queue.get(job_id)
+    assert job["status"] == DEAD
+    assert job["result"] == {"gave_up": 7, "error": "ZeroDivisionError"}
+
+
+def test_reclaimed_job_cannot_be_finished_by_the_old_run(queue):
+
+    queue.stale_after = 0
+    runs = []
+
+    def handler(payload):
+        runs.append(len(runs) + 1)
+        run = runs[-1]
+        if run == 1:
+            # A sibling worker boots mid-run, requeues the "stale" job and
+            # finishes it before this run returns
+            queue._requeue_stale()
+            queue.run_once()
+        return {"run": run}
+
+    queue.register("slow", handler)
+    job_id = queue.enqueue("slow", {})
+    queue.run_once()
+
+    job = queue.get(job_id)
+    assert runs == [1, 2]
+    assert job["status"] == DONE
+    assert job["result"] == {"run": 2}
+
+
+def test_reclaimed_job_runs_its_dead_letter_handler_once(queue):
+
+    queue.stale_after = 0
+    queue.max_attempts = 1
+    runs, dead = [], []
+
+    def handler(payload):
+        runs.append(1)
+        if len(runs) == 1:
+            # Reclaimed mid-run; the new run fails and dead-letters first
+            queue._requeue_stale()
+            queue.run_once()
+        raise RuntimeError("model down")
+
+    queue.register("flaky", handler, on_dead=lambda p, e: dead.append(1) or {"answers": len(dead)})
+    job_id = queue.enqueue("flaky", {})
+    queue.run_once()
+
+    job = queue.get(job_id)
+    assert len(runs) == 2
+    assert dead == [1]
+    assert job["status"] == DEAD
+    assert job["result"] == {"answers": 1}
+
+
+def test_queue_file_is_opened_on_first_use(tmp_path):
+
+    path = tmp_path / "lazy.db"
+    queue = JobQueue(str(path))
+    assert not path.exists()
+
+    queue.enqueue("noop", {})
+    assert path.exists()
+
+
+def test_heartbeat_keeps_running_jobs_fresh(queue):
+
+    queue.stale_after = 0.3
+    seen = {}
+
+    def slow(payload):
+        time.sleep(0.5)
+        seen["updated_at"] = queue._conn().execute("SELECT updated_at FROM jobs").fetchone()[0]
+        queue._requeue_stale()
+        seen["status"] = queue._conn().execute("SELECT status FROM jobs").fetchone()[0]
+        return None
+
+    queue.register("slow", slow)
+    queue.enqueue("slow", {})
+    started = time.time()
+
+    threading.Thread(target=queue._heartbeat_loop, daemon=True).start()
+    queue.run_once()
+
+    assert seen["updated_at"] > started
+    assert seen["status"] == RUNNING
+
+
+def test_fallback_job_retries_on_model_failure_and_answers_when_dead(app, user_session, queue, monkeypatch):
+
+    # Breaker already open: every attempt fails fast
+    client = HFClient("http://127.0.0.1:9/", api_key="k", breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60))
+    client.breaker.record_failure()
+    monkeypatch.setattr(jeevika, "GENERATOR", client)
+
+    queue.app = app
+    queue.register(FALLBACK_JOB, run_fallback_job, on_dead=fallback_job_dead)
+
+    user_id, session_id = user_session("ria@example.com")
+    payload = {"user_id": user_id, "session_id": session_id, "message_id": None, "text": "what helps?"}
+    job_id = queue.enqueue(FALLBACK_JOB, payload)
+
+    queue.run_once()
+    assert queue.get(job_id)["status"] == PENDING
+
+    queue.run_once()
+    job = queue.get(job_id)
+    assert job["status"] == DEAD
+    assert job["result"]["reply"] == jeevika.FALLBACK_REPLY
+
+    with app.app_context():
+        replies = Message.query.filter_by(session_id=payload["session_id"], role="bot").all()
+        assert [m.text for m in replies] == [jeevika.FALLBACK_REPLY]
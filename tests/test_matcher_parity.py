@@ -0,0 +1,70 @@
+# Compiled single-pass matcher vs the baseline per-engine phrase loops
+
+import copy
+import random
+
+import pytest
+
+import jeevika
+import sentiment
+from tests import baseline_engine as baseline
+
+FILLER = [
+    "i feel", "today", "my", "and", "very", "with", "pain", "SEVERE", "Sad!",
+    "unhappy", "stressed", "tiredness", "periodic", "", "xx", "I want to DIE",
+    "not sure", "thank you"
+]
+
+
+def _corpus(conversations=300, turns=8, seed=1):
+    rng = random.Random(seed)
+    words = baseline.PHRASES + FILLER
+    return [
+        [" ".join(rng.choice(words) for _ in range(rng.randint(1, 5))) for _ in range(turns)]
+        for _ in range(conversations)
+    ]
+
+
+def _comparable(memory):
+    # Timestamps differ run to run; the symptom order must not
+    memory = copy.deepcopy(memory)
+    memory["symptom_timeline"] = [e["symptom"] for e in memory["symptom_timeline"]]
+    return memory
+
+
+def test_routing_and_memory_match_baseline():
+
+    for conversation in _corpus():
+        old_memory, new_memory = {}, {}
+
+        for text in conversation:
+            polarity = jeevika.sentiment_polarity(text)
+
+            old_reply, old_memory = baseline.rule_response(text, old_memory, polarity)
+            new_reply, new_memory = jeevika._rules(text, new_memory, jeevika.scan(text), polarity)
+
+            assert new_reply == old_reply, text
+            assert _comparable(new_memory) == _comparable(old_memory), text
+
+
+def test_fallback_reply_matches_baseline():
+    # Nothing matched: both hand over to the model (no key -> canned reply)
+    reply, _ = jeevika.get_jeevika_response("what should I eat for breakfast?", {})
+    assert reply == "I’m here with you 🤍 Can you tell me more about what you're experiencing?"
+
+
+def test_emotion_matches_baseline():
+    for conversation in _corpus(conversations=100):
+        for text in conversation:
+            assert jeevika.detect_simple_emotion(text) == baseline.detect_simple_emotion(text), text
+
+
+@pytest.mark.skipif(not sentiment.textblob_available(), reason="textblob not installed")
+def test_polarity_matches_baseline_in_textblob_mode():
+
+    from textblob import TextBlob
+
+    for conversation in _corpus(conversations=50):
+        for text in conversation:
+            expected = round(TextBlob(text).sentiment.polarity, 3)
+            assert round(sentiment.polarity(text, mode="textblob"), 3) == expected, text
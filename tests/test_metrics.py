@@ -0,0 +1,81 @@
+# Cross-process metric snapshots and scrape access
+
+import json
+import os
+
+import metrics
+from metrics import Counter, Registry
+
+
+def _registry(directory):
+    registry = Registry(directory=str(directory))
+    counter = Counter(registry, "jobs_total", "Jobs")
+    return registry, counter
+
+
+def _total(registry):
+    values = registry.collect().get("jobs_total", [])
+    return sum(v for _, v in values)
+
+
+def test_retired_worker_is_folded_into_the_retained_total(tmp_path):
+
+    registry, counter = _registry(tmp_path)
+    counter.inc(3)
+    registry.flush()
+    registry.retire()
+
+    assert sorted(os.listdir(tmp_path)) == ["metrics.lock", "metrics_retired.json"]
+
+    # The next worker starts from zero but the total keeps counting up
+    registry, counter = _registry(tmp_path)
+    counter.inc(2)
+    assert _total(registry) == 5
+
+
+def test_reused_pid_does_not_overwrite_the_dead_workers_numbers(tmp_path):
+
+    # A killed worker with our pid left its file behind
+    with open(tmp_path / f"metrics_{os.getpid()}.json", "w") as f:
+        json.dump({"jobs_total": [[[], 4]]}, f)
+
+    registry, counter = _registry(tmp_path)
+    counter.inc(1)
+
+    assert _total(registry) == 5
+
+
+def test_dead_worker_files_are_folded_on_collect(tmp_path):
+
+    # Far above pid_max: never a live process
+    with open(tmp_path / "metrics_999999999.json", "w") as f:
+        json.dump({"jobs_total": [[[], 7]]}, f)
+
+    registry, _ = _registry(tmp_path)
+
+    assert _total(registry) == 7
+    assert not (tmp_path / "metrics_999999999.json").exists()
+
+
+def test_scrape_endpoints_need_token_or_allowlist(app, monkeypatch):
+
+    client = app.test_client()
+    remote = {"REMOTE_ADDR": "203.0.113.9"}
+
+    assert client.get("/metrics", environ_base=remote).status_code == 403
+    assert client.get("/api/jobs/metrics", environ_base=remote).status_code == 403
+    assert client.get("/health", environ_base=remote).get_json() == {"status": "ok"}
+
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", "s3cret")
+    auth = {"Authorization": "Bearer s3cret"}
+
+    assert client.get("/metrics", environ_base=remote, headers=auth).status_code == 200
+    assert client.get("/api/jobs/metrics", environ_base=remote, headers=auth).status_code == 200
+    assert "hf" in client.get("/health", environ_base=remote, headers=auth).get_json()
+
+    # Loopback is not trusted by default: it may be the reverse proxy
+    assert client.get("/metrics").status_code == 403
+
+    # Deployments can opt in to address-based access
+    monkeypatch.setattr(metrics, "METRICS_ALLOWLIST", {"203.0.113.9"})
+    assert client.get("/metrics", environ_base=remote).status_code == 200
@@ -0,0 +1,27 @@
+# Bounded bcrypt pool: slots follow the job, not the caller
+
+import threading
+
+import pytest
+
+from password_pool import HashingBusy, HashingPool
+
+
+def test_timed_out_job_keeps_its_slot_until_it_finishes():
+
+    pool = HashingPool(workers=1, max_queue=0, timeout=0.05)
+    gate = threading.Event()
+
+    with pytest.raises(HashingBusy, match="timed out"):
+        pool.run(gate.wait)
+
+    # The first hash is still running: no room for another
+    with pytest.raises(HashingBusy, match="full"):
+        pool.run(lambda: None)
+    assert pool.stats()["pending"] == 1
+
+    gate.set()
+    pool._executor.submit(lambda: None).result()
+
+    assert pool.run(lambda: "ok") == "ok"
+    assert pool.stats() == {"workers": 1, "max_queue": 0, "pending": 0, "rejected": 1}
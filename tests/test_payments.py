@@ -0,0 +1,75 @@
+# Checkout verification: only a matched order activates, and only once
+
+import pytest
+import razorpay
+
+from benchmarks.fake_razorpay import sign
+from models import db, User, PaymentOrder
+from payments import CREATED, PAID, activate_subscription
+
+SECRET = "test-secret"
+
+
+@pytest.fixture
+def client(app, monkeypatch):
+    monkeypatch.setitem(app.extensions, "razorpay", razorpay.Client(auth=("rzp_test", SECRET)))
+    return app.test_client()
+
+
+def _user_with_order(app, user_session, email, order_id):
+    user_id, _ = user_session(email)
+    with app.app_context():
+        db.session.add(PaymentOrder(
+            user_id=user_id, receipt=f"r-{order_id}", razorpay_order_id=order_id,
+            amount=9900, status=CREATED
+        ))
+        db.session.commit()
+    return user_id
+
+
+def _verify(client, user_id, order_id, payment_id):
+    with client.session_transaction() as s:
+        s["user_id"] = user_id
+    return client.post("/verify-payment", json={
+        "razorpay_order_id": order_id,
+        "razorpay_payment_id": payment_id,
+        "razorpay_signature": sign(SECRET, f"{order_id}|{payment_id}")
+    })
+
+
+def _user(app, user_id):
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        return user.plan, user.subscription_status, user.subscription_start
+
+
+def test_signed_payment_for_unknown_order_is_rejected(app, user_session, client):
+    user_id = _user_with_order(app, user_session, "nisha@example.com", "order_mine")
+
+    response = _verify(client, user_id, "order_someone_elses", "pay_1")
+
+    assert response.status_code == 400
+    assert _user(app, user_id)[:2] == ("FREE", "INACTIVE")
+
+
+def test_replayed_verification_does_not_restart_the_subscription(app, user_session, client):
+    user_id = _user_with_order(app, user_session, "tara@example.com", "order_tara")
+
+    assert _verify(client, user_id, "order_tara", "pay_2").get_json() == {"success": True}
+    plan, status, started = _user(app, user_id)
+    assert (plan, status) == ("PRO", "ACTIVE")
+
+    assert _verify(client, user_id, "order_tara", "pay_2").status_code == 200
+    assert _user(app, user_id)[2] == started
+
+
+def test_second_activation_of_a_paid_order_is_a_no_op(app, user_session):
+    user_id = _user_with_order(app, user_session, "lina@example.com", "order_lina")
+
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        order = PaymentOrder.query.filter_by(razorpay_order_id="order_lina").one()
+
+        assert activate_subscription(user, "pay_3", order) is True
+        assert order.status == PAID
+        assert activate_subscription(user, "pay_3", order) is False
@@ -0,0 +1,70 @@
+# RuleBook: golden check at boot and on every pack or corpus change
+
+import json
+import os
+import shutil
+
+import pytest
+
+from jeevika import verify_golden
+from rules import DEFAULT_PACK, GOLDEN_CORPUS, RuleBook, RulePackError
+
+
+@pytest.fixture
+def files(tmp_path):
+    pack, golden = tmp_path / "pack.json", tmp_path / "golden.json"
+    shutil.copy(DEFAULT_PACK, pack)
+    shutil.copy(GOLDEN_CORPUS, golden)
+    return pack, golden
+
+
+def _edit(path, change):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    change(data)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+    # Make sure the mtime moves even on coarse filesystem clocks
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def _break_crisis_reply(data):
+    data["cases"][0]["expected"]["reply"] = "something else"
+
+
+def test_boot_refuses_a_pack_that_fails_the_golden_corpus(files):
+    pack, golden = files
+    _edit(golden, _break_crisis_reply)
+
+    with pytest.raises(RulePackError, match="golden"):
+        RuleBook(str(pack), str(golden), verifier=verify_golden)
+
+    # Escape hatch for re-recording the corpus
+    RuleBook(str(pack), str(golden), verifier=verify_golden, verify_at_boot=False)
+
+
+def test_golden_rewrite_rechecks_the_live_pack(files):
+    pack, golden = files
+    book = RuleBook(str(pack), str(golden), check_interval=0)
+
+    checked = []
+    book.verifier = lambda table, cases: checked.append(len(cases)) or []
+
+    book.current()
+    assert checked == []
+
+    _edit(golden, _break_crisis_reply)
+    book.current()
+    assert len(checked) == 1
+
+
+def test_pack_change_that_fails_golden_keeps_the_old_table(files):
+    pack, golden = files
+    book = RuleBook(str(pack), str(golden), check_interval=0, verifier=verify_golden)
+    before = book.current()
+
+    _edit(pack, lambda data: data.update(crisis_words=["never matches anything"]))
+
+    assert book.current() is before
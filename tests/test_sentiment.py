@@ -0,0 +1,57 @@
+# Fast lexicon scorer vs TextBlob on chat text it was not built from
+
+import pytest
+
+import sentiment
+from benchmarks.bench_sentiment import load_chat_corpus
+
+
+def test_common_words_are_scored():
+    assert sentiment.fast_polarity("I love talking to you") > 0.3
+    assert sentiment.fast_polarity("I hate my body") < -0.3
+
+
+def test_emoticons_are_scored():
+    assert sentiment.fast_polarity(":(") == -0.75
+    assert sentiment.fast_polarity("thank you <3") > 0.5
+    assert sentiment.fast_polarity("I am HAPPY :D") == pytest.approx(0.9)
+
+
+@pytest.mark.skipif(not sentiment.textblob_available(), reason="textblob not installed")
+def test_textblob_mode_scores_the_text_as_sent():
+    from textblob import TextBlob
+
+    for text in ["I am HAPPY :D", "so tired :-(", "XD  lol"]:
+        assert sentiment.polarity(text, mode="textblob") == TextBlob(text).sentiment.polarity
+
+
+def test_inline_core_still_scores_without_the_export(tmp_path):
+    missing = str(tmp_path / "missing.json")
+    assert sentiment.load_lexicon(missing) == sentiment.LEXICON
+    assert sentiment.load_emoticons(missing) == sentiment.EMOTICONS
+
+
+def test_contractions_negate():
+    # Deliberate divergence: TextBlob splits "don't" into "do n ' t" and
+    # never sees the negation
+    assert sentiment.fast_polarity("I don't enjoy it") < 0
+
+
+@pytest.mark.skipif(not sentiment.textblob_available(), reason="textblob not installed")
+def test_agrees_with_textblob_on_held_out_chat():
+
+    corpus = load_chat_corpus()
+    agree = sum(
+        abs(sentiment.fast_polarity(t) - sentiment.textblob_polarity(t)) <= 0.01
+        for t in corpus if "n't" not in t
+    )
+
+    assert agree == sum("n't" not in t for t in corpus)
+
+
+@pytest.mark.skipif(not sentiment.textblob_available(), reason="textblob not installed")
+def test_export_matches_shipped_lexicon():
+    # Stale if TextBlob's table moved on: re-run `flask --app app sentiment-lexicon`
+    for word, entry in sentiment.export_lexicon().items():
+        assert list(sentiment.WORDS[word]) == entry, word
+    assert sentiment.export_emoticons() == sentiment.FACES
@@ -0,0 +1,55 @@
+# migrate-timeseries: legacy blob samples land before the real ones
+
+from datetime import datetime, timedelta
+
+from app import create_app, init_db
+from commands import migrate_timeseries
+from models import db, User, HealthData, SentimentSample
+
+
+def _user(email, created_at, first_real):
+
+    user = User(name="Meera", email=email)
+    user.set_password("pw")
+    # The blob was last touched just now, after every real sample
+    user.health = HealthData(
+        sentiment_history=[0.4, -0.6],
+        created_at=created_at,
+        updated_at=datetime.utcnow()
+    )
+    db.session.add(user)
+    db.session.commit()
+
+    db.session.add(SentimentSample(user_id=user.id, polarity=0.9, timestamp=first_real))
+    db.session.commit()
+    return user.id
+
+
+def _legacy(user_id):
+    rows = SentimentSample.query.filter_by(user_id=user_id).order_by(SentimentSample.id).all()
+    return [(row.polarity, row.timestamp) for row in rows[1:]]
+
+
+def test_legacy_samples_are_dated_before_the_first_real_sample(tmp_path):
+
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'migrate.db'}",
+        "SUBSCRIPTION_SWEEP_INTERVAL": 0
+    })
+
+    week_ago = datetime.utcnow() - timedelta(days=7)
+
+    with app.app_context():
+        init_db()
+
+        # Real samples after the record was created: legacy ones take created_at
+        usual = _user("usual@example.com", week_ago, week_ago + timedelta(days=3))
+        # A real sample older than the record: legacy ones go just before it
+        early = _user("early@example.com", week_ago, week_ago - timedelta(days=1))
+
+        assert migrate_timeseries() == {"symptom_event": 0, "sentiment_sample": 4}
+
+        assert _legacy(usual) == [(0.4, week_ago), (-0.6, week_ago)]
+
+        before = week_ago - timedelta(days=1, seconds=1)
+        assert _legacy(early) == [(0.4, before), (-0.6, before)]
@@ -0,0 +1,115 @@
+# =====================================================
+# JEEVIKA – Symptom & Sentiment Time Series
+# Append-only rows • windowed reads • per-day rollups
+# =====================================================
+
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+
+from models import db, SymptomEvent, SentimentSample
+
+# How much history the engine sees each turn (it used to be the blob cap)
+HISTORY_WINDOW = int(os.environ.get("HISTORY_WINDOW", 50))
+
+
+def parse_timestamp(value):
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return datetime.utcnow()
+
+
+# =====================================================
+# ✍️ WRITES (ONE ROW PER EVENT, CALLER COMMITS)
+# =====================================================
+
+def record_turn(user_id, symptom_events, polarity):
+
+    rows = [
+        SymptomEvent(
+            user_id=user_id,
+            symptom=event["symptom"],
+            timestamp=parse_timestamp(event.get("timestamp"))
+        )
+        for event in symptom_events
+    ]
+
+    if polarity is not None:
+        rows.append(SentimentSample(user_id=user_id, polarity=polarity))
+
+    db.session.add_all(rows)
+
+
+# =====================================================
+# 🪟 LAST N (ENGINE MEMORY)
+# =====================================================
+
+def recent_symptom_events(user_id, limit=HISTORY_WINDOW):
+
+    rows = db.session.execute(
+        select(SymptomEvent.symptom, SymptomEvent.timestamp)
+        .where(SymptomEvent.user_id == user_id)
+        .order_by(SymptomEvent.timestamp.desc(), SymptomEvent.id.desc())
+        .limit(limit)
+    ).all()
+
+    return [
+        {"symptom": row.symptom, "timestamp": row.timestamp.isoformat()}
+        for row in reversed(rows)
+    ]
+
+
+def recent_sentiment(user_id, limit=HISTORY_WINDOW):
+
+    rows = db.session.execute(
+        select(SentimentSample.polarity)
+        .where(SentimentSample.user_id == user_id)
+        .order_by(SentimentSample.timestamp.desc(), SentimentSample.id.desc())
+        .limit(limit)
+    ).scalars().all()
+
+    return list(reversed(rows))
+
+
+# =====================================================
+# 📅 PER-DAY ROLLUPS (DASHBOARD)
+# =====================================================
+
+def daily_sentiment(user_id, days=7):
+
+    day = func.date(SentimentSample.timestamp)
+    since = datetime.utcnow() - timedelta(days=days)
+
+    rows = db.session.execute(
+        select(day, func.avg(SentimentSample.polarity), func.count())
+        .where(SentimentSample.user_id == user_id, SentimentSample.timestamp >= since)
+        .group_by(day)
+        .order_by(day)
+    ).all()
+
+    return [
+        {"day": str(d), "average": round(avg, 3), "samples": n}
+        for d, avg, n in rows
+    ]
+
+
+def daily_symptoms(user_id, days=30):
+
+    day = func.date(SymptomEvent.timestamp)
+    since = datetime.utcnow() - timedelta(days=days)
+
+    rows = db.session.execute(
+        select(day, SymptomEvent.symptom, func.count())
+        .where(SymptomEvent.user_id == user_id, SymptomEvent.timestamp >= since)
+        .group_by(day, SymptomEvent.symptom)
+        .order_by(day, SymptomEvent.symptom)
+    ).all()
+
+    return [
+        {"day": str(d), "symptom": symptom, "count": n}
+        for d, symptom, n in rows
+    ]
@@ -0,0 +1,66 @@
+# =====================================================
+# JEEVIKA – Request Scoped User Context
+# User + chat session + health record in one query
+# =====================================================
+
+from flask import g
+from sqlalchemy import select
+
+from models import db, User, ChatSession, HealthData
+
+
+def _fetch(user_id):
+    return db.session.execute(
+        select(User, ChatSession, HealthData)
+        .outerjoin(ChatSession, ChatSession.user_id == User.id)
+        .outerjoin(HealthData, HealthData.user_id == User.id)
+        .where(User.id == user_id)
+        .order_by(ChatSession.id.asc())
+        .limit(1)
+    ).first()
+
+
+# =====================================================
+# 🧱 ONE-TIME ROW CREATION (REGISTER / FIRST LOGIN)
+# =====================================================
+
+def ensure_user_rows(user):
+
+    row = _fetch(user.id)
+    chat_session, health = (row[1], row[2]) if row else (None, None)
+
+    if chat_session is None:
+        chat_session = ChatSession(user_id=user.id)
+        db.session.add(chat_session)
+
+    if health is None:
+        health = HealthData(user_id=user.id)
+        db.session.add(health)
+
+    if db.session.new:
+        db.session.commit()
+
+    return chat_session, health
+
+
+# =====================================================
+# 👩 PER-REQUEST LOADER
+# =====================================================
+
+def load_user_context(user_id):
+
+    if g.get("user_context") is not None:
+        return g.user_context
+
+    row = _fetch(user_id)
+    if row is None:
+        return None
+
+    user, chat_session, health = row
+
+    # Accounts created before rows were made at registration
+    if chat_session is None or health is None:
+        chat_session, health = ensure_user_rows(user)
+
+    g.user_context = (user, chat_session, health)
+    return g.user_context